@@ -27,6 +27,7 @@ Centroid coordinates ``(x, y, z)`` are therefore a **derived view** of
 Parquet file today, but the long‑term design treats them as secondary to
 the ijk‑first representation.
 """
+import copy
 import logging
 import math
 import typing
@@ -38,6 +39,9 @@ import json
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from parq_blockmodel.types import Shape3D, Point, BlockSize
@@ -45,11 +49,14 @@ from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel, creat
 from parq_blockmodel.utils.geometry_utils import angles_to_axes
 from parq_blockmodel.utils.spatial_encoding import (
     DEFAULT_AXIS_BITS,
+    DEFAULT_CURVE,
     ENCODED_X_BITS,
     ENCODED_Y_BITS,
     ENCODED_Z_BITS,
+    ID_ENCODING_CURVES,
     decode_world_coordinates,
     encode_world_coordinates,
+    get_world_id_curve,
     get_world_id_encoding_params,
 )
 from pyarrow.parquet import ParquetFile
@@ -65,6 +72,19 @@ from parq_blockmodel.schema.service import SchemaService
 from parq_blockmodel.schema import utils as schema_utils
 from parq_blockmodel.io.ingest_writer import IngestWriter
 from parq_blockmodel.io import ingest_utils
+from parq_blockmodel.io import read_utils
+from parq_blockmodel.io import metadata_cache
+from parq_blockmodel.io import pbm_dataset
+from parq_blockmodel.io import column_sidecars
+from parq_blockmodel.io import external_sort
+from parq_blockmodel.io.block_bitmap import BlockIdBitmap
+from parq_blockmodel.io.block_index import (
+    BlockIdIndex,
+    file_fingerprint,
+    load_current_index,
+    save_index,
+    sidecar_path,
+)
 
 if typing.TYPE_CHECKING:
     import pyvista as pv  # type: ignore[import]
@@ -90,6 +110,10 @@ class ParquetBlockModel:
       under the ``"parq-blockmodel"`` key, describing a regular
       :class:`parq_blockmodel.geometry.RegularGeometry` grid.
 
+    Large models may instead be stored as a partitioned ``.pbmd`` dataset
+    directory (see :mod:`parq_blockmodel.io.pbm_dataset` and
+    :meth:`to_partitioned`); both layouts are opened transparently.
+
     The geometry is ijk-first: logical indices ``(i, j, k)`` enumerate
     the dense grid, and centroid coordinates ``(x, y, z)`` are derived
     from those indices plus geometry (corner, block size, axis
@@ -115,6 +139,7 @@ class ParquetBlockModel:
     POSITION_COLUMNS = {"block_id", "world_id", "i", "j", "k", "x", "y", "z"}
     INTRINSIC_VOLUME_COLUMN = "volume"
     SPECIAL_COLUMN_ORDER = ["block_id", "world_id", "i", "j", "k", "x", "y", "z"]
+    CLUSTER_ORDERS = ("block_id", "morton", "hilbert", "k_bench")
     PBM_METADATA_KEY = b"parq-blockmodel"
     SPECIAL_COLUMN_DTYPES = {
         "block_id": np.int32,
@@ -126,6 +151,9 @@ class ParquetBlockModel:
         "y": np.float32,
         "z": np.float32,
     }
+    # Persist the block_id row-position index as a ``<name>.pbm.bidx`` sidecar
+    # when this package writes a file. Opening a model never writes it.
+    PERSIST_BLOCK_INDEX = True
 
     def __init__(
         self,
@@ -139,7 +167,7 @@ class ParquetBlockModel:
         Initialize a ParquetBlockModel.
 
         Args:
-            blockmodel_path: Path to the .pbm file.
+            blockmodel_path: Path to the .pbm file or .pbmd dataset directory.
             name: Optional name; defaults to file stem.
             geometry: Optional RegularGeometry; loaded from metadata if not provided.
             schema: Optional pandera DataFrameSchema or path to YAML schema.
@@ -147,27 +175,36 @@ class ParquetBlockModel:
                 for custom lookups/functions. Signature: Callable[[Engine], Engine].
                 Called before applying calculated column operations.
         """
-        if blockmodel_path.suffix != ".pbm":
-            raise ValueError("The provided file must have a '.pbm' extension.")
+        if blockmodel_path.suffix not in (".pbm", pbm_dataset.DATASET_SUFFIX):
+            raise ValueError("The provided file must have a '.pbm' extension (or '.pbmd' for a dataset).")
         self.blockmodel_path = blockmodel_path
         self.name = name or blockmodel_path.stem
-        self.geometry = geometry or RegularGeometry.from_parquet(self.blockmodel_path)
+        # Footer metadata is parsed once per file version and shared across
+        # instances. The mutable parts are shared read-only and only copied on
+        # first access through the public attributes (see ``geometry``).
+        file_metadata = metadata_cache.get_file_metadata(self.blockmodel_path)
+        if geometry is not None:
+            self.geometry = geometry
+        elif file_metadata.geometry is not None:
+            self._geometry, self._geometry_shared = file_metadata.geometry, True
+        else:
+            self.geometry = RegularGeometry.from_parquet(self.blockmodel_path)
+        # The schema (and any policy derived from it) is parsed on first use.
         if schema is not None:
             self.schema = schema_utils.load_schema(schema)
         else:
-            self.schema = schema_utils.load_embedded_schema(self.blockmodel_path)
-        self.compression = (
-            schema_utils.load_embedded_compression(self.blockmodel_path)
-            or schema_utils.extract_schema_compression_policy(self.schema)
-        )
+            self._schema_source = file_metadata
+        self._compression_source = file_metadata
         self._engine_initializer = engine_initializer
-        self.pf: ParquetFile
-        # Lazy view over the backing Parquet file for large models.
-        self.data: LazyParquetDF
+        self.pf: Union[ParquetFile, pbm_dataset.PartitionedParquetFile]
+        # Lazy view over the backing Parquet file for large models, built on
+        # first access of ``data`` (None for datasets).
+        self._data: Optional[LazyParquetDF] = None
+        self._data_available = False
         self.columns: list[str]
         self._centroid_index: Optional[pd.MultiIndex] = None
         self.attributes: list[str]
-        self._refresh_path_bound_state()
+        self._refresh_path_bound_state(file_metadata)
         self._extract_column_dtypes()
         self._logger = logging.getLogger(__name__)
         self._assert_canonical_block_id_invariant()
@@ -178,6 +215,72 @@ class ParquetBlockModel:
                 raise ValueError("The sparse ParquetBlockModel is invalid. "
                                  "Sparse centroids must be a subset of the dense grid.")
 
+    @property
+    def geometry(self) -> RegularGeometry:
+        """Geometry of the model.
+
+        Opened models share the geometry parsed from the footer with the
+        process-wide metadata cache; it is copied on first access, so each
+        instance can mutate its own.
+        """
+        if self._geometry_shared:
+            self._geometry, self._geometry_shared = copy.deepcopy(self._geometry), False
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value: RegularGeometry) -> None:
+        self._geometry, self._geometry_shared = value, False
+
+    @property
+    def _schema(self) -> Optional["DataFrameSchema"]:
+        # Read-only view for internal use: the metadata cache's schema until
+        # the instance takes its own copy.
+        if self._schema_source is not None:
+            return self._schema_source.schema
+        return self._own_schema
+
+    @property
+    def schema(self) -> Optional["DataFrameSchema"]:
+        """Pandera schema of the model, or None; copied from the metadata cache on first access."""
+        if self._schema_source is not None:
+            self._own_schema, self._schema_source = copy.deepcopy(self._schema_source.schema), None
+        return self._own_schema
+
+    @schema.setter
+    def schema(self, value: Optional["DataFrameSchema"]) -> None:
+        self._own_schema, self._schema_source = value, None
+
+    @property
+    def compression(self) -> Optional[dict[str, typing.Any]]:
+        """Active compression policy; copied from the metadata cache on first access."""
+        source = self._compression_source
+        if source is not None:
+            self._compression_source = None
+            self._own_compression = (
+                copy.deepcopy(source.compression)
+                or schema_utils.extract_schema_compression_policy(self._schema)
+            )
+        return self._own_compression
+
+    @compression.setter
+    def compression(self, value: Optional[dict[str, typing.Any]]) -> None:
+        self._own_compression, self._compression_source = value, None
+
+    @property
+    def data(self) -> Optional[LazyParquetDF]:
+        """Lazy view over the backing Parquet file, or None for datasets and models with column families.
+
+        The view reads the file when created, so it is only built on first access.
+        """
+        if self._data is None and self._data_available:
+            self._data = LazyParquetDF(self.blockmodel_path)
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[LazyParquetDF]) -> None:
+        # Assigning None releases the view (e.g. before the file is replaced).
+        self._data, self._data_available = value, value is not None
+
     def configure_engine(self, initializer: typing.Callable) -> None:
         """Register custom lookups and functions with the df-eval Engine.
 
@@ -212,7 +315,7 @@ class ParquetBlockModel:
         if self._schema_service is None:
             self._schema_service = SchemaService(
                 geometry=self.geometry,
-                schema=self.schema,
+                schema=self._schema,
                 engine_initializer=self._engine_initializer,
             )
         return self._schema_service
@@ -222,31 +325,80 @@ class ParquetBlockModel:
         if "block_id" not in self.columns:
             raise ValueError("Canonical .pbm requires a 'block_id' column.")
 
-        dense_count = int(np.prod(self.geometry.local.shape))
-        seen: set[int] = set()
+        # A current sidecar index is only ever written for a file that passed
+        # this check, and is bound to the file fingerprint, so trust it.
+        index = load_current_index(self.blockmodel_path) if self.PERSIST_BLOCK_INDEX else None
+        if index is not None and len(index) == int(self.pf.metadata.num_rows):
+            self._block_index = index
+            return
+
+        fingerprint = file_fingerprint(self.blockmodel_path)
+        dense_count = int(np.prod(self._geometry.local.shape))
+        seen = BlockIdBitmap(dense_count)
         total = 0
+        block_id_batches: list[np.ndarray] = []
         for batch in self._iter_batches(["block_id"]):
             block_ids = np.asarray(batch.column(0), dtype=np.int64)
             if np.any(block_ids < 0) or np.any(block_ids >= dense_count):
                 raise ValueError("Canonical .pbm has block_id values outside geometry bounds.")
-            if np.unique(block_ids).size != block_ids.size:
-                raise ValueError("Canonical .pbm requires unique block_id values.")
-            seen_before = len(seen)
-            seen.update(block_ids.tolist())
-            if len(seen) - seen_before != block_ids.size:
+            if not seen.add(block_ids):
                 raise ValueError("Canonical .pbm requires unique block_id values.")
             total += int(block_ids.size)
+            block_id_batches.append(block_ids)
 
         if total != int(self.pf.metadata.num_rows):
             raise ValueError("Canonical .pbm block_id validation could not cover all rows.")
 
+        row_block_ids = np.concatenate(block_id_batches) if block_id_batches else np.empty(0, dtype=np.int64)
+        self._block_index = BlockIdIndex.from_row_block_ids(row_block_ids, fingerprint)
+
+    @property
+    def block_index(self) -> BlockIdIndex:
+        """Sorted ``block_id`` to row-position index for the backing file.
+
+        The index is loaded from the ``<name>.pbm.bidx`` sidecar when its
+        fingerprint matches the file, and otherwise rebuilt in memory from
+        the ``block_id`` column. The sidecar is only written when this
+        package writes the file (when :attr:`PERSIST_BLOCK_INDEX` is set), so
+        reads have no filesystem side effects. Use it to align rows with
+        positions, or look up rows with
+        :meth:`~parq_blockmodel.io.block_index.BlockIdIndex.lookup`, without
+        rescanning positional columns.
+        """
+        if self._block_index is not None and self._block_index.is_current(self.blockmodel_path):
+            return self._block_index
+
+        index = load_current_index(self.blockmodel_path) if self.PERSIST_BLOCK_INDEX else None
+        if index is None:
+            fingerprint = file_fingerprint(self.blockmodel_path)
+            block_id_batches = list(self._iter_block_ids())
+            row_block_ids = (
+                np.concatenate(block_id_batches) if block_id_batches else np.empty(0, dtype=np.uint32)
+            )
+            self._block_index = BlockIdIndex.from_row_block_ids(row_block_ids, fingerprint)
+        else:
+            self._block_index = index
+        return self._block_index
+
+    def _persist_block_index(self) -> None:
+        """Write the block index sidecar of a file this package has just written."""
+        if self.PERSIST_BLOCK_INDEX and load_current_index(self.blockmodel_path) is None:
+            save_index(self.block_index, self.blockmodel_path)
+
+    @classmethod
+    def _from_written_file(cls, blockmodel_path: Path, **kwargs: typing.Any) -> "ParquetBlockModel":
+        """Open a model just written by an ingest path and persist its block index."""
+        pbm = cls(blockmodel_path=blockmodel_path, **kwargs)
+        pbm._persist_block_index()
+        return pbm
+
     def __repr__(self):
         return f"ParquetBlockModel(name={self.name}, path={self.blockmodel_path})"
 
     def _extract_column_dtypes(self):
         self.column_dtypes: dict[str, np.dtype] = {}
         self._column_categorical_ordered: dict[str, bool] = {}
-        schema = pq.read_schema(self.blockmodel_path)
+        schema = self.pf.schema_arrow
         for col in self.columns:
             if col in ["x", "y", "z"]:
                 continue
@@ -257,13 +409,89 @@ class ParquetBlockModel:
             else:
                 self.column_dtypes[col] = field_type.to_pandas_dtype()
 
-    def _refresh_path_bound_state(self) -> None:
-        """Refresh cached state that depends on the backing Parquet file."""
-        self.pf = ParquetFile(self.blockmodel_path)
-        self.data = LazyParquetDF(self.blockmodel_path)
-        self.columns = pq.read_schema(self.blockmodel_path).names
+    def _refresh_path_bound_state(
+        self, file_metadata: Optional[metadata_cache.PbmFileMetadata] = None
+    ) -> None:
+        """Refresh cached state that depends on the backing Parquet file.
+
+        Without ``file_metadata`` the file is assumed to have just been
+        (re)written by this package, so its cached footer metadata is dropped
+        and re-read, and its block index sidecar is persisted.
+        """
+        written = file_metadata is None
+        if file_metadata is None:
+            metadata_cache.invalidate(self.blockmodel_path)
+            file_metadata = metadata_cache.get_file_metadata(self.blockmodel_path)
+        self.pf = pbm_dataset.open_parquet_file(self.blockmodel_path, metadata=file_metadata.parquet_metadata)
+        if file_metadata.sidecars is not None:
+            self.pf = column_sidecars.SidecarParquetFile(
+                self.pf, self.blockmodel_path, file_metadata.sidecars, schema_arrow=file_metadata.schema_arrow
+            )
+        # The lazy view only covers a single file, so it is unavailable for
+        # datasets and while column-family sidecars are attached.
+        self._data = None
+        self._data_available = not self.is_partitioned and file_metadata.sidecars is None
+        self.columns = file_metadata.schema_arrow.names
         self.attributes = [col for col in self.columns if col not in self.POSITION_COLUMNS]
         self._centroid_index = None
+        self._block_index: Optional[BlockIdIndex] = None
+        if written:
+            self._persist_block_index()
+
+    @property
+    def sort_order(self) -> Optional[dict[str, typing.Any]]:
+        """Row order recorded by :meth:`recluster`, or None when the order is unknown.
+
+        ``{"order": ..., "columns": [...]}``; ``columns`` lists the persisted
+        columns whose values are monotone (lexicographically) in file order,
+        within each partition for ``.pbmd`` datasets.
+        """
+        return copy.deepcopy(metadata_cache.get_file_metadata(self.blockmodel_path).sort_order)
+
+    @property
+    def is_partitioned(self) -> bool:
+        """True when the model is backed by a partitioned ``.pbmd`` dataset."""
+        return pbm_dataset.is_dataset_path(self.blockmodel_path)
+
+    def _dataset(self) -> ds.Dataset:
+        """Return a :mod:`pyarrow.dataset` view of the backing file or partitions."""
+        if self.is_partitioned:
+            return pbm_dataset.open_dataset(
+                self.blockmodel_path, metadata=metadata_cache.get_file_metadata(self.blockmodel_path).parquet_metadata
+            )
+        return ds.dataset(self.blockmodel_path, format="parquet")
+
+    def _read_table(
+        self,
+        columns: Optional[list[str]] = None,
+        filter_expression: Optional[pc.Expression] = None,
+    ) -> pa.Table:
+        """Read persisted columns in row order; datasets prune partitions by ``filter_expression``."""
+        if self.is_partitioned:
+            return self._dataset().to_table(columns=columns, filter=filter_expression)
+        sidecars = metadata_cache.get_file_metadata(self.blockmodel_path).sidecars
+        if sidecars is None:
+            return pq.read_table(self.blockmodel_path, columns=columns, filters=filter_expression)
+
+        pf = self._open_parquet_file()
+        if filter_expression is None:
+            return pf.read(columns=columns)
+        names = list(columns) if columns is not None else list(self.columns)
+        tables = list(pf.iter_filtered(filter_expression, columns=names))
+        return pa.concat_tables(tables) if tables else pf.schema_arrow.empty_table().select(names)
+
+    def _open_parquet_file(self) -> typing.Any:
+        """Open a fresh ParquetFile-like reader over the backing file, dataset or families."""
+        file_metadata = metadata_cache.get_file_metadata(self.blockmodel_path)
+        pf = pbm_dataset.open_parquet_file(self.blockmodel_path, metadata=file_metadata.parquet_metadata)
+        if file_metadata.sidecars is not None:
+            pf = column_sidecars.SidecarParquetFile(
+                pf, self.blockmodel_path, file_metadata.sidecars, schema_arrow=file_metadata.schema_arrow
+            )
+        return pf
+
+    def _dataset_write_kwargs(self, policy: dict[str, typing.Any]) -> typing.Callable[[list[str]], dict[str, typing.Any]]:
+        return lambda names: schema_utils.build_parquet_compression_kwargs(names, policy)
 
     @property
     def column_categorical_ordered(self) -> dict[str, bool]:
@@ -589,7 +817,7 @@ class ParquetBlockModel:
             raise ValueError("sample_chunks must be >= 0")
 
         if schema is None:
-            active_schema = self.schema
+            active_schema = self._schema
         else:
             active_schema = self._load_schema(schema)
         if active_schema is None:
@@ -613,23 +841,85 @@ class ParquetBlockModel:
         dataframe: pd.DataFrame,
         *,
         compression_policy: Optional[dict[str, typing.Any]] = None,
+        batch_size: int = 1_000_000,
+        row_group_size: Optional[int] = None,
     ) -> None:
-        dataframe = dataframe[self._ordered_columns(list(dataframe.columns))]
-        dataframe = self._coerce_special_column_dtypes(dataframe)
-        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        """Replace the backing file with ``dataframe``.
+
+        The frame is reordered, coerced, converted and written ``batch_size``
+        rows at a time, so peak overhead is one batch rather than a copy of
+        the frame. Row groups hold at most ``row_group_size`` rows (default
+        ``batch_size``). The file is replaced atomically once complete; if
+        the write fails the model stays bound to the previous file.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        if row_group_size is not None and row_group_size <= 0:
+            raise ValueError("row_group_size must be > 0")
+        row_group_size = row_group_size or batch_size
+        order = self._ordered_columns(list(dataframe.columns))
+        # Infer types from the whole frame so that every slice converts to the
+        # same schema (for example an object column that is all-null in one
+        # slice); the special columns take their coerced types.
+        inferred = pa.Schema.from_pandas(dataframe, preserve_index=False)
+        fields = [
+            inferred.field(col).with_type(pa.from_numpy_dtype(self.SPECIAL_COLUMN_DTYPES[col]))
+            if col in self.SPECIAL_COLUMN_DTYPES
+            else inferred.field(col)
+            for col in order
+        ]
+        # The pandas metadata comes from an empty slice laid out like the batches.
+        empty = self._coerce_special_column_dtypes(dataframe.iloc[:0][order].copy())
+        arrow_schema = pa.Table.from_pandas(empty, schema=pa.schema(fields), preserve_index=False).schema
         active_policy = compression_policy or schema_utils.resolve_active_compression_policy("fast")
         meta = self._build_schema_metadata(
             geometry=self.geometry,
-            schema=self.schema,
-            base_metadata=dict(table.schema.metadata or {}),
+            schema=self._schema,
+            base_metadata=dict(arrow_schema.metadata or {}),
             compression=active_policy,
         )
-        table = table.replace_schema_metadata(meta)
-        pq.write_table(
-            table,
-            self.blockmodel_path,
-            **schema_utils.build_parquet_compression_kwargs(table.column_names, active_policy),
-        )
+        arrow_schema = arrow_schema.with_metadata(meta)
+
+        def tables() -> Iterator[pa.Table]:
+            for start in range(0, len(dataframe), batch_size):
+                chunk = self._coerce_special_column_dtypes(dataframe.iloc[start:start + batch_size][order].copy())
+                yield pa.Table.from_pandas(chunk, schema=arrow_schema, preserve_index=False)
+
+        self.pf = None  # type: ignore[assignment]
+        self.data = None  # type: ignore[assignment]
+        try:
+            if self.is_partitioned:
+                manifest = pbm_dataset.read_manifest(self.blockmodel_path)
+                pbm_dataset.write_dataset(
+                    self.blockmodel_path,
+                    tables(),
+                    geometry=self.geometry,
+                    partition_by=manifest.partition_by,
+                    partition_size=manifest.partition_size,
+                    schema_metadata=meta,
+                    compression_kwargs=self._dataset_write_kwargs(active_policy),
+                    metadata_payload=schema_utils.decode_embedded_metadata(meta),
+                    schema=arrow_schema,
+                    row_group_size=row_group_size,
+                )
+            else:
+                with atomic_output_file(self.blockmodel_path) as tmp_path:
+                    writer = pq.ParquetWriter(
+                        tmp_path,
+                        arrow_schema,
+                        **schema_utils.build_parquet_compression_kwargs(arrow_schema.names, active_policy),
+                    )
+                    try:
+                        for table in tables():
+                            writer.write_table(table, row_group_size=row_group_size)
+                    finally:
+                        writer.close()
+                column_sidecars.remove_sidecars(self.blockmodel_path)
+        except Exception:
+            # The previous file (or dataset) is still in place; rebind to it.
+            if self.blockmodel_path.exists():
+                self._refresh_path_bound_state(metadata_cache.get_file_metadata(self.blockmodel_path))
+            raise
 
         self._refresh_path_bound_state()
         self._extract_column_dtypes()
@@ -637,7 +927,7 @@ class ParquetBlockModel:
 
     def recompute_spatial(self) -> None:
         """Recompute and persist canonical spatial columns (x, y, z, i, j, k)."""
-        df = pq.read_table(self.blockmodel_path).to_pandas()
+        df = self._read_table().to_pandas()
         if "block_id" in df.columns:
             block_ids = df["block_id"].to_numpy(dtype=np.uint32)
         elif {"i", "j", "k"}.issubset(df.columns):
@@ -670,22 +960,36 @@ class ParquetBlockModel:
         if not {"x", "y", "z", "i", "j", "k"}.issubset(self.columns):
             self.recompute_spatial()
 
-    def recompute_world_id(self) -> None:
-        """Recompute and persist world_id from current spatial columns and encoding metadata."""
-        df = pq.read_table(self.blockmodel_path).to_pandas()
+    def recompute_world_id(self, curve: Optional[str] = None) -> None:
+        """Recompute and persist world_id from current spatial columns and encoding metadata.
+
+        Args:
+            curve: Optional space-filling curve (``"morton"`` or ``"hilbert"``) to switch the
+                encoding to. Offset, scale and axis bits are kept; ``None`` keeps the current curve.
+        """
+        df = self._read_table().to_pandas()
         if not {"x", "y", "z"}.issubset(df.columns):
             self.recompute_spatial()
-            df = pq.read_table(self.blockmodel_path).to_pandas()
+            df = self._read_table().to_pandas()
 
         x = df["x"].to_numpy(dtype=float)
         y = df["y"].to_numpy(dtype=float)
         z = df["z"].to_numpy(dtype=float)
         if self.geometry.world_id_encoding is None:
-            self.geometry.world_id_encoding = self._build_world_id_encoding_from_xyz(x, y, z)
+            self.geometry.world_id_encoding = ingest_utils.build_world_id_encoding_from_xyz(
+                x, y, z, curve=curve or DEFAULT_CURVE
+            )
+        elif curve is not None and curve != get_world_id_curve(self.geometry.world_id_encoding):
+            if curve not in ID_ENCODING_CURVES:
+                raise ValueError(f"Unsupported curve {curve!r}; expected one of {sorted(ID_ENCODING_CURVES)}.")
+            encoding = copy.deepcopy(self.geometry.world_id_encoding)
+            encoding.setdefault("encoding", {})["type"] = ID_ENCODING_CURVES[curve]
+            self.geometry.world_id_encoding = encoding
 
         offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
+        curve = get_world_id_curve(self.geometry.world_id_encoding)
         df["world_id"] = encode_world_coordinates(
-            x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis
+            x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
         ).astype(np.int64)
         self._persist_dataframe(df, compression_policy=self.compression)
 
@@ -705,7 +1009,7 @@ class ParquetBlockModel:
         if not cols:
             return True
 
-        df = pq.read_table(self.blockmodel_path, columns=cols).to_pandas()
+        df = self._read_table(columns=cols).to_pandas()
         if sample_size > 0 and len(df) > sample_size:
             df = df.sample(n=sample_size, random_state=0)
 
@@ -731,6 +1035,7 @@ class ParquetBlockModel:
             if self.geometry.world_id_encoding is None:
                 return False
             offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
+            curve = get_world_id_curve(self.geometry.world_id_encoding)
             expected = encode_world_coordinates(
                 df["x"].to_numpy(dtype=float),
                 df["y"].to_numpy(dtype=float),
@@ -738,6 +1043,7 @@ class ParquetBlockModel:
                 offset=offset,
                 scale=scale,
                 bits_per_axis=bits_per_axis,
+                curve=curve,
             ).astype(np.int64)
             if not np.array_equal(df["world_id"].to_numpy(dtype=np.int64), expected):
                 return False
@@ -780,7 +1086,7 @@ class ParquetBlockModel:
         if self._centroid_index is None:
             centroid_cols = ["x", "y", "z"]
             if all(col in self.columns for col in centroid_cols):
-                centroids: pd.DataFrame = pq.read_table(self.blockmodel_path, columns=centroid_cols).to_pandas()
+                centroids: pd.DataFrame = self._read_table(columns=centroid_cols).to_pandas()
                 if centroids.index.names == centroid_cols:
                     index = centroids.index
                 else:
@@ -803,7 +1109,7 @@ class ParquetBlockModel:
 
     @property
     def is_sparse(self) -> bool:
-        dense_count = int(np.prod(self.geometry.local.shape))
+        dense_count = int(np.prod(self._geometry.local.shape))
         return int(self.pf.metadata.num_rows) < dense_count
 
     @property
@@ -812,20 +1118,32 @@ class ParquetBlockModel:
         return 1.0 - (int(self.pf.metadata.num_rows) / dense_count)
 
     def validate_sparse(self) -> bool:
-        dense_count = int(np.prod(self.geometry.local.shape))
-        seen: set[int] = set()
-        total = 0
-        for block_ids in self._iter_block_ids():
-            total += len(block_ids)
-            if np.any(block_ids < 0) or np.any(block_ids >= dense_count):
-                return False
-            seen.update(block_ids.tolist())
-        return len(seen) == total
+        dense_count = int(np.prod(self._geometry.local.shape))
+        index = self.block_index
+        if not len(index):
+            return True
+        if int(index.block_ids[0]) < 0 or int(index.block_ids[-1]) >= dense_count:
+            return False
+        return index.is_unique
 
-    def _iter_batches(self, columns: list[str], batch_size: int = 1_000_000) -> Iterator[pa.RecordBatch]:
-        pf = pq.ParquetFile(self.blockmodel_path)
-        for batch in pf.iter_batches(columns=columns, batch_size=batch_size):
-            yield batch
+    def _iter_batches(
+        self,
+        columns: list[str],
+        batch_size: int = 1_000_000,
+        filter_expression: Optional[pc.Expression] = None,
+        prefetch: int = 0,
+    ) -> Iterator[pa.RecordBatch]:
+        if filter_expression is not None and metadata_cache.get_file_metadata(self.blockmodel_path).sidecars:
+            batches = (
+                batch
+                for table in self._open_parquet_file().iter_filtered(filter_expression, columns=columns)
+                for batch in table.to_batches(max_chunksize=batch_size)
+            )
+        elif filter_expression is not None:
+            batches = self._dataset().to_batches(columns=columns, filter=filter_expression, batch_size=batch_size)
+        else:
+            batches = self._open_parquet_file().iter_batches(columns=columns, batch_size=batch_size)
+        yield from read_utils.prefetch_iter(batches, prefetch)
 
     def _iter_block_ids(self, batch_size: int = 1_000_000) -> Iterator[np.ndarray]:
         cols = set(self.columns)
@@ -839,9 +1157,12 @@ class ParquetBlockModel:
             if not self.geometry.world_id_encoding:
                 raise ValueError("world_id column present but metadata has no world_id_encoding payload.")
             offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
+            curve = get_world_id_curve(self.geometry.world_id_encoding)
             for batch in self._iter_batches(["world_id"], batch_size=batch_size):
                 world_ids = np.asarray(batch.column(0), dtype=np.int64)
-                x, y, z = decode_world_coordinates(world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis)
+                x, y, z = decode_world_coordinates(
+                    world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
+                )
                 yield self.geometry.row_index_from_xyz(x, y, z).astype(np.uint32)
             return
 
@@ -885,6 +1206,8 @@ class ParquetBlockModel:
         schema: Optional[Union[Path, "DataFrameSchema"]] = None,
         engine_initializer: Optional[typing.Callable] = None,
         compression: typing.Any = "fast",
+        prefetch: int = 0,
+        workers: int = 1,
     ) -> "ParquetBlockModel":
         """Create a :class:`ParquetBlockModel` from a source Parquet file.
 
@@ -921,6 +1244,10 @@ class ParquetBlockModel:
                 :class:`~pandera.DataFrameSchema` object or a :class:`~pathlib.Path` to
                 a YAML schema file.  When provided the schema is also stored on the
                 resulting instance (``self.schema``).
+            prefetch (int, default 0): Number of source batches to decode ahead on a
+                background thread during the canonical write. ``0`` disables read-ahead.
+            workers (int, default 1): Number of threads transforming batches concurrently
+                during the canonical write. Batches are still written in source order.
 
         Returns:
             ParquetBlockModel: A block model backed by a newly written ``.pbm`` file
@@ -937,9 +1264,24 @@ class ParquetBlockModel:
                                                 axis_azimuth=axis_azimuth,
                                                 axis_dip=axis_dip,
                                                 axis_plunge=axis_plunge,
-                                                chunk_size=chunk_size)
+                                                chunk_size=chunk_size,
+                                                use_statistics=True)
 
-        ingest_utils.validate_geometry(parquet_path, geometry=geometry, chunk_size=chunk_size)
+        try:
+            ingest_utils.validate_geometry(parquet_path, geometry=geometry, chunk_size=chunk_size)
+        except ValueError:
+            # A statistics-based estimate can overshoot the spacing when its row
+            # sample lacks adjacent centroids; retry once with the exact scan.
+            exact = RegularGeometry.from_parquet(filepath=parquet_path,
+                                                 axis_azimuth=axis_azimuth,
+                                                 axis_dip=axis_dip,
+                                                 axis_plunge=axis_plunge,
+                                                 chunk_size=chunk_size,
+                                                 use_statistics=False)
+            if exact.to_metadata_dict() == geometry.to_metadata_dict():
+                raise
+            geometry = exact
+            ingest_utils.validate_geometry(parquet_path, geometry=geometry, chunk_size=chunk_size)
 
         loaded_schema = cls._load_schema(schema) if schema is not None else None
 
@@ -956,7 +1298,7 @@ class ParquetBlockModel:
             engine_initializer=engine_initializer,
             compression=compression,
         )
-        writer.write(columns=columns, chunk_size=chunk_size)
+        writer.write(columns=columns, chunk_size=chunk_size, prefetch=prefetch, workers=workers)
         
         pbm = cls(
             blockmodel_path=new_filepath,
@@ -967,6 +1309,108 @@ class ParquetBlockModel:
         pbm._refresh_path_bound_state()
         return pbm
 
+    @classmethod
+    def from_parquet_files(
+        cls,
+        sources: Union[str, Path, typing.Sequence[Union[str, Path]]],
+        filename: Path,
+        geometry: Optional[RegularGeometry] = None,
+        name: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+        overwrite: bool = False,
+        axis_azimuth: float = 0.0,
+        axis_dip: float = 0.0,
+        axis_plunge: float = 0.0,
+        chunk_size: int = 1_000_000,
+        schema: Optional[Union[Path, "DataFrameSchema"]] = None,
+        engine_initializer: Optional[typing.Callable] = None,
+        compression: typing.Any = "fast",
+        prefetch: int = 0,
+        workers: int = 1,
+    ) -> "ParquetBlockModel":
+        """Create a :class:`ParquetBlockModel` from several source Parquet files.
+
+        Typical sources are per-domain or per-bench exports of one model. The
+        files are streamed, in order, into a single canonical ``.pbm`` file
+        without loading them into memory together. Columns are unified across
+        files; a column missing from a file is null for its rows.
+
+        Args:
+            sources (str, Path or sequence): A glob pattern such as
+                ``"exports/*.parquet"``, a directory of ``.parquet`` files, or a
+                sequence of files.
+            filename (Path): Output path; the suffix is replaced by ``.pbm``.
+            geometry (RegularGeometry, optional): Geometry of the combined grid.
+                If omitted, the union geometry is inferred with
+                :meth:`RegularGeometry.from_parquet_files`, from the per-file
+                column statistics where possible.
+            name (str, optional): Optional name for the resulting model.
+            columns (list[str], optional): Optional subset of columns to copy.
+            overwrite (bool, default False): If True, allows overwriting an existing
+                ``.pbm`` file at the target location.
+            axis_azimuth (float, default 0.0): Optional rotation angle used when
+                inferring geometry. See :meth:`from_parquet`.
+            axis_dip (float, default 0.0): Optional rotation angle. See ``axis_azimuth``.
+            axis_plunge (float, default 0.0): Optional rotation angle. See ``axis_azimuth``.
+            chunk_size (int, default 1_000_000): Batch size for reading Parquet data.
+            schema (DataFrameSchema or Path, optional): Optional pandera schema used
+                to validate and coerce each chunk. See :meth:`from_parquet`.
+            prefetch (int, default 0): Number of batches to read ahead on a
+                background thread during the canonical write.
+            workers (int, default 1): Number of threads decoding source row groups,
+                and transforming batches, concurrently.
+
+        Returns:
+            ParquetBlockModel: A block model backed by the newly written ``.pbm`` file.
+
+        Raises:
+            ValueError: If no sources are found, if centroids do not lie on the
+                geometry, or if a block_id occurs more than once across all files.
+            FileExistsError: If the output exists and ``overwrite`` is False.
+        """
+        paths = ingest_utils.resolve_source_paths(sources)
+        pbm_path = Path(filename).with_suffix(".pbm")
+        if pbm_path.resolve() in {path.resolve() for path in paths}:
+            raise ValueError(f"Output {pbm_path} must not be one of the source files.")
+        if pbm_path.exists() and not overwrite:
+            raise FileExistsError(f"File {pbm_path} already exists. Use overwrite=True to allow mutation.")
+
+        loaded_schema = cls._load_schema(schema) if schema is not None else None
+
+        def ingest(ingest_geometry: RegularGeometry) -> None:
+            IngestWriter(
+                input_path=paths,
+                output_path=pbm_path,
+                geometry=ingest_geometry,
+                schema=loaded_schema,
+                engine_initializer=engine_initializer,
+                compression=compression,
+            ).write(columns=columns, chunk_size=chunk_size, prefetch=prefetch, workers=workers)
+
+        infer_kwargs = dict(axis_azimuth=axis_azimuth, axis_dip=axis_dip,
+                            axis_plunge=axis_plunge, chunk_size=chunk_size)
+        if geometry is not None:
+            ingest(geometry)
+        else:
+            geometry = RegularGeometry.from_parquet_files(paths, use_statistics=True, **infer_kwargs)
+            try:
+                ingest(geometry)
+            except ValueError:
+                # As in from_parquet: retry once if a statistics-based estimate was wrong.
+                exact = RegularGeometry.from_parquet_files(paths, use_statistics=False, **infer_kwargs)
+                if exact.to_metadata_dict() == geometry.to_metadata_dict():
+                    raise
+                geometry = exact
+                ingest(geometry)
+
+        return cls._from_written_file(
+            blockmodel_path=pbm_path,
+            name=name,
+            geometry=geometry,
+            schema=loaded_schema,
+            engine_initializer=engine_initializer,
+        )
+
     @classmethod
     def from_dataframe(
         cls,
@@ -1069,7 +1513,7 @@ class ParquetBlockModel:
         # Validate geometry
         ingest_utils.validate_geometry(pbm_path, geometry, chunk_size=chunk_size)
 
-        return cls(
+        return cls._from_written_file(
             blockmodel_path=pbm_path,
             name=name,
             geometry=geometry,
@@ -1092,12 +1536,23 @@ class ParquetBlockModel:
         schema: Optional[Union[Path, "DataFrameSchema"]] = None,
         engine_initializer: Optional[typing.Callable] = None,
         compression: typing.Any = "fast",
+        column_types: Optional[dict[str, pa.DataType]] = None,
+        delimiter: str = ",",
+        prefetch: int = 0,
+        workers: int = 1,
         **read_csv_kwargs: typing.Any,
     ) -> "ParquetBlockModel":
         """Create a :class:`ParquetBlockModel` from a CSV file.
 
-        The CSV is loaded into memory, indexed by ``["x", "y", "z"]``, and
-        then delegated to :meth:`from_dataframe`.
+        The CSV is streamed with :func:`pyarrow.csv.open_csv` in
+        ``chunk_size`` row batches, so memory use does not grow with the file
+        size. Unless ``geometry`` is supplied, a first pass over the ``x``,
+        ``y``, ``z`` columns infers it; a second pass writes the canonical
+        ``.pbm`` file through :class:`~parq_blockmodel.io.IngestWriter`.
+
+        If any ``read_csv_kwargs`` are given, the CSV is instead loaded into
+        memory with :func:`pandas.read_csv`, indexed by ``["x", "y", "z"]``
+        and delegated to :meth:`from_dataframe`.
 
         Args:
             csv_path (Path): Path to an input ``.csv`` file containing ``x``,
@@ -1105,12 +1560,41 @@ class ParquetBlockModel:
             filename (Path, optional): Path to the *source* ``.parquet`` file
                 used to derive the sibling ``.pbm`` output path. Defaults to
                 ``csv_path`` with suffix changed to ``.parquet``.
+            column_types (dict[str, pyarrow.DataType], optional): Explicit types
+                for attribute columns. Types not given are inferred from the
+                first block of the file; positional columns always use fixed
+                types.
+            delimiter (str, default ","): Field delimiter.
+            prefetch (int, default 0): Number of CSV batches to parse ahead on a
+                background thread during the canonical write.
+            workers (int, default 1): Number of threads transforming batches
+                concurrently during the canonical write.
             **read_csv_kwargs: Additional keyword arguments passed to
-                :func:`pandas.read_csv`.
+                :func:`pandas.read_csv`. Selects the in-memory path.
         """
         if csv_path.suffix.lower() != ".csv":
             raise ValueError(f"Filename {csv_path} must have a '.csv' extension.")
 
+        if not read_csv_kwargs:
+            return cls._from_csv_streaming(
+                csv_path,
+                filename=filename,
+                geometry=geometry,
+                name=name,
+                overwrite=overwrite,
+                axis_azimuth=axis_azimuth,
+                axis_dip=axis_dip,
+                axis_plunge=axis_plunge,
+                chunk_size=chunk_size,
+                schema=schema,
+                engine_initializer=engine_initializer,
+                compression=compression,
+                column_types=column_types,
+                parse_options=pacsv.ParseOptions(delimiter=delimiter),
+                prefetch=prefetch,
+                workers=workers,
+            )
+
         dataframe = pd.read_csv(csv_path, **read_csv_kwargs)
         missing_columns = {"x", "y", "z"} - set(dataframe.columns)
         if missing_columns:
@@ -1137,6 +1621,76 @@ class ParquetBlockModel:
             compression=compression,
         )
 
+    @classmethod
+    def _from_csv_streaming(
+        cls,
+        csv_path: Path,
+        filename: Optional[Path],
+        geometry: Optional[RegularGeometry],
+        name: Optional[str],
+        overwrite: bool,
+        axis_azimuth: float,
+        axis_dip: float,
+        axis_plunge: float,
+        chunk_size: int,
+        schema: Optional[Union[Path, "DataFrameSchema"]],
+        engine_initializer: Optional[typing.Callable],
+        compression: typing.Any,
+        column_types: Optional[dict[str, pa.DataType]],
+        parse_options: pacsv.ParseOptions,
+        prefetch: int,
+        workers: int,
+    ) -> "ParquetBlockModel":
+        """Stream a CSV file into a ``.pbm`` file; see :meth:`from_csv`."""
+        parquet_filename = filename if filename is not None else csv_path.with_suffix(".parquet")
+        pbm_path = parquet_filename.with_suffix(".pbm")
+        if pbm_path.exists() and not overwrite:
+            raise FileExistsError(f"File {pbm_path} already exists. Use overwrite=True to allow mutation.")
+
+        missing_columns = {"x", "y", "z"} - set(ingest_utils.csv_column_names(csv_path, parse_options))
+        if missing_columns:
+            missing_columns_str = ", ".join(sorted(missing_columns))
+            raise ValueError(
+                f"CSV file {csv_path} is missing required columns: {missing_columns_str}."
+            )
+
+        if geometry is None:
+            xyz_batches = (
+                (batch.column(0), batch.column(1), batch.column(2))
+                for batch in ingest_utils.iter_csv_batches(
+                    csv_path, columns=["x", "y", "z"], batch_size=chunk_size, parse_options=parse_options
+                )
+            )
+            geometry = RegularGeometry.from_centroid_batches(
+                xyz_batches, axis_azimuth=axis_azimuth, axis_dip=axis_dip, axis_plunge=axis_plunge
+            )
+        if not isinstance(geometry, RegularGeometry):
+            raise TypeError("geometry must be a RegularGeometry instance.")
+
+        loaded_schema = cls._load_schema(schema) if schema is not None else None
+
+        writer = IngestWriter(
+            input_path=csv_path,
+            output_path=pbm_path,
+            geometry=geometry,
+            schema=loaded_schema,
+            engine_initializer=engine_initializer,
+            compression=compression,
+            csv_column_types=column_types,
+            csv_parse_options=parse_options,
+        )
+        writer.write(chunk_size=chunk_size, prefetch=prefetch, workers=workers)
+
+        ingest_utils.validate_geometry(pbm_path, geometry, chunk_size=chunk_size)
+
+        return cls._from_written_file(
+            blockmodel_path=pbm_path,
+            name=name,
+            geometry=geometry,
+            schema=loaded_schema,
+            engine_initializer=engine_initializer,
+        )
+
     @classmethod
     def create_demo_block_model(cls, filename: Path, **demo_kwargs) -> "ParquetBlockModel":
         """Convenience helper used in tests to write a demo Parquet file and
@@ -1280,7 +1834,7 @@ class ParquetBlockModel:
         )
         writer.write(columns=None, chunk_size=1_000_000)
 
-        return cls(blockmodel_path=new_filepath, geometry=geometry)
+        return cls._from_written_file(blockmodel_path=new_filepath, geometry=geometry)
 
     @classmethod
     def from_geometry(
@@ -1341,7 +1895,7 @@ class ParquetBlockModel:
         )
         writer.write_dataframe(centroids_df)
 
-        return cls(
+        return cls._from_written_file(
             blockmodel_path=path,
             name=name,
             geometry=geometry,
@@ -1374,8 +1928,8 @@ class ParquetBlockModel:
         """
         new_pbm_filepath = Path(new_pbm_filepath)
 
-        if new_pbm_filepath.suffix != ".pbm":
-            raise ValueError("new_pbm_filepath must have a '.pbm' extension.")
+        if new_pbm_filepath.suffix != self.blockmodel_path.suffix:
+            raise ValueError(f"new_pbm_filepath must have a '{self.blockmodel_path.suffix}' extension.")
         if not self.blockmodel_path.exists():
             raise FileNotFoundError(f"Current .pbm file does not exist: {self.blockmodel_path}")
         if new_pbm_filepath.exists():
@@ -1393,6 +1947,14 @@ class ParquetBlockModel:
         self.data = None
 
         self.blockmodel_path.rename(new_pbm_filepath)
+        # The index stays valid: renaming keeps the file size and mtime.
+        old_sidecar = sidecar_path(self.blockmodel_path)
+        if old_sidecar.exists():
+            old_sidecar.replace(sidecar_path(new_pbm_filepath))
+        # Column families stay bound to the (unchanged) file fingerprint too.
+        old_families = column_sidecars.sidecar_dir(self.blockmodel_path)
+        if old_families.exists():
+            old_families.rename(column_sidecars.sidecar_dir(new_pbm_filepath))
 
         # Refresh path-dependent state.
         self.blockmodel_path = new_pbm_filepath
@@ -1436,6 +1998,8 @@ class ParquetBlockModel:
             :meth:`BlockModelReport.save` to write it again.
 
         """
+        if self.is_partitioned:
+            raise ValueError("Profile reports require a single-file .pbm model.")
         selected_columns = list(columns) if columns is not None else list(self.columns)
         column_descriptions, dataset_metadata = self._report_schema_metadata(selected_columns)
         
@@ -1539,36 +2103,23 @@ class ParquetBlockModel:
         Returns:
             Union[pv.ImageData, np.ndarray]: A 2D heatmap as a PyVista ImageData object or a NumPy array.
             """
-        import pyvista as pv
-        import numpy as np
-
         if attribute not in self.available_columns:
             raise ValueError(f"Attribute '{attribute}' not found in the block model.")
         if axis not in {"x", "y", "z"}:
             raise ValueError("Invalid axis. Choose from 'x', 'y', or 'z'.")
 
-        # Load the block model as PyVista ImageData
-        mesh: pv.ImageData = self.to_pyvista(grid_type="image", attributes=[attribute])
+        # Scatter the attribute into a dense (ni, nj, nk) grid
+        arrays, categories = self.read_dense_arrays(columns=[attribute])
+        values = arrays[attribute]
+        if attribute in categories:
+            values = np.where(values < 0, np.nan, values.astype(float))
 
-        # Apply the threshold
-        mesh.cell_data['count'] = mesh.cell_data[attribute] > threshold
-        mesh.cell_data['count'] = mesh.cell_data['count'].astype(np.int8)
-
-        # Reshape and sum along the specified axis, using Fortran order to match (x, y, z)
-        reshaped_data = mesh.cell_data['count'].reshape(
-            (mesh.dimensions[0] - 1, mesh.dimensions[1] - 1, mesh.dimensions[2] - 1), order='F')
-        summed_data: Optional[np.ndarray] = None
-        if axis == "z":
-            summed_data = np.sum(reshaped_data, axis=2)
-            new_dimensions = (mesh.dimensions[0], mesh.dimensions[1], 1)
-        elif axis == "x":
-            summed_data = np.sum(reshaped_data, axis=0)
-            new_dimensions = (1, mesh.dimensions[1], mesh.dimensions[2])
-        elif axis == "y":
-            summed_data = np.sum(reshaped_data, axis=1)
-            new_dimensions = (mesh.dimensions[0], 1, mesh.dimensions[2])
+        # Apply the threshold (missing cells never count) and sum along the axis
+        counts = (values > threshold).astype(np.int8)
+        summed_data = np.sum(counts, axis={"x": 0, "y": 1, "z": 2}[axis])
         if return_array:
             return summed_data.T  # Flip for correct orientation
+        import pyvista as pv
         # Create a new ImageData object with correct dimensions
         new_mesh = pv.ImageData(dimensions=(summed_data.shape[0] + 1, summed_data.shape[1] + 1, 1),
                                 spacing=self.geometry.local.block_size,
@@ -1698,7 +2249,9 @@ class ParquetBlockModel:
         index: typing.Literal["xyz", "ijk", None] = "xyz",
         dense: bool = False,
         include_calculated: bool = False,
-    ) -> pd.DataFrame:
+        filters: Optional[read_utils.FilterSpec] = None,
+        return_type: typing.Literal["pandas", "arrow", "numpy"] = "pandas",
+    ) -> Union[pd.DataFrame, pa.Table, dict[str, np.ndarray]]:
         """Read the Parquet file and return a DataFrame.
 
         Notes
@@ -1741,11 +2294,31 @@ class ParquetBlockModel:
             If True, include available calculated columns (schema-defined
             and intrinsic) in the default no-argument read. Explicit column
             requests still behave as before.
+        filters:
+            Optional row filters pushed down to the Parquet scanner, in the
+            form accepted by :func:`pyarrow.parquet.read_table`: a list of
+            ``(column, op, value)`` tuples (AND), a list of such lists (OR of
+            ANDs), or a :class:`pyarrow.compute.Expression`. Supported ops are
+            ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and
+            ``not in``; filters may reference any persisted column, including
+            ``block_id``, ``i``/``j``/``k`` and ``x``/``y``/``z``. Row groups
+            are skipped using column statistics and only matching rows are
+            converted to pandas. With ``dense=True`` the filtered-out blocks
+            are returned as missing values. Column-family columns (see
+            :meth:`write`) have no statistics in the main file: a filter on
+            them reads those columns for every row group not already skipped
+            by its other terms, one row group at a time.
+        return_type:
+            ``"pandas"`` (default) returns a DataFrame. ``"arrow"`` returns a
+            :class:`pyarrow.Table` (see :meth:`read_arrow`) and ``"numpy"``
+            a dict of column name to array; both skip the pandas conversion
+            and emit the index as leading columns rather than a MultiIndex.
+            Only ``dense=False`` is supported for these modes.
 
         Returns
         -------
-        pd.DataFrame
-            The DataFrame containing the block model data.
+        pd.DataFrame, pa.Table or dict[str, np.ndarray]
+            The block model data.
 
         Notes
         -----
@@ -1755,87 +2328,51 @@ class ParquetBlockModel:
         encouraged to pass ``index="ijk"`` explicitly and work in terms
         of logical grid indices plus geometry.
         """
-        requested_columns = list(columns) if columns is not None else list(self.columns)
-        operations = self._available_df_eval_operations()
-        if columns is None and include_calculated:
-            requested_columns = list(self.columns)
-            requested_columns.extend(
-                [col for col in operations if col not in self.columns]
+        if return_type in {"arrow", "numpy"}:
+            if dense:
+                raise ValueError(f"dense=True is not supported with return_type='{return_type}'.")
+            table = self.read_arrow(
+                columns=columns,
+                index=index,
+                include_calculated=include_calculated,
+                filters=filters,
             )
+            return table if return_type == "arrow" else read_utils.arrow_to_numpy(table)
+        if return_type != "pandas":
+            raise ValueError("return_type must be 'pandas', 'arrow' or 'numpy'.")
 
-        # align column order with the schema
-        if columns is None and self.schema is not None:
-            schema_column_names = self._get_schema_column_names()
-            schema_cols_in_data = [col for col in schema_column_names if col in requested_columns]
-            extra_cols = [col for col in requested_columns if col not in schema_column_names]
-            requested_columns = schema_cols_in_data + extra_cols
+        requested_columns, read_columns, required_operations = self._plan_read_columns(
+            columns, include_calculated
+        )
 
-        missing_requested = [col for col in requested_columns if col not in self.columns]
-        read_columns = requested_columns
-        required_operations: Optional[dict[str, dict[str, typing.Any]]] = None
-        if missing_requested:
-            undefined = [col for col in missing_requested if col not in operations]
-            if undefined:
-                raise ValueError(
-                    "Requested columns are neither on-disk nor defined by available df-eval operations: "
-                    f"{undefined}"
-                )
-            required_operations = self._select_df_eval_operations(operations, missing_requested)
-            read_columns = list(self.columns)
-
-        df = pq.read_table(self.blockmodel_path, columns=read_columns).to_pandas()
-        if missing_requested:
-            if required_operations is None:  # defensive
-                raise ValueError("No df-eval operations selected for requested calculated columns.")
-            if self.schema is not None:
-                df = self._apply_df_eval_operations(
-                    df,
-                    self.schema,
-                    operations=required_operations,
-                    engine_initializer=self._engine_initializer,
-                )
-            else:
-                df = self._apply_intrinsic_operations(df, required_operations)
-            missing_after_eval = [col for col in requested_columns if col not in df.columns]
-            if missing_after_eval:
-                raise ValueError(
-                    "Calculated column evaluation did not produce requested columns: "
-                    f"{missing_after_eval}"
-                )
-            df = df[requested_columns]
+        filter_expression = read_utils.resolve_filter_expression(filters, self.columns)
+        # Filtered reads cannot recover positions by rescanning the whole file,
+        # so carry block_id alongside the requested columns when indexing.
+        carry_block_id = (
+            filter_expression is not None
+            and index in {"ijk", "xyz"}
+            and "block_id" not in read_columns
+        )
+        table_columns = read_columns + ["block_id"] if carry_block_id else read_columns
+        df = self._read_table(columns=table_columns, filter_expression=filter_expression).to_pandas()
+        filtered_block_ids: Optional[np.ndarray] = None
+        if filter_expression is not None and "block_id" in df.columns:
+            filtered_block_ids = df["block_id"].to_numpy(dtype=np.uint32)
+        if carry_block_id:
+            df = df.drop(columns=["block_id"])
+        if required_operations is not None:
+            df = self._apply_calculated_columns(df, requested_columns, required_operations)
 
         block_ids: Optional[np.ndarray] = None
         if index in {"ijk", "xyz"}:
-            if "block_id" in df.columns:
-                block_ids = df["block_id"].to_numpy(dtype=np.uint32)
-            elif "world_id" in df.columns:
-                if not self.geometry.world_id_encoding:
-                    raise ValueError("world_id column present but metadata has no world_id_encoding payload.")
-                offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
-                x, y, z = decode_world_coordinates(
-                    df["world_id"].to_numpy(dtype=np.int64),
-                    offset=offset,
-                    scale=scale,
-                    bits_per_axis=bits_per_axis,
-                )
-                block_ids = self.geometry.row_index_from_xyz(x, y, z).astype(np.uint32)
-            elif {"i", "j", "k"}.issubset(df.columns):
-                block_ids = self.geometry.row_index_from_ijk(
-                    df["i"].to_numpy(), df["j"].to_numpy(), df["k"].to_numpy()
-                ).astype(np.uint32)
-            elif {"x", "y", "z"}.issubset(df.columns):
-                block_ids = self.geometry.row_index_from_xyz(
-                    df["x"].to_numpy(), df["y"].to_numpy(), df["z"].to_numpy()
-                ).astype(np.uint32)
-            else:
+            block_ids = self._block_ids_from_columns(df)
+            if block_ids is None and filtered_block_ids is not None:
+                block_ids = filtered_block_ids
+            elif block_ids is None:
                 # Requested columns may omit positional fields (block_id/world_id/ijk/xyz).
-                # Recover row ids from the backing dataset to preserve correct mapping even
+                # Recover row ids from the block index to preserve correct mapping even
                 # when on-disk row order is not canonical ijk C-order.
-                block_id_batches = [ids for ids in self._iter_block_ids()]
-                if not block_id_batches:
-                    derived_block_ids = np.empty(0, dtype=np.uint32)
-                else:
-                    derived_block_ids = np.concatenate(block_id_batches).astype(np.uint32, copy=False)
+                derived_block_ids = self.block_index.row_block_ids().astype(np.uint32, copy=False)
                 block_ids = derived_block_ids
                 if len(derived_block_ids) != len(df):
                     raise ValueError(
@@ -1843,24 +2380,7 @@ class ParquetBlockModel:
                         f"loaded {len(df)} data rows but derived {len(derived_block_ids)} block ids."
                     )
 
-        if index in {"ijk", "xyz"} and block_ids is None:
-            raise RuntimeError("Failed to derive block ids for requested indexed read.")
-
-        if index == "xyz":
-            if {"x", "y", "z"}.issubset(df.columns):
-                df.index = pd.MultiIndex.from_arrays(
-                    [df["x"].to_numpy(), df["y"].to_numpy(), df["z"].to_numpy()], names=["x", "y", "z"]
-                )
-            else:
-                x, y, z = self.geometry.xyz_from_row_index(block_ids)
-                df.index = pd.MultiIndex.from_arrays([x, y, z], names=["x", "y", "z"])
-        elif index == "ijk":
-            i, j, k = self.geometry.ijk_from_row_index(block_ids)
-            df.index = pd.MultiIndex.from_arrays([i, j, k], names=["i", "j", "k"])
-        elif index is None:
-            pass
-        else:
-            raise ValueError("index must be 'xyz', 'ijk', or None")
+        df = self._index_frame(df, block_ids, index)
         if dense:
             if index == "xyz":
                 dense_index = self.geometry.to_multi_index_xyz()
@@ -1873,43 +2393,744 @@ class ParquetBlockModel:
 
         return df
 
-    @staticmethod
-    def _resolve_inside_label(
-        evaluator: typing.Any,
-        inside_value: typing.Any,
-    ) -> typing.Any:
-        if inside_value is not None:
-            return inside_value
-        name = getattr(evaluator, "name", None)
-        return name if name is not None else True
-
-    def _flag_evaluator(
+    def read_arrow(
         self,
-        evaluator: typing.Any,
-        *,
-        column: str,
-        inside_value: typing.Any = None,
-        outside_value: typing.Any = pd.NA,
-        as_categorical: Optional[bool] = None,
-    ) -> np.ndarray:
-        mask = np.asarray(evaluator.evaluate(self.geometry), dtype=bool)
-        expected_len = int(np.prod(self.geometry.local.shape))
-        if mask.shape != (expected_len,):
-            raise ValueError(
-                f"Evaluator mask length mismatch: expected ({expected_len},), got {mask.shape}."
-            )
-
-        inside = self._resolve_inside_label(evaluator, inside_value)
-        if as_categorical is None:
-            as_categorical = isinstance(inside, str) or outside_value is pd.NA
+        columns: Optional[list[str]] = None,
+        index: typing.Literal["xyz", "ijk", None] = "ijk",
+        include_calculated: bool = False,
+        filters: Optional[read_utils.FilterSpec] = None,
+    ) -> pa.Table:
+        """Read the block model as a :class:`pyarrow.Table`.
 
-        rows = self.read(columns=["block_id"], index=None)
-        block_ids = rows["block_id"].to_numpy(dtype=np.int64)
-        values = np.full(len(rows), outside_value, dtype=object)
-        values[mask[block_ids]] = inside
+        Persisted columns are returned straight from the Parquet reader with no
+        pandas round-trip, and positions are emitted as leading columns rather
+        than a MultiIndex. Building a MultiIndex dominates read time and peak
+        memory on large models, so prefer this path when the caller consumes
+        Arrow or NumPy data.
 
-        payload = pd.DataFrame({"block_id": block_ids})
-        if as_categorical:
+        Args
+        ----
+        columns:
+            List of column names to read, which may include calculated
+            columns. If None, all persisted columns are read.
+        index:
+            ``"ijk"`` (default) prepends ``i``, ``j`` and ``k`` columns,
+            ``"xyz"`` prepends centroid ``x``, ``y`` and ``z`` columns, and
+            ``None`` adds nothing. Columns already in the output are not
+            duplicated.
+        include_calculated:
+            If True, include available calculated columns when ``columns``
+            is None, as in :meth:`read`.
+        filters:
+            Optional row filters pushed down to the Parquet scanner; see
+            :meth:`read`.
+
+        Returns
+        -------
+        pa.Table
+            The block model data. Calculated columns are evaluated through
+            pandas and converted back to Arrow.
+        """
+        if index not in {"xyz", "ijk", None}:
+            raise ValueError("index must be 'xyz', 'ijk', or None")
+
+        requested_columns, read_columns, required_operations = self._plan_read_columns(
+            columns, include_calculated
+        )
+        filter_expression = read_utils.resolve_filter_expression(filters, self.columns)
+
+        positional_columns = self._positional_columns() if index is not None else []
+        carried_columns = [col for col in positional_columns if col not in read_columns]
+        table = self._read_table(columns=read_columns + carried_columns, filter_expression=filter_expression)
+
+        block_ids: Optional[np.ndarray] = None
+        if index is not None:
+            block_ids = self._block_ids_from_columns(
+                read_utils.arrow_to_numpy(table.select(positional_columns))
+            )
+        table = self._select_arrow_columns(table, requested_columns, read_columns, required_operations)
+        return self._with_index_columns(table, block_ids, index)
+
+    def iter_read(
+        self,
+        columns: Optional[list[str]] = None,
+        batch_size: int = 1_000_000,
+        index: typing.Literal["xyz", "ijk", None] = "ijk",
+        include_calculated: bool = False,
+        filters: Optional[read_utils.FilterSpec] = None,
+        return_type: typing.Literal["pandas", "arrow", "numpy"] = "pandas",
+        prefetch: int = 0,
+    ) -> Iterator[Union[pd.DataFrame, pa.RecordBatch, dict[str, np.ndarray]]]:
+        """Iterate over the block model in bounded-memory batches.
+
+        Each batch is read with :meth:`pyarrow.parquet.ParquetFile.iter_batches`
+        (or a filtered dataset scan), so peak memory is governed by
+        ``batch_size`` rather than the size of the file. Calculated columns are
+        evaluated per batch, and the positional index is derived per batch from
+        ``block_id`` without rescanning the file.
+
+        Args
+        ----
+        columns:
+            List of column names to read, which may include calculated
+            columns. If None, all persisted columns are read.
+        batch_size:
+            Maximum number of rows per batch.
+        index:
+            ``"ijk"`` (default) or ``"xyz"`` to index each batch by block
+            indices or centroid coordinates, or ``None`` for no index.
+        include_calculated:
+            If True, include available calculated columns when ``columns``
+            is None, as in :meth:`read`.
+        filters:
+            Optional row filters pushed down to the Parquet scanner; see
+            :meth:`read`. Batches with no matching rows are skipped.
+        return_type:
+            ``"pandas"`` (default) yields DataFrames. ``"arrow"`` yields
+            :class:`pyarrow.RecordBatch` objects and ``"numpy"`` yields dicts
+            of column name to array; both emit the index as leading
+            ``i``/``j``/``k`` or ``x``/``y``/``z`` columns instead of a
+            MultiIndex.
+        prefetch:
+            Number of batches to decode ahead on a background thread while
+            the current batch is processed. ``0`` (default) disables
+            read-ahead; ``2`` is usually enough to overlap I/O with work
+            on slow (e.g. network) storage.
+
+        Yields
+        ------
+        pd.DataFrame, pa.RecordBatch or dict[str, np.ndarray]
+            One batch of rows, in on-disk order.
+
+        Examples
+        --------
+        >>> total = 0.0
+        >>> for batch in pbm.iter_read(columns=["grade", "volume"], batch_size=500_000):
+        ...     total += (batch["grade"] * batch["volume"]).sum()
+        """
+        if index not in {"xyz", "ijk", None}:
+            raise ValueError("index must be 'xyz', 'ijk', or None")
+        if return_type not in {"pandas", "arrow", "numpy"}:
+            raise ValueError("return_type must be 'pandas', 'arrow' or 'numpy'.")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+
+        requested_columns, read_columns, required_operations = self._plan_read_columns(
+            columns, include_calculated
+        )
+        filter_expression = read_utils.resolve_filter_expression(filters, self.columns)
+
+        positional_columns = self._positional_columns() if index is not None else []
+        carried_columns = [col for col in positional_columns if col not in read_columns]
+        batch_columns = read_columns + carried_columns
+
+        for batch in self._iter_batches(
+            batch_columns, batch_size=batch_size, filter_expression=filter_expression, prefetch=prefetch
+        ):
+            if filter_expression is not None and batch.num_rows == 0:
+                continue
+
+            block_ids: Optional[np.ndarray] = None
+            if index is not None:
+                block_ids = self._block_ids_from_columns(
+                    read_utils.arrow_to_numpy(batch.select(positional_columns))
+                )
+
+            if return_type == "pandas":
+                df = batch.to_pandas()
+                if carried_columns:
+                    df = df.drop(columns=carried_columns)
+                if required_operations is not None:
+                    df = self._apply_calculated_columns(df, requested_columns, required_operations)
+                yield self._index_frame(df, block_ids, index)
+                continue
+
+            record_batch = self._with_index_columns(
+                self._select_arrow_columns(batch, requested_columns, read_columns, required_operations),
+                block_ids,
+                index,
+            )
+            yield record_batch if return_type == "arrow" else read_utils.arrow_to_numpy(record_batch)
+
+    def read_dense_arrays(
+        self,
+        columns: Optional[list[str]] = None,
+        fill_value: typing.Any = np.nan,
+        batch_size: int = 1_000_000,
+        filters: Optional[read_utils.FilterSpec] = None,
+        prefetch: int = 0,
+    ) -> tuple[dict[str, np.ndarray], dict[str, pd.Index]]:
+        """Read columns as dense ``(ni, nj, nk)`` NumPy arrays.
+
+        Each batch is scattered straight into preallocated C-order arrays by
+        ``block_id``, so no dense MultiIndex is built and no reindex join is
+        performed. This is the fast path for sparse models and for consumers
+        that work on the grid (reblocking, image grids, heatmaps).
+
+        Args
+        ----
+        columns:
+            Columns to read, which may include calculated columns. Defaults
+            to :attr:`persisted_attributes`.
+        fill_value:
+            Value for cells with no data. Integer and boolean columns are
+            promoted (e.g. to float64 for ``np.nan``) unless every cell is
+            populated.
+        batch_size:
+            Maximum number of rows scattered per batch.
+        filters:
+            Optional row filters pushed down to the Parquet scanner; see
+            :meth:`read`. Filtered-out cells receive ``fill_value``.
+        prefetch:
+            Number of batches to decode ahead on a background thread; see
+            :meth:`iter_read`.
+
+        Returns
+        -------
+        tuple[dict[str, np.ndarray], dict[str, pd.Index]]
+            Dense arrays keyed by column, and category tables for categorical
+            and string columns. Those columns are returned as integer codes
+            into their category table, with ``-1`` for missing cells. The
+            layout matches
+            :func:`parq_blockmodel.reblocking.conversion.tabular_to_3d_dict`.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        if columns is None:
+            columns = self.persisted_attributes
+        requested_columns, read_columns, required_operations = self._plan_read_columns(columns, False)
+        filter_expression = read_utils.resolve_filter_expression(filters, self.columns)
+
+        shape = tuple(int(v) for v in self.geometry.local.shape)
+        size = int(np.prod(shape))
+        complete = filter_expression is None and int(self.pf.metadata.num_rows) == size
+        builders = {
+            col: read_utils.DenseColumnBuilder(size, fill_value=fill_value, complete=complete)
+            for col in requested_columns
+        }
+
+        positional_columns = self._positional_columns()
+        carried_columns = [col for col in positional_columns if col not in read_columns]
+        for batch in self._iter_batches(
+            read_columns + carried_columns,
+            batch_size=batch_size,
+            filter_expression=filter_expression,
+            prefetch=prefetch,
+        ):
+            if batch.num_rows == 0:
+                continue
+            block_ids = self._block_ids_from_columns(
+                read_utils.arrow_to_numpy(batch.select(positional_columns))
+            )
+            data = self._select_arrow_columns(batch, requested_columns, read_columns, required_operations)
+            for col, builder in builders.items():
+                builder.add(block_ids, data.column(col))
+
+        arrays: dict[str, np.ndarray] = {}
+        categories: dict[str, pd.Index] = {}
+        for col, builder in builders.items():
+            arrays[col], column_categories = builder.finish(shape)
+            if column_categories is not None:
+                categories[col] = column_categories
+        return arrays, categories
+
+    def get_blocks(
+        self,
+        block_ids: Optional[typing.Sequence[int]] = None,
+        ijk: Optional[typing.Sequence[typing.Sequence[int]]] = None,
+        xyz: Optional[typing.Sequence[typing.Sequence[float]]] = None,
+        columns: Optional[list[str]] = None,
+        index: typing.Literal["xyz", "ijk", None] = "ijk",
+        tol: float = 1e-6,
+    ) -> pd.DataFrame:
+        """Look up individual blocks by ``block_id``, ``(i, j, k)`` or ``(x, y, z)``.
+
+        Row positions come from :attr:`block_index` by binary search, so only
+        the row groups that contain the requested blocks are decoded, and
+        only the requested rows are converted to pandas.
+
+        Args
+        ----
+        block_ids:
+            Block ids to fetch.
+        ijk:
+            Block indices to fetch, as an ``(n, 3)`` array-like or a single
+            ``(i, j, k)`` triple.
+        xyz:
+            Block centroids to fetch, as an ``(n, 3)`` array-like or a single
+            ``(x, y, z)`` triple. Coordinates must lie on the centroid lattice
+            within ``tol``.
+        columns:
+            Columns to return, which may include calculated columns. If None,
+            all persisted columns are returned.
+        index:
+            ``"ijk"`` (default), ``"xyz"`` or ``None``; see :meth:`read`.
+        tol:
+            Tolerance used to snap ``xyz`` to block centroids.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per requested block that exists in the model, in request
+            order with duplicates removed. Blocks absent from a sparse model
+            are omitted.
+
+        Raises
+        ------
+        ValueError
+            If not exactly one of ``block_ids``, ``ijk`` or ``xyz`` is given,
+            or if the positions lie outside the grid.
+        """
+        selectors = [arg is not None for arg in (block_ids, ijk, xyz)]
+        if sum(selectors) != 1:
+            raise ValueError("Provide exactly one of block_ids, ijk or xyz.")
+        if index not in {"xyz", "ijk", None}:
+            raise ValueError("index must be 'xyz', 'ijk', or None")
+
+        if ijk is not None:
+            i, j, k = np.atleast_2d(np.asarray(ijk, dtype=np.int64)).T
+            requested = np.asarray(self.geometry.row_index_from_ijk(i, j, k), dtype=np.int64)
+        elif xyz is not None:
+            x, y, z = np.atleast_2d(np.asarray(xyz, dtype=float)).T
+            requested = self.geometry.row_index_from_xyz(x, y, z, tol=tol)
+        else:
+            requested = np.atleast_1d(np.asarray(block_ids, dtype=np.int64))
+            dense_count = int(np.prod(self.geometry.local.shape))
+            if requested.size and (requested.min() < 0 or requested.max() >= dense_count):
+                raise ValueError("block_ids must lie within the geometry bounds.")
+
+        requested = pd.unique(requested.ravel())
+        positions = self.block_index.lookup(requested)
+        found = positions >= 0
+        requested, positions = requested[found], positions[found]
+
+        requested_columns, read_columns, required_operations = self._plan_read_columns(columns, False)
+        row_counts = [self.pf.metadata.row_group(rg).num_rows for rg in range(self.pf.metadata.num_row_groups)]
+        row_group_starts = np.concatenate([[0], np.cumsum(row_counts)]).astype(np.int64)
+        row_groups = np.searchsorted(row_group_starts, positions, side="right") - 1
+        selected_row_groups = np.unique(row_groups)
+
+        # Offsets of each selected row group within the concatenated read.
+        selected_counts = np.asarray(row_counts, dtype=np.int64)[selected_row_groups]
+        selected_starts = np.concatenate([[0], np.cumsum(selected_counts)[:-1]]).astype(np.int64)
+        local_positions = (
+            positions
+            - row_group_starts[row_groups]
+            + selected_starts[np.searchsorted(selected_row_groups, row_groups)]
+        )
+
+        table = self.pf.read_row_groups(selected_row_groups.tolist(), columns=read_columns)
+        df = table.take(pa.array(local_positions, type=pa.int64())).to_pandas()
+        if required_operations is not None:
+            df = self._apply_calculated_columns(df, requested_columns, required_operations)
+        else:
+            df = df[requested_columns]
+        return self._index_frame(df, requested.astype(np.uint32), index)
+
+    def _plan_read_columns(
+        self,
+        columns: Optional[list[str]],
+        include_calculated: bool,
+    ) -> tuple[list[str], list[str], Optional[dict[str, dict[str, typing.Any]]]]:
+        """Resolve requested, on-disk and calculated columns for a read.
+
+        Returns
+        -------
+        tuple
+            ``(requested_columns, read_columns, required_operations)`` where
+            ``required_operations`` is None when every requested column is
+            persisted.
+        """
+        requested_columns = list(columns) if columns is not None else list(self.columns)
+        operations = self._available_df_eval_operations()
+        if columns is None and include_calculated:
+            requested_columns = list(self.columns)
+            requested_columns.extend(
+                [col for col in operations if col not in self.columns]
+            )
+
+        # align column order with the schema
+        if columns is None and self._schema is not None:
+            schema_column_names = self._get_schema_column_names()
+            schema_cols_in_data = [col for col in schema_column_names if col in requested_columns]
+            extra_cols = [col for col in requested_columns if col not in schema_column_names]
+            requested_columns = schema_cols_in_data + extra_cols
+
+        missing_requested = [col for col in requested_columns if col not in self.columns]
+        if not missing_requested:
+            return requested_columns, requested_columns, None
+
+        undefined = [col for col in missing_requested if col not in operations]
+        if undefined:
+            raise ValueError(
+                "Requested columns are neither on-disk nor defined by available df-eval operations: "
+                f"{undefined}"
+            )
+        required_operations = self._select_df_eval_operations(operations, missing_requested)
+        # Read only the persisted inputs the dependency graph references, plus
+        # any persisted columns requested directly.
+        input_columns = schema_utils.required_input_columns(operations, missing_requested, self.columns)
+        if input_columns is None:
+            return requested_columns, list(self.columns), required_operations
+        needed = set(input_columns).union(requested_columns)
+        read_columns = [col for col in self.columns if col in needed]
+        return requested_columns, read_columns, required_operations
+
+    def _apply_calculated_columns(
+        self,
+        df: pd.DataFrame,
+        requested_columns: list[str],
+        required_operations: dict[str, dict[str, typing.Any]],
+    ) -> pd.DataFrame:
+        """Evaluate calculated columns on ``df`` and select ``requested_columns``."""
+        if self._schema is not None:
+            df = self._apply_df_eval_operations(
+                df,
+                self._schema,
+                operations=required_operations,
+                engine_initializer=self._engine_initializer,
+            )
+        else:
+            df = self._apply_intrinsic_operations(df, required_operations)
+        missing_after_eval = [col for col in requested_columns if col not in df.columns]
+        if missing_after_eval:
+            raise ValueError(
+                "Calculated column evaluation did not produce requested columns: "
+                f"{missing_after_eval}"
+            )
+        return df[requested_columns]
+
+    def _positional_columns(self) -> list[str]:
+        """Return the persisted columns used to derive block ids, in priority order."""
+        cols = set(self.columns)
+        for candidate in (["block_id"], ["world_id"], ["i", "j", "k"], ["x", "y", "z"]):
+            if set(candidate).issubset(cols):
+                return candidate
+        raise ValueError(
+            "Cannot derive block ids: file has none of block_id, world_id, (i, j, k) or (x, y, z)."
+        )
+
+    def _block_ids_from_columns(
+        self,
+        data: Union[pd.DataFrame, typing.Mapping[str, np.ndarray]],
+    ) -> Optional[np.ndarray]:
+        """Derive block ids from positional columns in ``data``, or None if absent.
+
+        ``data`` may be a DataFrame or a mapping of column name to array.
+        """
+        def has(*names: str) -> bool:
+            return all(name in data for name in names)
+
+        if has("block_id"):
+            return np.asarray(data["block_id"], dtype=np.uint32)
+        if has("world_id"):
+            if not self.geometry.world_id_encoding:
+                raise ValueError("world_id column present but metadata has no world_id_encoding payload.")
+            offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
+            curve = get_world_id_curve(self.geometry.world_id_encoding)
+            x, y, z = decode_world_coordinates(
+                np.asarray(data["world_id"], dtype=np.int64),
+                offset=offset,
+                scale=scale,
+                bits_per_axis=bits_per_axis,
+                curve=curve,
+            )
+            return self.geometry.row_index_from_xyz(x, y, z).astype(np.uint32)
+        if has("i", "j", "k"):
+            return self.geometry.row_index_from_ijk(
+                np.asarray(data["i"]), np.asarray(data["j"]), np.asarray(data["k"])
+            ).astype(np.uint32)
+        if has("x", "y", "z"):
+            return self.geometry.row_index_from_xyz(
+                np.asarray(data["x"]), np.asarray(data["y"]), np.asarray(data["z"])
+            ).astype(np.uint32)
+        return None
+
+    def _index_frame(
+        self,
+        df: pd.DataFrame,
+        block_ids: Optional[np.ndarray],
+        index: typing.Literal["xyz", "ijk", None],
+    ) -> pd.DataFrame:
+        """Set an ``xyz`` or ``ijk`` MultiIndex on ``df`` from ``block_ids``."""
+        if index in {"ijk", "xyz"} and block_ids is None:
+            raise RuntimeError("Failed to derive block ids for requested indexed read.")
+
+        if index == "xyz":
+            if {"x", "y", "z"}.issubset(df.columns):
+                df.index = pd.MultiIndex.from_arrays(
+                    [df["x"].to_numpy(), df["y"].to_numpy(), df["z"].to_numpy()], names=["x", "y", "z"]
+                )
+            else:
+                x, y, z = self.geometry.xyz_from_row_index(block_ids)
+                df.index = pd.MultiIndex.from_arrays([x, y, z], names=["x", "y", "z"])
+        elif index == "ijk":
+            i, j, k = self.geometry.ijk_from_row_index(block_ids)
+            df.index = pd.MultiIndex.from_arrays([i, j, k], names=["i", "j", "k"])
+        elif index is None:
+            pass
+        else:
+            raise ValueError("index must be 'xyz', 'ijk', or None")
+        return df
+
+    def _with_index_columns(
+        self,
+        data: Union[pa.Table, pa.RecordBatch],
+        block_ids: Optional[np.ndarray],
+        index: typing.Literal["xyz", "ijk", None],
+    ) -> Union[pa.Table, pa.RecordBatch]:
+        """Prepend ``i``/``j``/``k`` or ``x``/``y``/``z`` columns derived from ``block_ids``."""
+        if index is None:
+            return data
+        if block_ids is None:
+            raise RuntimeError("Failed to derive block ids for requested indexed read.")
+        if index == "ijk":
+            names = ["i", "j", "k"]
+            values = self.geometry.ijk_from_row_index(block_ids)
+        else:
+            names = ["x", "y", "z"]
+            values = self.geometry.xyz_from_row_index(block_ids)
+        index_names = [name for name in names if name not in data.schema.names]
+        index_arrays = [pa.array(np.asarray(v)) for name, v in zip(names, values) if name in index_names]
+        return type(data).from_arrays(
+            index_arrays + list(data.columns),
+            names=index_names + list(data.schema.names),
+        )
+
+    def _select_arrow_columns(
+        self,
+        data: Union[pa.Table, pa.RecordBatch],
+        requested_columns: list[str],
+        read_columns: list[str],
+        required_operations: Optional[dict[str, dict[str, typing.Any]]],
+    ) -> Union[pa.Table, pa.RecordBatch]:
+        """Select ``requested_columns`` from Arrow data.
+
+        Persisted columns are selected without copying. Calculated columns are
+        evaluated through pandas, as df-eval operates on DataFrames.
+        """
+        if required_operations is None:
+            return data.select(requested_columns)
+        df = self._apply_calculated_columns(
+            data.select(read_columns).to_pandas(), requested_columns, required_operations
+        )
+        return type(data).from_pandas(df, preserve_index=False)
+
+    def read_window(
+        self,
+        i: Optional[tuple[int, int]] = None,
+        j: Optional[tuple[int, int]] = None,
+        k: Optional[tuple[int, int]] = None,
+        columns: Optional[list[str]] = None,
+        index: typing.Literal["xyz", "ijk", None] = "xyz",
+        dense: bool = False,
+        include_calculated: bool = False,
+        filters: Optional[read_utils.FilterSpec] = None,
+    ) -> pd.DataFrame:
+        """Read the blocks inside an inclusive ijk index window.
+
+        The window is translated into ``block_id`` predicates (plus ``i``/``j``/``k``
+        predicates when persisted) and pushed down to the Parquet scanner, so row
+        groups outside the window are skipped using column statistics. Without
+        persisted ``i``/``j``/``k`` only a few ``block_id`` ranges covering the
+        window are pushed down, and the rows read are refined in memory.
+
+        Args:
+            i: Inclusive ``(lo, hi)`` range of ``i`` indices; ``None`` selects the whole axis.
+            j: Inclusive ``(lo, hi)`` range of ``j`` indices; ``None`` selects the whole axis.
+            k: Inclusive ``(lo, hi)`` range of ``k`` indices; ``None`` selects the whole axis.
+            columns: Columns to read, as for :meth:`read`.
+            index: Index type, as for :meth:`read`.
+            dense: If True, reindex to every block of the window (not the full grid).
+            include_calculated: As for :meth:`read`.
+            filters: Additional row filters combined (AND) with the window.
+
+        Returns:
+            pd.DataFrame: Blocks inside the window, indexed as by :meth:`read`.
+        """
+        shape = self.geometry.local.shape
+        window = read_utils.clip_ijk_window(shape, i, j, k)
+        expression = read_utils.ijk_window_filters(shape, window, self.columns)
+
+        def in_window(block_ids: np.ndarray) -> np.ndarray:
+            return read_utils.ijk_window_mask(shape, window, block_ids)
+
+        def window_block_ids() -> np.ndarray:
+            if window is None:
+                return np.empty(0, dtype=np.int64)
+            return read_utils.ijk_window_block_ids(self.geometry.local.shape, window)
+
+        return self._read_window(
+            expression,
+            window_block_ids,
+            columns=columns,
+            index=index,
+            dense=dense,
+            include_calculated=include_calculated,
+            filters=filters,
+            row_mask=None if read_utils.ijk_window_is_exact(shape, window, self.columns) else in_window,
+        )
+
+    def read_window_xyz(
+        self,
+        x: Optional[tuple[float, float]] = None,
+        y: Optional[tuple[float, float]] = None,
+        z: Optional[tuple[float, float]] = None,
+        columns: Optional[list[str]] = None,
+        index: typing.Literal["xyz", "ijk", None] = "xyz",
+        dense: bool = False,
+        include_calculated: bool = False,
+        filters: Optional[read_utils.FilterSpec] = None,
+        tol: float = 1e-6,
+    ) -> pd.DataFrame:
+        """Read the blocks whose centroids fall inside a world-space bounding box.
+
+        World extents are converted to an ijk window via
+        :meth:`RegularGeometry.ijk_bounds_from_xyz_bounds` and then read as in
+        :meth:`read_window`. For rotated geometries only the enclosing ijk
+        window is pushed down; the rows read are then refined in memory to the
+        blocks whose centroids actually lie inside the box.
+
+        Args:
+            x: Inclusive ``(min, max)`` world X bounds; ``None`` is unbounded.
+            y: Inclusive ``(min, max)`` world Y bounds; ``None`` is unbounded.
+            z: Inclusive ``(min, max)`` world Z bounds; ``None`` is unbounded.
+            columns: Columns to read, as for :meth:`read`.
+            index: Index type, as for :meth:`read`.
+            dense: If True, reindex to every block inside the box (not the full grid).
+            include_calculated: As for :meth:`read`.
+            filters: Additional row filters combined (AND) with the box.
+            tol: Tolerance applied to the box bounds.
+
+        Returns:
+            pd.DataFrame: Blocks inside the box, indexed as by :meth:`read`.
+        """
+        shape = self.geometry.local.shape
+        window = self.geometry.ijk_bounds_from_xyz_bounds(x=x, y=y, z=z, tol=tol)
+        if window is not None and not self.geometry.is_rotated:
+            i, j, k = window
+            return self.read_window(
+                i,
+                j,
+                k,
+                columns=columns,
+                index=index,
+                dense=dense,
+                include_calculated=include_calculated,
+                filters=filters,
+            )
+
+        def inside_box(block_ids: np.ndarray) -> np.ndarray:
+            cx, cy, cz = self.geometry.xyz_from_row_index(block_ids)
+            inside = np.ones(block_ids.size, dtype=bool)
+            for values, bounds in zip([cx, cy, cz], [x, y, z]):
+                if bounds is not None:
+                    inside &= (values >= bounds[0] - tol) & (values <= bounds[1] + tol)
+            return inside
+
+        def window_block_ids() -> np.ndarray:
+            if window is None:
+                return np.empty(0, dtype=np.int64)
+            candidates = read_utils.ijk_window_block_ids(shape, window)
+            return candidates[inside_box(candidates)]
+
+        # Push down the ijk envelope (cheap, prunes row groups by statistics)
+        # and apply the exact rotated containment test to the rows read.
+        return self._read_window(
+            read_utils.ijk_window_filters(shape, window, self.columns),
+            window_block_ids,
+            columns=columns,
+            index=index,
+            dense=dense,
+            include_calculated=include_calculated,
+            filters=filters,
+            row_mask=inside_box,
+        )
+
+    def _read_window(
+        self,
+        expression: pc.Expression,
+        window_block_ids: typing.Callable[[], np.ndarray],
+        *,
+        columns: Optional[list[str]],
+        index: typing.Literal["xyz", "ijk", None],
+        dense: bool,
+        include_calculated: bool,
+        filters: Optional[read_utils.FilterSpec],
+        row_mask: Optional[typing.Callable[[np.ndarray], np.ndarray]] = None,
+    ) -> pd.DataFrame:
+        """Read rows matching a window expression, optionally densified to the window.
+
+        ``row_mask`` optionally refines the rows read: it receives their block
+        ids and returns a boolean mask of the rows to keep.
+        """
+        if dense and index not in {"xyz", "ijk"}:
+            raise ValueError("dense=True requires index='xyz' or index='ijk'.")
+        user_expression = read_utils.resolve_filter_expression(filters, self.columns)
+        if user_expression is not None:
+            expression = expression & user_expression
+
+        carry_block_id = row_mask is not None and columns is not None and "block_id" not in columns
+        df = self.read(
+            columns=list(columns) + ["block_id"] if carry_block_id else columns,
+            index=index,
+            dense=False,
+            include_calculated=include_calculated,
+            filters=expression,
+        )
+        if row_mask is not None:
+            df = df[row_mask(df["block_id"].to_numpy(dtype=np.int64))]
+            if carry_block_id:
+                df = df.drop(columns=["block_id"])
+        if dense:
+            block_ids = window_block_ids()
+            if index == "ijk":
+                i, j, k = self.geometry.ijk_from_row_index(block_ids)
+                dense_index = pd.MultiIndex.from_arrays([i, j, k], names=["i", "j", "k"])
+            else:
+                x, y, z = self.geometry.xyz_from_row_index(block_ids)
+                dense_index = pd.MultiIndex.from_arrays([x, y, z], names=["x", "y", "z"])
+            df = df.reindex(dense_index)
+        return df
+
+    @staticmethod
+    def _resolve_inside_label(
+        evaluator: typing.Any,
+        inside_value: typing.Any,
+    ) -> typing.Any:
+        if inside_value is not None:
+            return inside_value
+        name = getattr(evaluator, "name", None)
+        return name if name is not None else True
+
+    def _flag_evaluator(
+        self,
+        evaluator: typing.Any,
+        *,
+        column: str,
+        inside_value: typing.Any = None,
+        outside_value: typing.Any = pd.NA,
+        as_categorical: Optional[bool] = None,
+        column_family: bool = False,
+    ) -> np.ndarray:
+        mask = np.asarray(evaluator.evaluate(self.geometry), dtype=bool)
+        expected_len = int(np.prod(self.geometry.local.shape))
+        if mask.shape != (expected_len,):
+            raise ValueError(
+                f"Evaluator mask length mismatch: expected ({expected_len},), got {mask.shape}."
+            )
+
+        inside = self._resolve_inside_label(evaluator, inside_value)
+        if as_categorical is None:
+            as_categorical = isinstance(inside, str) or outside_value is pd.NA
+
+        rows = self.read(columns=["block_id"], index=None)
+        block_ids = rows["block_id"].to_numpy(dtype=np.int64)
+        values = np.full(len(rows), outside_value, dtype=object)
+        values[mask[block_ids]] = inside
+
+        payload = pd.DataFrame({"block_id": block_ids})
+        if as_categorical:
             categories = [inside]
             if outside_value is not pd.NA:
                 categories.append(outside_value)
@@ -1917,7 +3138,7 @@ class ParquetBlockModel:
         else:
             payload[column] = pd.Series(values)
 
-        self.write(payload, merge=True)
+        self.write(payload, merge=True, column_family=column_family)
         return mask
 
     def flag_polygon(
@@ -1928,10 +3149,13 @@ class ParquetBlockModel:
         inside_value: typing.Any = None,
         outside_value: typing.Any = pd.NA,
         as_categorical: Optional[bool] = None,
+        column_family: bool = False,
     ) -> np.ndarray:
         """Evaluate a PolygonField and persist a new flag/domain column.
 
         Returns the dense boolean inside/outside mask aligned to geometry C-order.
+        With ``column_family=True`` the column is stored as a sidecar rather
+        than rewriting the file; see :meth:`write`.
         """
         return self._flag_evaluator(
             polygon,
@@ -1939,6 +3163,7 @@ class ParquetBlockModel:
             inside_value=inside_value,
             outside_value=outside_value,
             as_categorical=as_categorical,
+            column_family=column_family,
         )
 
     def flag_solid(
@@ -1949,10 +3174,13 @@ class ParquetBlockModel:
         inside_value: typing.Any = None,
         outside_value: typing.Any = pd.NA,
         as_categorical: Optional[bool] = None,
+        column_family: bool = False,
     ) -> np.ndarray:
         """Evaluate a MeshSolid and persist a new flag/domain column.
 
         Returns the dense boolean inside/outside mask aligned to geometry C-order.
+        With ``column_family=True`` the column is stored as a sidecar rather
+        than rewriting the file; see :meth:`write`.
         """
         return self._flag_evaluator(
             solid,
@@ -1960,6 +3188,7 @@ class ParquetBlockModel:
             inside_value=inside_value,
             outside_value=outside_value,
             as_categorical=as_categorical,
+            column_family=column_family,
         )
 
     def evaluate_surface(
@@ -1967,8 +3196,13 @@ class ParquetBlockModel:
         surface: "Surface",
         *,
         column: str,
+        column_family: bool = False,
     ) -> np.ndarray:
-        """Evaluate a Surface and persist the resulting values into a column."""
+        """Evaluate a Surface and persist the resulting values into a column.
+
+        With ``column_family=True`` the column is stored as a sidecar rather
+        than rewriting the file; see :meth:`write`.
+        """
         values = np.asarray(surface.evaluate(self.geometry), dtype=float)
         expected_len = int(np.prod(self.geometry.local.shape))
         if values.shape != (expected_len,):
@@ -1984,7 +3218,7 @@ class ParquetBlockModel:
                 column: values[block_ids],
             }
         )
-        self.write(payload, merge=True)
+        self.write(payload, merge=True, column_family=column_family)
         return values
 
     def write(
@@ -1997,6 +3231,9 @@ class ParquetBlockModel:
             allow_overwrite: bool = True,
             show_progress: bool = False,
             compression: typing.Any = "fast",
+            workers: int = 1,
+            column_family: bool = False,
+            row_group_size: Optional[int] = None,
             **pq_write_kwargs: object,
     ) -> "ParquetBlockModel":
         """Persist data to the backing ``.pbm`` file.
@@ -2008,24 +3245,46 @@ class ParquetBlockModel:
         merge : bool, default False
             If False, rewrite the file using only ``dataframe`` columns.
             If True, append columns from ``dataframe`` to existing parquet rows
-            using key alignment (streamed via parq-tools).
+            using key alignment (see ``column_family``).
         index_columns : list[str], optional
             Key columns used for merge alignment. Defaults to ``["block_id"]`` when
             available, then ``["i", "j", "k"]``, then ``["x", "y", "z"]``.
         batch_size : int, default 1_000_000
-            Streaming batch size used when ``merge=True``.
+            Rows converted and written per streamed batch.
         allow_overwrite : bool, default True
-            Forwarded to merge helper.
+            If False, merge mode refuses to rewrite the backing file and
+            raises :class:`FileExistsError`.
         show_progress : bool, default False
-            Forwarded to merge helper.
+            If True, display a progress bar while merging.
         compression : str or int, default "fast"
             Active write compression policy. "fast"/0 maps to snappy; integers
             greater than zero map to zstd at that level.
+        workers : int, default 1
+            Number of partitions merged concurrently when the model is a
+            ``.pbmd`` dataset (merge mode).
+        column_family : bool, default False
+            Merge mode on a ``.pbm`` file: if True, store the new columns in a
+            row-aligned sidecar file (see
+            :mod:`~parq_blockmodel.io.column_sidecars`) so only those columns
+            are written; use :meth:`compact` to fold sidecars in later. The
+            main file is never rewritten: ``compression`` applies to the
+            family only and is recorded in the sidecar manifest. If
+            False, rewrite the file with all columns in a single streamed
+            pass, so that other Parquet readers see them. Column families
+            are not supported for ``.pbmd`` datasets; passing True for one
+            raises :class:`ValueError`.
+        row_group_size : int, optional
+            Maximum rows per row group when ``merge=False`` (default
+            ``batch_size``).
         **pq_write_kwargs : object
             Extra args forwarded to parquet writer (merge mode).
         """
         if batch_size <= 0:
             raise ValueError("batch_size must be > 0")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if merge and column_family and self.is_partitioned:
+            raise ValueError("column_family=True is only supported for .pbm files, not .pbmd datasets.")
 
         # Windows cannot atomically replace files while parquet readers are alive.
         self.pf = None  # type: ignore[assignment]
@@ -2046,26 +3305,41 @@ class ParquetBlockModel:
                         "Provide index_columns explicitly."
                     )
 
-            from parq_tools import concat_parquet_file_with_dataframe
-
-            concat_parquet_file_with_dataframe(
-                parquet_path=self.blockmodel_path,
-                df=dataframe,
-                output_path=None,
+            if column_family:
+                self._merge_column_family(
+                    dataframe,
+                    index_columns=index_columns,
+                    compression=active_compression,
+                    show_progress=show_progress,
+                    **pq_write_kwargs,
+                )
+                # Only the family and its manifest were written; the main file
+                # (and the compression policy in its footer) is untouched.
+                self._refresh_path_bound_state()
+                self._extract_column_dtypes()
+                return self
+
+            if not allow_overwrite:
+                raise FileExistsError(f"Target file already exists: {self.blockmodel_path}")
+            self._merge_columns(
+                dataframe,
                 index_columns=index_columns,
                 batch_size=batch_size,
-                allow_overwrite=allow_overwrite,
+                compression=active_compression,
+                workers=workers,
                 show_progress=show_progress,
-                **{
-                    **schema_utils.build_parquet_compression_kwargs(dataframe.columns, active_compression),
-                    **pq_write_kwargs,
-                },
+                **pq_write_kwargs,
             )
+            self._refresh_path_bound_state()
+            self._extract_column_dtypes()
+            self.compression = active_compression
+            return self
         else:
-            if len(dataframe) != int(ParquetFile(self.blockmodel_path).metadata.num_rows):
+            num_rows = metadata_cache.get_file_metadata(self.blockmodel_path).num_rows
+            if len(dataframe) != num_rows:
                 raise ValueError(
                     f"DataFrame row count ({len(dataframe)}) does not match "
-                    f"block model rows ({int(ParquetFile(self.blockmodel_path).metadata.num_rows)})."
+                    f"block model rows ({num_rows})."
                 )
             missing_columns = [col for col in self.columns if col not in dataframe.columns]
             if missing_columns:
@@ -2073,94 +3347,446 @@ class ParquetBlockModel:
                     "DataFrame is missing required on-disk columns for strict write: "
                     f"{missing_columns}. Use merge=True to append only new columns."
                 )
-            self._persist_dataframe(dataframe, compression_policy=active_compression)
+            self._persist_dataframe(
+                dataframe,
+                compression_policy=active_compression,
+                batch_size=batch_size,
+                row_group_size=row_group_size,
+            )
             return self
 
-        schema = pq.read_schema(self.blockmodel_path)
-        current_meta = dict(schema.metadata or {})
-        desired_meta = self._build_schema_metadata(
-            geometry=self.geometry,
-            schema=self.schema,
-            base_metadata=current_meta,
-            compression=active_compression,
-        )
-        if current_meta != desired_meta:
-            table = pq.read_table(self.blockmodel_path)
-            meta = dict(table.schema.metadata or {})
-            meta = self._build_schema_metadata(
-                geometry=self.geometry,
-                schema=self.schema,
-                base_metadata=meta,
-                compression=active_compression,
+    def _prepare_column_merge(
+        self, dataframe: pd.DataFrame, index_columns: list[str]
+    ) -> tuple[pd.Index, pa.Table]:
+        """Validate a merge payload; return its key index and new columns as Arrow."""
+        missing_index = [col for col in index_columns if col not in dataframe.columns]
+        if missing_index:
+            raise KeyError(f"Index columns missing from input DataFrame: {missing_index}")
+        extra_columns = [col for col in dataframe.columns if col not in index_columns]
+        duplicate_columns = [col for col in extra_columns if col in self.columns]
+        if duplicate_columns:
+            raise ValueError(
+                "Input DataFrame contains columns already present in the source parquet "
+                f"file: {duplicate_columns}"
+            )
+        if dataframe.duplicated(list(index_columns)).any():
+            raise ValueError(
+                "Input DataFrame contains duplicate keys for index_columns; wide "
+                "concatenation requires unique key rows."
             )
-            table = table.replace_schema_metadata(meta)
-            pq.write_table(
-                table,
+
+        keys = dataframe.set_index(list(index_columns)).index
+        # Build the hash table once, before partition threads share the index.
+        keys.get_indexer(keys[:1])
+        return keys, pa.Table.from_pandas(dataframe[extra_columns], preserve_index=False)
+
+    @staticmethod
+    def _align_merge_columns(
+        key_rows: Union[pa.Table, pa.RecordBatch], keys: pd.Index, extra_table: pa.Table
+    ) -> pa.Table:
+        """Return the rows of ``extra_table`` matching ``key_rows``, null where absent."""
+        batch_keys = key_rows.select(list(keys.names)).to_pandas()
+        lookup = (
+            pd.MultiIndex.from_frame(batch_keys)
+            if batch_keys.shape[1] > 1
+            else pd.Index(batch_keys.iloc[:, 0])
+        )
+        positions = keys.get_indexer(lookup)
+        return extra_table.take(pa.array(positions, mask=positions < 0))
+
+    def _merge_column_family(
+        self,
+        dataframe: pd.DataFrame,
+        *,
+        index_columns: list[str],
+        compression: dict[str, typing.Any],
+        show_progress: bool = False,
+        **pq_write_kwargs: object,
+    ) -> None:
+        """Store the new columns of ``dataframe`` as a row-aligned column family."""
+        keys, extra_table = self._prepare_column_merge(dataframe, index_columns)
+        file_metadata = metadata_cache.get_file_metadata(self.blockmodel_path)
+        parquet_file = self._open_parquet_file()
+        row_groups = range(parquet_file.metadata.num_row_groups)
+        progress = tqdm(row_groups, desc="Writing column family", unit="row group") if show_progress else row_groups
+
+        def aligned_tables() -> Iterator[pa.Table]:
+            for rg in progress:
+                key_rows = parquet_file.read_row_group(rg, columns=list(index_columns))
+                yield self._align_merge_columns(key_rows, keys, extra_table)
+
+        try:
+            column_sidecars.write_family(
                 self.blockmodel_path,
-                **schema_utils.build_parquet_compression_kwargs(table.column_names, active_compression),
+                file_metadata.sidecars,
+                file_fingerprint(self.blockmodel_path),
+                aligned_tables(),
+                extra_table.schema,
+                compression_policy=compression,
+                **{
+                    **schema_utils.build_parquet_compression_kwargs(extra_table.column_names, compression),
+                    **pq_write_kwargs,
+                },
             )
+        finally:
+            parquet_file.close()
 
-        self.pf = ParquetFile(self.blockmodel_path)
-        self.data = LazyParquetDF(self.blockmodel_path)
-        self.columns = pq.read_schema(self.blockmodel_path).names
-        self.attributes = [col for col in self.columns if col not in self.POSITION_COLUMNS]
-        self._centroid_index = None
-        self._extract_column_dtypes()
-        self.compression = active_compression
+    def _merge_columns(
+        self,
+        dataframe: pd.DataFrame,
+        *,
+        index_columns: list[str],
+        batch_size: int,
+        compression: dict[str, typing.Any],
+        workers: int = 1,
+        show_progress: bool = False,
+        **pq_write_kwargs: object,
+    ) -> None:
+        """Append ``dataframe`` columns to every row, writing the model once.
+
+        Rows are streamed and left-joined on ``index_columns``, and the
+        output footer already carries the updated geometry, schema and
+        compression metadata, so no second rewrite is needed. Column
+        families are folded in along the way. For a ``.pbmd`` dataset each
+        partition is merged independently, so partitions are rewritten
+        concurrently. New columns keep the types of ``dataframe``, with
+        nulls for rows that ``dataframe`` does not cover.
+        """
+        keys, extra_table = self._prepare_column_merge(dataframe, index_columns)
+        extra_columns = extra_table.column_names
+        source_schema = metadata_cache.get_file_metadata(self.blockmodel_path).schema_arrow
+        schema_metadata = self._build_schema_metadata(
+            geometry=self.geometry,
+            schema=self._schema,
+            base_metadata=dict(source_schema.metadata or {}),
+            compression=compression,
+        )
+        target_schema = pa.schema(
+            list(source_schema) + [extra_table.schema.field(col) for col in extra_columns],
+            metadata=schema_metadata,
+        )
+        write_kwargs = {
+            **schema_utils.build_parquet_compression_kwargs(target_schema.names, compression),
+            **pq_write_kwargs,
+        }
+
+        progress = tqdm(
+            total=metadata_cache.get_file_metadata(self.blockmodel_path).num_rows,
+            desc="Concatenating columns",
+            unit="row",
+        ) if show_progress else None
+
+        def merge_into(parquet_file: typing.Any, target: Path) -> None:
+            writer = pq.ParquetWriter(target, target_schema, **write_kwargs)
+            try:
+                for batch in parquet_file.iter_batches(batch_size=batch_size):
+                    taken = self._align_merge_columns(batch, keys, extra_table)
+                    table = pa.Table.from_batches([batch])
+                    for col in extra_columns:
+                        table = table.append_column(target_schema.field(col), taken.column(col))
+                    writer.write_table(table.cast(target_schema))
+                    if progress is not None:
+                        progress.update(batch.num_rows)
+            finally:
+                writer.close()
+                parquet_file.close()
 
-        return self
+        try:
+            if self.is_partitioned:
+                pbm_dataset.rewrite_partitions(
+                    self.blockmodel_path,
+                    lambda source, target: merge_into(pq.ParquetFile(source), target),
+                    metadata_payload=schema_utils.decode_embedded_metadata(schema_metadata),
+                    workers=workers,
+                )
+            else:
+                parquet_file = self._open_parquet_file()
+                with atomic_output_file(self.blockmodel_path) as tmp_path:
+                    merge_into(parquet_file, tmp_path)
+                column_sidecars.remove_sidecars(self.blockmodel_path)
+        finally:
+            if progress is not None:
+                progress.close()
 
     def compress(
         self,
         level: int = 5,
         policy: Optional[dict[str, typing.Any]] = None,
+        prefetch: int = 0,
+        workers: int = 1,
     ) -> "ParquetBlockModel":
-        """Rewrite the backing file with archive compression."""
+        """Rewrite the backing file with archive compression.
+
+        ``prefetch`` batches are decoded ahead on a background thread while
+        the current batch is compressed and written (``0`` disables it).
+        For a ``.pbmd`` dataset, ``workers`` partitions are recompressed
+        concurrently.
+        """
         if level < 0:
             raise ValueError("level must be >= 0")
 
         archive_policy = schema_utils.resolve_archive_compression_policy(
-            schema=self.schema,
+            schema=self._schema,
             level=level,
             policy=policy,
         )
 
+        if self.is_partitioned:
+            self.pf = None  # type: ignore[assignment]
+            self.data = None  # type: ignore[assignment]
+            metadata = schema_utils.with_sort_order(
+                schema_utils.build_schema_metadata(
+                    geometry=self.geometry,
+                    schema=self._schema,
+                    compression=archive_policy,
+                ),
+                self.sort_order,
+            )
+            pbm_dataset.rewrite_partitions(
+                self.blockmodel_path,
+                lambda source, target: self._copy_parquet(pq.ParquetFile(source), target, archive_policy, prefetch),
+                metadata_payload=schema_utils.decode_embedded_metadata(metadata),
+                workers=workers,
+            )
+            self._refresh_path_bound_state()
+            self._extract_column_dtypes()
+            self.compression = archive_policy
+            return self
+
+        return self._rewrite_file(archive_policy, prefetch=prefetch)
+
+    def compact(self, prefetch: int = 0) -> "ParquetBlockModel":
+        """Fold column-family sidecars back into the backing ``.pbm`` file.
+
+        ``write(merge=True)`` stores new columns in row-aligned sidecar files
+        (see :mod:`parq_blockmodel.io.column_sidecars`) so that adding a
+        column only writes that column. Compacting rewrites the backing file
+        once with all columns, keeping the current compression policy, and
+        removes the sidecars. Family columns keep the compression they were
+        written with, as per-column overrides of the policy. It does nothing
+        when no sidecars are attached.
+        """
+        sidecars = metadata_cache.get_file_metadata(self.blockmodel_path).sidecars
+        if self.is_partitioned or sidecars is None:
+            return self
+        policy = copy.deepcopy(self.compression or schema_utils.resolve_active_compression_policy("fast"))
+        columns = policy.setdefault("columns", {})
+        for family in sidecars.families:
+            if family.compression is None:
+                continue
+            for col in family.columns:
+                spec = (family.compression.get("columns") or {}).get(col, family.compression.get("default"))
+                if spec is not None and spec != policy.get("default"):
+                    columns.setdefault(col, spec)
+        return self._rewrite_file(policy, prefetch=prefetch)
+
+    def _rewrite_file(self, policy: dict[str, typing.Any], prefetch: int = 0) -> "ParquetBlockModel":
+        """Rewrite the backing file with ``policy``, folding in any column families."""
+        parquet_file = self._open_parquet_file()
         self.pf = None  # type: ignore[assignment]
         self.data = None  # type: ignore[assignment]
-
         with atomic_output_file(self.blockmodel_path) as tmp_path:
-            parquet_file = pq.ParquetFile(self.blockmodel_path)
+            self._copy_parquet(parquet_file, tmp_path, policy, prefetch)
+        column_sidecars.remove_sidecars(self.blockmodel_path)
+
+        self._refresh_path_bound_state()
+        self._extract_column_dtypes()
+        self.compression = policy
+        return self
+
+    def _copy_parquet(
+        self, parquet_file: typing.Any, target: Path, policy: dict[str, typing.Any], prefetch: int = 0
+    ) -> None:
+        """Stream ``parquet_file`` to ``target`` with ``policy`` and current metadata."""
+        schema = parquet_file.schema_arrow
+        metadata = schema_utils.build_schema_metadata(
+            geometry=self.geometry,
+            schema=self._schema,
+            base_metadata=dict(schema.metadata or {}),
+            compression=policy,
+        )
+        writer = pq.ParquetWriter(
+            target,
+            schema.with_metadata(metadata),
+            **schema_utils.build_parquet_compression_kwargs(schema.names, policy),
+        )
+        batches = read_utils.prefetch_iter(parquet_file.iter_batches(batch_size=1_000_000), prefetch)
+        try:
+            for batch in batches:
+                writer.write_batch(batch)
+        finally:
+            batches.close()
+            writer.close()
+            try:
+                parquet_file.close()
+            except Exception:
+                pass
+
+    def recluster(
+        self,
+        order: typing.Literal["block_id", "morton", "hilbert", "k_bench"] = "block_id",
+        row_group_size: int = 1_000_000,
+        run_rows: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+        workers: int = 1,
+    ) -> "ParquetBlockModel":
+        """Rewrite the backing file with its rows sorted in a spatial order.
+
+        Row-group min/max statistics only help pruning when row order follows
+        the queried columns. Re-clustering sorts the rows with an external
+        merge sort (see :mod:`parq_blockmodel.io.external_sort`), so files
+        larger than memory can be re-sorted, and records the order in the
+        metadata (see :attr:`sort_order`). Column-family sidecars are folded
+        in; the compression policy is kept.
+
+        Parameters
+        ----------
+        order : {"block_id", "morton", "hilbert", "k_bench"}, default "block_id"
+            ``"block_id"`` restores canonical C-order over ``(i, j, k)``.
+            ``"morton"`` and ``"hilbert"`` sort along that curve through the
+            block centroids, using the ``world_id`` encoding parameters (so
+            ``world_id`` itself is monotone when it uses the same curve).
+            ``"k_bench"`` sorts bench by bench, then by ``block_id``.
+        row_group_size : int, default 1_000_000
+            Rows per row group of the rewritten file.
+        run_rows : int, optional
+            Rows sorted in memory before spilling a run to disk. Defaults to
+            ``4 * row_group_size``.
+        spill_dir : Path, optional
+            Directory for temporary runs. Defaults to the directory of the
+            file being written.
+        workers : int, default 1
+            Number of partitions re-sorted concurrently for a ``.pbmd``
+            dataset, where each partition is sorted independently.
+
+        Returns
+        -------
+        ParquetBlockModel
+            ``self``, backed by the re-clustered file.
+        """
+        if order not in self.CLUSTER_ORDERS:
+            raise ValueError(f"order must be one of {self.CLUSTER_ORDERS}, got {order!r}.")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be > 0")
+        if run_rows is not None and run_rows <= 0:
+            raise ValueError("run_rows must be > 0")
+        if "block_id" not in self.columns:
+            raise ValueError("Re-clustering requires a persisted block_id column.")
+
+        key = self._cluster_key(order)
+        sorted_columns = self._cluster_sorted_columns(order)
+        sort_order = {"order": order, "columns": sorted_columns}
+        policy = self.compression or schema_utils.resolve_active_compression_policy("fast")
+
+        def rewrite(parquet_file: typing.Any, target: Path) -> None:
             schema = parquet_file.schema_arrow
-            metadata = schema_utils.build_schema_metadata(
-                geometry=self.geometry,
-                schema=self.schema,
-                base_metadata=dict(schema.metadata or {}),
-                compression=archive_policy,
+            metadata = schema_utils.with_sort_order(
+                schema_utils.build_schema_metadata(
+                    geometry=self.geometry,
+                    schema=self._schema,
+                    base_metadata=dict(schema.metadata or {}),
+                    compression=policy,
+                ),
+                sort_order,
             )
             writer = pq.ParquetWriter(
-                tmp_path,
+                target,
                 schema.with_metadata(metadata),
-                **schema_utils.build_parquet_compression_kwargs(schema.names, archive_policy),
+                sorting_columns=[pq.SortingColumn(schema.get_field_index(col)) for col in sorted_columns] or None,
+                **schema_utils.build_parquet_compression_kwargs(schema.names, policy),
+            )
+            tables = external_sort.sort_batches(
+                parquet_file.iter_batches(batch_size=row_group_size),
+                key,
+                output_rows=row_group_size,
+                run_rows=run_rows or 4 * row_group_size,
+                spill_dir=spill_dir or target.parent,
             )
             try:
-                for batch in parquet_file.iter_batches(batch_size=1_000_000):
-                    writer.write_batch(batch)
+                for table in tables:
+                    writer.write_table(table, row_group_size=row_group_size)
             finally:
+                tables.close()
                 writer.close()
-                try:
-                    parquet_file.close()
-                except Exception:
-                    pass
-
-        self.pf = ParquetFile(self.blockmodel_path)
-        self.data = LazyParquetDF(self.blockmodel_path)
-        self.columns = pq.read_schema(self.blockmodel_path).names
-        self.attributes = [col for col in self.columns if col not in self.POSITION_COLUMNS]
-        self._centroid_index = None
+                parquet_file.close()
+
+        self.pf = None  # type: ignore[assignment]
+        self.data = None  # type: ignore[assignment]
+        if self.is_partitioned:
+            metadata = schema_utils.with_sort_order(
+                schema_utils.build_schema_metadata(geometry=self.geometry, schema=self._schema, compression=policy),
+                sort_order,
+            )
+            pbm_dataset.rewrite_partitions(
+                self.blockmodel_path,
+                lambda source, target: rewrite(pq.ParquetFile(source), target),
+                metadata_payload=schema_utils.decode_embedded_metadata(metadata),
+                workers=workers,
+            )
+        else:
+            parquet_file = self._open_parquet_file()
+            with atomic_output_file(self.blockmodel_path) as tmp_path:
+                rewrite(parquet_file, tmp_path)
+            column_sidecars.remove_sidecars(self.blockmodel_path)
+
+        self._refresh_path_bound_state()
         self._extract_column_dtypes()
-        self.compression = archive_policy
+        self.compression = policy
         return self
 
+    def _cluster_key(self, order: str) -> typing.Callable[[pa.Table], np.ndarray]:
+        """Return a function computing the ``order`` sort key of a table from its block ids."""
+        geometry = self.geometry
+
+        def block_ids(table: pa.Table) -> np.ndarray:
+            return np.asarray(table.column("block_id")).astype(np.uint64)
+
+        if order == "block_id":
+            return block_ids
+        if order == "k_bench":
+            # (k, block_id) in lexicographic order, as the single key k * n_blocks + block_id.
+            n_blocks = int(np.prod(geometry.local.shape))
+            if int(geometry.local.shape[2]) * n_blocks > np.iinfo(np.uint64).max:
+                raise ValueError("The grid is too large for a 'k_bench' sort key.")
+
+            def bench_key(table: pa.Table) -> np.ndarray:
+                ids = block_ids(table)
+                _, _, k = geometry.ijk_from_row_index(ids.astype(np.int64))
+                return np.asarray(k, dtype=np.uint64) * np.uint64(n_blocks) + ids
+
+            return bench_key
+
+        encoding = geometry.world_id_encoding
+        if encoding is None:
+            extents = geometry.extents
+            encoding = ingest_utils.build_world_id_encoding_from_xyz(
+                np.array([extents.xmin, extents.xmax], dtype=float),
+                np.array([extents.ymin, extents.ymax], dtype=float),
+                np.array([extents.zmin, extents.zmax], dtype=float),
+            )
+        offset, scale, bits_per_axis = get_world_id_encoding_params(encoding)
+
+        def curve_key(table: pa.Table) -> np.ndarray:
+            # Sort on the signed ids as stored, so that a persisted world_id is
+            # monotone even when 64-bit codes set the sign bit.
+            x, y, z = geometry.xyz_from_row_index(block_ids(table).astype(np.int64))
+            return np.asarray(encode_world_coordinates(
+                x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=order
+            ), dtype=np.int64)
+
+        return curve_key
+
+    def _cluster_sorted_columns(self, order: str) -> list[str]:
+        """Persisted columns that are (lexicographically) monotone after sorting by ``order``."""
+        if order == "block_id":
+            return ["block_id"]
+        if order == "k_bench":
+            return ["k", "block_id"] if "k" in self.columns else []
+        encoding = self.geometry.world_id_encoding
+        if "world_id" in self.columns and encoding is not None and get_world_id_curve(encoding) == order:
+            return ["world_id"]
+        return []
+
     def triangulate(
         self,
         attributes: Optional[list[str]] = None,
@@ -2380,14 +4006,14 @@ class ParquetBlockModel:
             attributes = self.available_attributes
 
         if grid_type == "image":
-            from parq_blockmodel.utils.pyvista.pyvista_utils import df_to_pv_image_data
-            # Read in canonical ijk order (rotation-invariant) so values map
-            # to cells correctly for both local and world frames.
-            df = self.read(columns=attributes, index="ijk", dense=True)
-            grid = df_to_pv_image_data(
-                df=df,
+            from parq_blockmodel.utils.pyvista.pyvista_utils import dense_arrays_to_pv_image_data
+            # Scatter straight into canonical C-order ijk arrays (rotation-invariant)
+            # so values map to cells correctly for both local and world frames.
+            arrays, categories = self.read_dense_arrays(columns=attributes)
+            grid = dense_arrays_to_pv_image_data(
+                arrays=arrays,
                 geometry=self.geometry,
-                categorical_encode=True,
+                categories=categories,
                 frame=frame,
             )
         elif grid_type == "structured":
@@ -2460,25 +4086,38 @@ class ParquetBlockModel:
         return df
 
     def to_dense_parquet(self, filepath: Path,
-                         chunk_size: int = 100_000, show_progress: bool = False) -> None:
+                         chunk_size: int = 100_000, show_progress: bool = False,
+                         prefetch: int = 0) -> None:
         """
         Export the block model as a **dense** xyz-indexed Parquet file.
 
         The underlying ``.pbm`` may be sparse with respect to the dense
-        ijk grid encoded by :attr:`geometry`. This helper iterates over
-        the on‑disk data in chunks, reindexes each chunk to the full
-        dense centroid MultiIndex ``geometry.to_multi_index_xyz()`` and
-        writes the result to ``filepath``.
+        ijk grid encoded by :attr:`geometry`. This helper writes the full
+        grid to ``filepath`` in C-order chunks of ``chunk_size`` blocks
+        indexed by centroid ``(x, y, z)``. Each chunk is built only from the
+        rows whose ``block_id`` falls in the chunk (pushed down as a
+        ``block_id`` range), so memory is bounded by the chunk rather than
+        the grid. Persisted positional columns (``block_id``, ``world_id``,
+        ``i``, ``j``, ``k``) are regenerated from :attr:`geometry`; missing
+        attribute values are null. Categorical columns keep their source
+        categories and ``ordered`` flag.
+
+        Chunks are read with row-group pruning on ``block_id`` statistics,
+        which is most effective for files in ``block_id`` order; models
+        re-clustered in another order (see :meth:`recluster`) rescan the row
+        groups overlapping each chunk.
 
         Parameters
         ----------
         filepath : Path
             Target path for the exported Parquet file.
         chunk_size : int, default 100_000
-            Number of rows to process per chunk when reading from the
-            backing ``.pbm`` file.
+            Number of dense grid blocks per output chunk.
         show_progress : bool, default False
             If True, display a progress bar while exporting.
+        prefetch : int, default 0
+            Number of batches to decode ahead on a background thread while
+            reading the backing file; see :meth:`iter_read`.
 
         Notes
         -----
@@ -2487,23 +4126,93 @@ class ParquetBlockModel:
         representation of the block model remains the ``.pbm`` file with
         embedded :class:`RegularGeometry` metadata.
         """
-        columns = self.columns
-        dense_index = self.geometry.to_multi_index_xyz()
-        parquet_file = pq.ParquetFile(self.blockmodel_path)
-        total_rows = parquet_file.metadata.num_rows
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        columns = self.persisted_attributes
+        file_metadata = metadata_cache.get_file_metadata(self.blockmodel_path)
+        schema = file_metadata.schema_arrow
+        categorical = [
+            col for col in columns
+            if pa.types.is_dictionary(schema.field(col).type)
+            or pa.types.is_string(schema.field(col).type)
+            or pa.types.is_large_string(schema.field(col).type)
+        ]
+        dtypes: dict[str, typing.Any] = {
+            col: schema.field(col).type.to_pandas_dtype() for col in columns if col not in categorical
+        }
+        if categorical:
+            dtypes.update(read_utils.collect_categories(
+                self._iter_batches(categorical, batch_size=chunk_size, prefetch=prefetch)
+            ))
+        positional_columns = self._positional_columns()
+        carried_columns = [col for col in positional_columns if col not in columns]
+        positional = [c for c in self.position_columns if c not in {"x", "y", "z"}]
+        world_id_params = None
+        if "world_id" in positional and self.geometry.world_id_encoding:
+            world_id_params = (
+                *get_world_id_encoding_params(self.geometry.world_id_encoding),
+                get_world_id_curve(self.geometry.world_id_encoding),
+            )
+
+        total_rows = int(np.prod(self.geometry.local.shape))
+        complete = file_metadata.num_rows == total_rows
         total_batches = max(math.ceil(total_rows / chunk_size), 1)
+        block_id_field = pc.field("block_id")
 
         progress = tqdm(total=total_batches, desc="Exporting", disable=not show_progress) if show_progress else None
 
         with atomic_output_file(filepath) as tmp_path:
             writer = None
             try:
-                for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
-                    df = pa.Table.from_batches([batch]).to_pandas()
-                    df = df.reindex(dense_index)
-                    table = pa.Table.from_pandas(df)
+                for start in range(0, total_rows, chunk_size):
+                    block_ids = np.arange(start, min(start + chunk_size, total_rows), dtype=np.int64)
+                    builders = {
+                        col: read_utils.DenseColumnBuilder(block_ids.size, complete=complete, dtype=dtypes[col])
+                        for col in columns
+                    }
+                    chunk_filter = (block_id_field >= start) & (block_id_field < start + block_ids.size)
+                    for batch in self._iter_batches(
+                        columns + carried_columns,
+                        batch_size=chunk_size,
+                        filter_expression=chunk_filter,
+                        prefetch=prefetch,
+                    ):
+                        if batch.num_rows == 0:
+                            continue
+                        offsets = self._block_ids_from_columns(
+                            read_utils.arrow_to_numpy(batch.select(positional_columns))
+                        ).astype(np.int64) - start
+                        for col, builder in builders.items():
+                            builder.add(offsets, batch.column(col))
+
+                    x, y, z = self.geometry.xyz_from_row_index(block_ids)
+                    data: dict[str, typing.Any] = {}
+                    if "block_id" in positional:
+                        data["block_id"] = block_ids
+                    if "world_id" in positional and world_id_params is not None:
+                        offset, scale, bits_per_axis, curve = world_id_params
+                        data["world_id"] = encode_world_coordinates(
+                            x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
+                        )
+                    if {"i", "j", "k"} & set(positional):
+                        for name, values in zip(["i", "j", "k"], self.geometry.ijk_from_row_index(block_ids)):
+                            if name in positional:
+                                data[name] = values
+                    for col, builder in builders.items():
+                        values, categories = builder.finish((block_ids.size,))
+                        if categories is not None:
+                            data[col] = pd.Categorical.from_codes(values, dtype=dtypes[col])
+                        else:
+                            data[col] = values
+                    df = pd.DataFrame(data, index=pd.MultiIndex.from_arrays([x, y, z], names=["x", "y", "z"]))
+                    df = self._coerce_special_column_dtypes(df)
                     if writer is None:
+                        table = pa.Table.from_pandas(df)
                         writer = pq.ParquetWriter(tmp_path, table.schema)
+                    else:
+                        # Chunks may differ in null placement (e.g. a float chunk
+                        # of an integer column); keep the first chunk's schema.
+                        table = pa.Table.from_pandas(df, schema=writer.schema)
                     writer.write_table(table)
                     if progress:
                         progress.update(1)
@@ -2513,6 +4222,92 @@ class ParquetBlockModel:
                 if progress:
                     progress.close()
 
+    def to_partitioned(
+        self,
+        filepath: Path,
+        partition_by: typing.Literal["k", "world_id"] = "k",
+        partition_size: Optional[int] = None,
+        row_group_size: int = 1_000_000,
+        workers: int = 1,
+        overwrite: bool = False,
+    ) -> "ParquetBlockModel":
+        """
+        Write the block model as a partitioned ``.pbmd`` dataset.
+
+        Rows are routed to partition files by bench range or by Morton tile
+        of ``world_id`` (see :mod:`parq_blockmodel.io.pbm_dataset`). The
+        dataset carries the same geometry, schema and compression metadata in
+        its manifest and opens as a :class:`ParquetBlockModel` like a ``.pbm``
+        file; filtered reads only scan the partitions that can match.
+
+        Parameters
+        ----------
+        filepath : Path
+            Target dataset directory; must have a ``.pbmd`` suffix.
+        partition_by : {"k", "world_id"}, default "k"
+            Partition by ranges of ``k`` or by the high bits of ``world_id``.
+            ``"world_id"`` requires a persisted ``world_id`` column
+            (see :meth:`ensure_world_id`).
+        partition_size : int, optional
+            Benches per partition for ``"k"``, or the number of low
+            ``world_id`` bits within one tile for ``"world_id"``. Defaults
+            to a size giving about
+            :data:`~parq_blockmodel.io.pbm_dataset.DEFAULT_PARTITION_COUNT`
+            partitions.
+        row_group_size : int, default 1_000_000
+            Rows read per batch and buffered per partition before a flush.
+        workers : int, default 1
+            Number of partition files written concurrently.
+        overwrite : bool, default False
+            If True, replace an existing dataset at ``filepath``.
+
+        Returns
+        -------
+        ParquetBlockModel
+            A block model backed by the new dataset.
+        """
+        filepath = Path(filepath)
+        if not pbm_dataset.is_dataset_path(filepath):
+            raise ValueError(f"filepath must have a '{pbm_dataset.DATASET_SUFFIX}' extension.")
+        if filepath.resolve() == self.blockmodel_path.resolve():
+            raise ValueError("Cannot partition a block model into its own backing path.")
+        if filepath.exists() and not overwrite:
+            raise FileExistsError(f"Target dataset already exists: {filepath}")
+        if partition_by not in pbm_dataset.PARTITION_SCHEMES:
+            raise ValueError(f"partition_by must be one of {pbm_dataset.PARTITION_SCHEMES}, got {partition_by!r}.")
+        if partition_by == "world_id" and "world_id" not in self.columns:
+            raise ValueError("Partitioning by world_id requires a persisted world_id column; call ensure_world_id().")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be > 0")
+
+        if partition_size is None:
+            world_ids = None
+            if partition_by == "world_id":
+                world_ids = read_utils.arrow_to_numpy(self._read_table(columns=["world_id"]))["world_id"]
+            partition_size = pbm_dataset.default_partition_size(self.geometry, partition_by, world_ids)
+
+        source_schema = metadata_cache.get_file_metadata(self.blockmodel_path).schema_arrow
+        schema_metadata = self._build_schema_metadata(
+            geometry=self.geometry,
+            schema=self._schema,
+            base_metadata=dict(source_schema.metadata or {}),
+            compression=self.compression,
+        )
+        pbm_dataset.write_dataset(
+            filepath,
+            self._iter_batches(self.columns, batch_size=row_group_size),
+            geometry=self.geometry,
+            partition_by=partition_by,
+            partition_size=partition_size,
+            schema_metadata=schema_metadata,
+            compression_kwargs=self._dataset_write_kwargs(self.compression),
+            metadata_payload=schema_utils.decode_embedded_metadata(schema_metadata),
+            schema=source_schema,
+            row_group_size=row_group_size,
+            workers=workers,
+        )
+        return type(self)(filepath, name=self.name, engine_initializer=self._engine_initializer)
+
 # ---------------------------------------------------------------------------
 # Backwards-compatible private helper for tests
 # ---------------------------------------------------------------------------
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Mapping, Any
+from typing import Optional, Mapping, Any, Iterable, Callable
 
 import json
 import numpy as np
@@ -13,6 +13,16 @@ from parq_blockmodel.utils.geometry_utils import (
 )
 
 
+def _merge_sorted_unique(unique_values: np.ndarray, values: Any) -> np.ndarray:
+    """Merge the distinct ``values`` into the sorted unique array ``unique_values``."""
+    new_values = np.unique(np.asarray(values, dtype=float))
+    if not unique_values.size:
+        return new_values
+    positions = np.searchsorted(unique_values, new_values)
+    present = unique_values[np.minimum(positions, unique_values.size - 1)] == new_values
+    return np.insert(unique_values, positions[~present], new_values[~present])
+
+
 @dataclass
 class LocalGeometry:
     """Local dense grid geometry with C-order indexing.
@@ -41,8 +51,8 @@ class LocalGeometry:
         self.shape = (shape[0], shape[1], shape[2])
 
     @property
-    def centroids_uvw(self) -> np.ndarray:
-        """Compute local centroids as a (3, N) array in C-order."""
+    def axis_centroids_uvw(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Local centroid coordinates along each axis, as 1D arrays of length ni, nj, nk."""
         dx, dy, dz = self.block_size
         ni, nj, nk = self.shape
         cu, cv, cw = self.corner
@@ -50,7 +60,12 @@ class LocalGeometry:
         u = np.arange(cu + dx / 2, cu + dx * ni, dx)
         v = np.arange(cv + dy / 2, cv + dy * nj, dy)
         w = np.arange(cw + dz / 2, cw + dz * nk, dz)
+        return u, v, w
 
+    @property
+    def centroids_uvw(self) -> np.ndarray:
+        """Compute local centroids as a (3, N) array in C-order."""
+        u, v, w = self.axis_centroids_uvw
         uu, vv, ww = np.meshgrid(u, v, w, indexing="ij")
         return np.vstack([uu.ravel("C"), vv.ravel("C"), ww.ravel("C")])
 
@@ -198,10 +213,14 @@ class Extents:
         """
         geom = self._geometry
 
-        # Get centroid bounds and block dimensions
-        cx_min, cx_max = float(geom.centroid_x.min()), float(geom.centroid_x.max())
-        cy_min, cy_max = float(geom.centroid_y.min()), float(geom.centroid_y.max())
-        cz_min, cz_max = float(geom.centroid_z.min()), float(geom.centroid_z.max())
+        # Get centroid bounds and block dimensions; unrotated grids only need the axis vectors.
+        if geom.is_rotated:
+            cx, cy, cz = geom.centroid_x, geom.centroid_y, geom.centroid_z
+        else:
+            cx, cy, cz = geom.centroid_axes
+        cx_min, cx_max = float(cx.min()), float(cx.max())
+        cy_min, cy_max = float(cy.min()), float(cy.max())
+        cz_min, cz_max = float(cz.min()), float(cz.max())
 
         dx, dy, dz = geom.local.block_size
 
@@ -456,6 +475,65 @@ class RegularGeometry:
     # Centroid calculation (C‑order)
     # ----------------------------------------------------------------------
 
+    # Centroid arrays are memoized per geometry. The cache is keyed on the values
+    # that define the lattice, so mutating ``local`` or ``world`` invalidates it,
+    # and cached arrays are read-only so callers cannot corrupt them.
+
+    def _centroid_cache_key(self) -> tuple:
+        local, world = self.local, self.world
+        return (local.corner, local.block_size, local.shape, world.origin, world.axis_u, world.axis_v, world.axis_w)
+
+    def _cached_centroids(self, name: str, compute: Callable[[], Any]) -> Any:
+        key = self._centroid_cache_key()
+        cache = self.__dict__.get("_centroid_cache")
+        if cache is None or cache[0] != key:
+            cache = (key, {})
+            self.__dict__["_centroid_cache"] = cache
+        if name not in cache[1]:
+            value = compute()
+            for array in value if isinstance(value, tuple) else (value,):
+                array.flags.writeable = False
+            cache[1][name] = value
+        return cache[1][name]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Keep pickles and deep copies small; the cache is rebuilt on demand.
+        state = self.__dict__.copy()
+        state.pop("_centroid_cache", None)
+        return state
+
+    @property
+    def centroid_axes(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """World centroid coordinates along each axis of an unrotated grid.
+
+        Returns ``(x, y, z)`` 1D arrays of length ni, nj and nk; the centroid of
+        block ``(i, j, k)`` is ``(x[i], y[j], z[k])``. Use :attr:`centroid_grids`
+        for broadcast ``(ni, nj, nk)`` views that allocate nothing per block.
+
+        Raises:
+            ValueError: If the geometry is rotated (coordinates are not separable).
+        """
+        if self.is_rotated:
+            raise ValueError("Centroid coordinates are only separable per axis for unrotated geometries.")
+
+        def compute() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            u, v, w = self.local.axis_centroids_uvw
+            ox, oy, oz = self.world.origin
+            return ox + u, oy + v, oz + w
+
+        return self._cached_centroids("axes", compute)
+
+    @property
+    def centroid_grids(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read-only ``(ni, nj, nk)`` broadcast views of the x, y and z centroids of an unrotated grid."""
+        x, y, z = self.centroid_axes
+        shape = self.local.shape
+        return (
+            np.broadcast_to(x[:, None, None], shape),
+            np.broadcast_to(y[None, :, None], shape),
+            np.broadcast_to(z[None, None, :], shape),
+        )
+
     @property
     def _centroids(self) -> np.ndarray:
         """Compute world XYZ centroids as a (3, N) array in **C‑order**.
@@ -464,20 +542,43 @@ class RegularGeometry:
             np.ndarray: Array of shape (3, N), where N = ni*nj*nk.
                         First row = X, second = Y, third = Z.
         """
-        local = self.local.centroids_uvw
-        return self.world.local_to_world(local)
+        if not self.is_rotated:
+            return np.vstack([self.centroid_x, self.centroid_y, self.centroid_z])
+        return self._cached_centroids("xyz", lambda: self.world.local_to_world(self.local.centroids_uvw))
+
+    def _centroid_axis(self, axis: int) -> NDArray[np.floating]:
+        if self.is_rotated:
+            return self._centroids[axis]
+        grid = self.centroid_grids[axis]
+        return self._cached_centroids("xyz"[axis], lambda: grid.reshape(-1))
 
     @property
     def centroid_x(self) -> NDArray[np.floating]:
-        return self._centroids[0]
+        return self._centroid_axis(0)
 
     @property
     def centroid_y(self) -> NDArray[np.floating]:
-        return self._centroids[1]
+        return self._centroid_axis(1)
 
     @property
     def centroid_z(self) -> NDArray[np.floating]:
-        return self._centroids[2]
+        return self._centroid_axis(2)
+
+    def evaluate_xy(self, func: Callable[[np.ndarray, np.ndarray], Any]) -> np.ndarray:
+        """Evaluate ``func(x, y)`` at every block centroid, returning a C-order array of length N.
+
+        When the ``w`` axis is vertical, all blocks of an ``(i, j)`` column share
+        their centroid x and y, so ``func`` runs once per column and the result
+        is repeated along ``k``.
+        """
+        if not np.allclose(self.world.axis_w, (0.0, 0.0, 1.0)):
+            return np.asarray(func(self.centroid_x, self.centroid_y))
+        ni, nj, nk = self.local.shape
+        u, v, w = self.local.axis_centroids_uvw
+        uu, vv = np.meshgrid(u, v, indexing="ij")
+        plane = np.vstack([uu.ravel(), vv.ravel(), np.full(ni * nj, w[0] if w.size else 0.0)])
+        world = self.world.local_to_world(plane)
+        return np.repeat(np.asarray(func(world[0], world[1])), nk)
 
     # ----------------------------------------------------------------------
     # Index conversion API (C‑order guaranteed)
@@ -518,6 +619,54 @@ class RegularGeometry:
         i, j, k = self.ijk_from_xyz(x, y, z, tol=tol)
         return np.asarray(self.row_index_from_ijk(i, j, k), dtype=np.int64)
 
+    def ijk_bounds_from_xyz_bounds(
+        self,
+        x: Optional[tuple[float, float]] = None,
+        y: Optional[tuple[float, float]] = None,
+        z: Optional[tuple[float, float]] = None,
+        tol: float = 1e-6,
+    ) -> Optional[tuple[tuple[int, int], tuple[int, int], tuple[int, int]]]:
+        """Return inclusive ijk ranges covering centroids inside a world-space box.
+
+        Args:
+            x: Inclusive ``(min, max)`` world X bounds; ``None`` is unbounded.
+            y: Inclusive ``(min, max)`` world Y bounds; ``None`` is unbounded.
+            z: Inclusive ``(min, max)`` world Z bounds; ``None`` is unbounded.
+            tol: Tolerance, in blocks, applied when snapping to the centroid lattice.
+
+        Returns:
+            ``((i0, i1), (j0, j1), (k0, k1))`` clipped to the grid, or ``None`` when
+            no centroid can fall inside the box. For unrotated geometries the
+            ranges are exact; for rotated geometries they bound the box in the
+            local frame and may include centroids outside it.
+        """
+        (xmin, ymin, zmin), (xmax, ymax, zmax) = self.extents.axis_aligned_bounds
+        box = [
+            (xmin, xmax) if x is None else (float(x[0]), float(x[1])),
+            (ymin, ymax) if y is None else (float(y[0]), float(y[1])),
+            (zmin, zmax) if z is None else (float(z[0]), float(z[1])),
+        ]
+        if any(lo > hi for lo, hi in box):
+            return None
+
+        world_corners = np.array(
+            [[bx, by, bz] for bx in box[0] for by in box[1] for bz in box[2]],
+            dtype=float,
+        ).T
+        local = self.world.world_to_local(world_corners)
+        ranges = []
+        for axis in range(3):
+            size = self.local.block_size[axis]
+            start = self.local.corner[axis] + 0.5 * size
+            lo = int(np.ceil((local[axis].min() - start) / size - tol))
+            hi = int(np.floor((local[axis].max() - start) / size + tol))
+            lo = max(lo, 0)
+            hi = min(hi, self.local.shape[axis] - 1)
+            if lo > hi:
+                return None
+            ranges.append((lo, hi))
+        return ranges[0], ranges[1], ranges[2]
+
     # ----------------------------------------------------------------------
     # Convenience exports (not used internally)
     # ----------------------------------------------------------------------
@@ -823,6 +972,7 @@ class RegularGeometry:
         axis_dip: float = 0.0,
         axis_plunge: float = 0.0,
         chunk_size: int = 1_000_000,
+        use_statistics: bool = False,
     ) -> "RegularGeometry":
         """Reconstruct geometry from a Parquet file.
 
@@ -831,7 +981,17 @@ class RegularGeometry:
         If that key is missing, fall back to centroid-based inference
         using ``x, y, z`` columns and provided rotation angles.
 
-        .. todo:: Consider efficiency gains by staying in numpy versus using python sets.
+        For unrotated inference with ``use_statistics=True``, the extents
+        come from the Parquet column statistics and the spacing from the
+        first ``chunk_size`` rows, so the centroid columns are not scanned.
+        The estimate is checked against the extents, the sampled centroids
+        and the row count; if any check fails, or statistics are missing,
+        the full scan is used. A sample lacking adjacent centroids along an
+        axis can still overestimate the spacing, so the estimate is opt-in:
+        callers must verify it with a full check such as
+        :func:`parq_blockmodel.io.ingest_utils.validate_geometry` and retry
+        with the exact scan (the default) when it fails, as
+        :meth:`ParquetBlockModel.from_parquet` does.
         """
 
         import pyarrow.parquet as pq
@@ -847,6 +1007,195 @@ class RegularGeometry:
         if not {"x", "y", "z"}.issubset(columns):
             raise ValueError("Parquet file must contain x, y, z columns to infer geometry.")
 
+        if use_statistics and axis_azimuth == 0 and axis_dip == 0 and axis_plunge == 0:
+            geometry = cls._from_parquet_statistics([pf], sample_rows=chunk_size)
+            if geometry is not None:
+                return geometry
+
+        xyz_batches = (
+            (batch.column(0), batch.column(1), batch.column(2))
+            for batch in pf.iter_batches(columns=["x", "y", "z"], batch_size=chunk_size)
+        )
+        return cls.from_centroid_batches(
+            xyz_batches,
+            axis_azimuth=axis_azimuth,
+            axis_dip=axis_dip,
+            axis_plunge=axis_plunge,
+        )
+
+    @classmethod
+    def from_parquet_files(
+        cls,
+        filepaths: Iterable[Any],
+        axis_azimuth: float = 0.0,
+        axis_dip: float = 0.0,
+        axis_plunge: float = 0.0,
+        chunk_size: int = 1_000_000,
+        use_statistics: bool = False,
+    ) -> "RegularGeometry":
+        """Infer the union geometry of several xyz Parquet files.
+
+        Embedded geometry metadata is ignored; the grid covering the
+        centroids of all files is inferred. For unrotated inference with
+        ``use_statistics=True``, extents come from the column statistics of
+        every file and the spacing from a ``chunk_size`` row sample of each
+        file together with the per-file extents, so that, for example,
+        single-bench exports still resolve the vertical spacing. Otherwise,
+        or if the estimate fails verification, the centroids of all files
+        are scanned. See :meth:`from_parquet` for the caveats of the estimate.
+
+        Parameters
+        ----------
+        filepaths : Iterable[str or Path]
+            Source Parquet files containing ``x``, ``y``, ``z`` columns.
+        axis_azimuth, axis_dip, axis_plunge : float
+            Optional rotation angles (degrees) defining the orientation of
+            the logical ijk axes in world space.
+        chunk_size : int, default 1_000_000
+            Batch size for reading centroids, and sample size per file.
+        use_statistics : bool, default False
+            Whether to try the statistics-based estimate first. The estimate
+            is not verified against every centroid; see :meth:`from_parquet`.
+
+        Returns
+        -------
+        RegularGeometry
+        """
+        import pyarrow.parquet as pq
+
+        pfs = [pq.ParquetFile(path) for path in filepaths]
+        if not pfs:
+            raise ValueError("At least one Parquet file is required to infer geometry.")
+        try:
+            for pf in pfs:
+                if not {"x", "y", "z"}.issubset(pf.schema_arrow.names):
+                    raise ValueError("Parquet file must contain x, y, z columns to infer geometry.")
+
+            if use_statistics and axis_azimuth == 0 and axis_dip == 0 and axis_plunge == 0:
+                geometry = cls._from_parquet_statistics(pfs, sample_rows=chunk_size)
+                if geometry is not None:
+                    return geometry
+
+            xyz_batches = (
+                (batch.column(0), batch.column(1), batch.column(2))
+                for pf in pfs
+                for batch in pf.iter_batches(columns=["x", "y", "z"], batch_size=chunk_size)
+            )
+            return cls.from_centroid_batches(
+                xyz_batches,
+                axis_azimuth=axis_azimuth,
+                axis_dip=axis_dip,
+                axis_plunge=axis_plunge,
+            )
+        finally:
+            for pf in pfs:
+                pf.close()
+
+    @classmethod
+    def _from_parquet_statistics(cls, pfs: list[Any], sample_rows: int) -> Optional["RegularGeometry"]:
+        """Estimate unrotated geometry from column statistics and row samples.
+
+        Returns None when statistics are unavailable or the estimate fails
+        verification, in which case callers fall back to a full scan.
+        """
+        lows = np.full(3, np.inf)
+        highs = np.full(3, -np.inf)
+        file_bounds: list[tuple[np.ndarray, np.ndarray]] = []
+        samples = []
+        num_rows = 0
+        for pf in pfs:
+            metadata = pf.metadata
+            if metadata.num_rows == 0:
+                continue
+            column_index = {
+                metadata.schema.column(j).path: j for j in range(metadata.num_columns)
+            }
+            if not {"x", "y", "z"}.issubset(column_index):
+                return None
+
+            file_lows = np.full(3, np.inf)
+            file_highs = np.full(3, -np.inf)
+            for axis, name in enumerate(("x", "y", "z")):
+                for rg in range(metadata.num_row_groups):
+                    stats = metadata.row_group(rg).column(column_index[name]).statistics
+                    if stats is None or not stats.has_min_max or stats.null_count:
+                        return None
+                    file_lows[axis] = min(file_lows[axis], float(stats.min))
+                    file_highs[axis] = max(file_highs[axis], float(stats.max))
+            lows = np.minimum(lows, file_lows)
+            highs = np.maximum(highs, file_highs)
+            file_bounds.append((file_lows, file_highs))
+
+            sample = next(pf.iter_batches(columns=["x", "y", "z"], batch_size=sample_rows), None)
+            if sample is None:
+                return None
+            samples.append(sample)
+            num_rows += metadata.num_rows
+
+        if not samples or not (np.all(np.isfinite(lows)) and np.all(np.isfinite(highs))):
+            return None
+
+        corner, block_size, shape = [], [], []
+        for axis, (lo, hi) in enumerate(zip(lows, highs)):
+            if hi <= lo:
+                return None
+            sampled = [np.asarray(sample.column(axis), dtype=float) for sample in samples]
+            if len(file_bounds) > 1:
+                # Extents of the other files are centroids too, and can supply the
+                # spacing along axes each file spans only once (e.g. benches).
+                sampled.append(np.array([b[axis] for bounds in file_bounds for b in bounds]))
+            values = np.unique(np.concatenate(sampled))
+            if values.size < 2:
+                return None
+            span = hi - lo
+            steps = span / float(np.diff(values).min())
+            n_steps = round(steps)
+            if n_steps < 1 or abs(steps - n_steps) > 1e-6 * n_steps:
+                return None
+            step = span / n_steps
+            offsets = (values - lo) / step
+            if np.abs(offsets - np.round(offsets)).max() > 1e-6 * n_steps:
+                return None
+            corner.append(float(lo - step / 2))
+            block_size.append(float(step))
+            shape.append(n_steps + 1)
+
+        # A too-coarse spacing cannot hold every row on distinct cells.
+        if num_rows > int(np.prod(shape)):
+            return None
+
+        return cls(
+            local=LocalGeometry(corner=tuple(corner), block_size=tuple(block_size), shape=tuple(shape)),
+            world=WorldFrame(),
+        )
+
+    @classmethod
+    def from_centroid_batches(
+        cls,
+        xyz_batches: Iterable[tuple[Any, Any, Any]],
+        axis_azimuth: float = 0.0,
+        axis_dip: float = 0.0,
+        axis_plunge: float = 0.0,
+    ) -> "RegularGeometry":
+        """Infer geometry from centroid coordinates streamed in batches.
+
+        Only the distinct local coordinates along each axis are retained, as
+        sorted arrays merged batch by batch, so memory is bounded by the grid
+        dimensions rather than the number of blocks. Used by
+        :meth:`from_parquet`, :meth:`from_multi_index` and streaming CSV ingest.
+
+        Parameters
+        ----------
+        xyz_batches : Iterable[tuple[array-like, array-like, array-like]]
+            ``(x, y, z)`` world centroid arrays, one tuple per batch.
+        axis_azimuth, axis_dip, axis_plunge : float
+            Optional rotation angles (degrees) defining the orientation of
+            the logical ijk axes in world space.
+
+        Returns
+        -------
+        RegularGeometry
+        """
         from parq_blockmodel.utils.geometry_utils import angles_to_axes
 
         axis_u, axis_v, axis_w = angles_to_axes(
@@ -856,26 +1205,22 @@ class RegularGeometry:
         )
 
         R = np.array([axis_u, axis_v, axis_w], dtype=float).T
+        rotated = not np.array_equal(R, np.eye(3))
 
-        local_x_values: set[float] = set()
-        local_y_values: set[float] = set()
-        local_z_values: set[float] = set()
-
-        for batch in pf.iter_batches(columns=["x", "y", "z"], batch_size=chunk_size):
-            table = batch.to_pydict()
-            x = np.asarray(table["x"], dtype=float)
-            y = np.asarray(table["y"], dtype=float)
-            z = np.asarray(table["z"], dtype=float)
-            pts = np.vstack([x, y, z])
-            local = R.T @ pts
+        ux = uy = uz = np.empty(0, dtype=float)
 
-            local_x_values.update(np.unique(local[0]).tolist())
-            local_y_values.update(np.unique(local[1]).tolist())
-            local_z_values.update(np.unique(local[2]).tolist())
+        for x, y, z in xyz_batches:
+            local = (
+                np.asarray(x, dtype=float),
+                np.asarray(y, dtype=float),
+                np.asarray(z, dtype=float),
+            )
+            if rotated:
+                local = R.T @ np.vstack(local)
 
-        ux = np.array(sorted(local_x_values), dtype=float)
-        uy = np.array(sorted(local_y_values), dtype=float)
-        uz = np.array(sorted(local_z_values), dtype=float)
+            ux = _merge_sorted_unique(ux, local[0])
+            uy = _merge_sorted_unique(uy, local[1])
+            uz = _merge_sorted_unique(uz, local[2])
 
         if ux.size < 2 or uy.size < 2 or uz.size < 2:
             raise ValueError("Cannot infer block size/shape from degenerate centroid coordinates.")
@@ -927,45 +1272,18 @@ class RegularGeometry:
         RegularGeometry
         """
         import pandas as pd
-        from parq_blockmodel.utils.geometry_utils import angles_to_axes
 
         if not isinstance(index, pd.MultiIndex) or index.names != ["x", "y", "z"]:
             raise ValueError("index must be a pd.MultiIndex with names ['x', 'y', 'z'].")
 
-        axis_u, axis_v, axis_w = angles_to_axes(
+        xyz = (
+            index.get_level_values("x"),
+            index.get_level_values("y"),
+            index.get_level_values("z"),
+        )
+        return cls.from_centroid_batches(
+            [xyz],
             axis_azimuth=axis_azimuth,
             axis_dip=axis_dip,
             axis_plunge=axis_plunge,
         )
-        R = np.array([axis_u, axis_v, axis_w], dtype=float).T
-
-        x = np.asarray(index.get_level_values("x"), dtype=float)
-        y = np.asarray(index.get_level_values("y"), dtype=float)
-        z = np.asarray(index.get_level_values("z"), dtype=float)
-        pts = np.vstack([x, y, z])
-        local = R.T @ pts
-
-        ux = np.array(sorted(set(np.unique(local[0]).tolist())), dtype=float)
-        uy = np.array(sorted(set(np.unique(local[1]).tolist())), dtype=float)
-        uz = np.array(sorted(set(np.unique(local[2]).tolist())), dtype=float)
-
-        if ux.size < 2 or uy.size < 2 or uz.size < 2:
-            raise ValueError("Cannot infer block size/shape from degenerate centroid coordinates.")
-
-        dx = float(np.diff(ux).min())
-        dy = float(np.diff(uy).min())
-        dz = float(np.diff(uz).min())
-
-        ni = int(round((ux.max() - ux.min()) / dx)) + 1
-        nj = int(round((uy.max() - uy.min()) / dy)) + 1
-        nk = int(round((uz.max() - uz.min()) / dz)) + 1
-
-        corner = (float(ux.min() - dx / 2), float(uy.min() - dy / 2), float(uz.min() - dz / 2))
-        block_size: BlockSize = (dx, dy, dz)
-        shape: Shape3D = (ni, nj, nk)
-
-
-        return cls(
-            local=LocalGeometry(corner=corner, block_size=block_size, shape=shape),
-            world=WorldFrame(axis_u=axis_u, axis_v=axis_v, axis_w=axis_w),
-        )
@@ -19,12 +19,51 @@ build_world_id_encoding_from_xyz
     Build default world_id encoding metadata from xyz ranges.
 assert_block_id_xyz_consistent
     Validate block_id consistency with xyz coordinates.
+ordered_map
+    Apply a function on a thread pool, yielding results in input order.
+resolve_filter_expression
+    Convert read filters into a pyarrow dataset expression.
+arrow_to_numpy
+    Convert Arrow columns to (zero-copy where possible) NumPy arrays.
+DenseColumnBuilder
+    Scatter column batches into dense grid arrays by block id.
+BlockIdIndex
+    Persistent sorted block_id to row-position index (``.pbm.bidx`` sidecar).
+BlockIdBitmap
+    Paged bit set for streaming block_id uniqueness checks.
+external_sort
+    External merge sort of record batches, used to re-cluster models.
+column_sidecars
+    Row-aligned column-family sidecar files for cheap column additions.
+pbm_dataset
+    Partitioned ``.pbmd`` dataset layout (manifest, partition writer, pruned dataset access).
+get_file_metadata
+    Process-wide cache of parsed ``.pbm`` footer metadata (geometry, schema, compression).
 """
 
 from parq_blockmodel.io.ingest_writer import IngestWriter
 from parq_blockmodel.io import ingest_utils
+from parq_blockmodel.io import read_utils
+from parq_blockmodel.io import block_index
+from parq_blockmodel.io.block_index import BlockIdIndex
+from parq_blockmodel.io.block_bitmap import BlockIdBitmap
+from parq_blockmodel.io import pbm_dataset
+from parq_blockmodel.io import column_sidecars
+from parq_blockmodel.io import external_sort
+from parq_blockmodel.io import metadata_cache
+from parq_blockmodel.io.metadata_cache import get_file_metadata, clear_metadata_cache
 
 __all__ = [
     "IngestWriter",
+    "BlockIdIndex",
+    "BlockIdBitmap",
     "ingest_utils",
+    "read_utils",
+    "block_index",
+    "metadata_cache",
+    "pbm_dataset",
+    "column_sidecars",
+    "external_sort",
+    "get_file_metadata",
+    "clear_metadata_cache",
 ]
@@ -0,0 +1,102 @@
+"""Packed bit set over the dense ``block_id`` range of a geometry.
+
+Used to check ``block_id`` uniqueness while streaming batches (ingest,
+validation) without holding a Python ``set``: one bit per dense grid cell
+instead of tens of bytes per block. The bits are split into fixed-size pages
+that are only allocated when touched, so very large, sparsely populated grids
+cost memory in proportion to the occupied region rather than the full grid.
+"""
+import numpy as np
+
+PAGE_BITS = 23  # 2**23 bits (1 MiB) per page
+
+
+class BlockIdBitmap:
+    """Vectorized test-and-set bit set for block ids in ``[0, size)``.
+
+    Parameters
+    ----------
+    size : int
+        Number of cells in the dense grid, i.e. ``prod(geometry.local.shape)``.
+
+    Examples
+    --------
+    >>> seen = BlockIdBitmap(24)
+    >>> seen.add(np.array([3, 5]))
+    True
+    >>> seen.add(np.array([5, 7]))
+    False
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 0:
+            raise ValueError("size must be >= 0.")
+        self.size = int(size)
+        self._page_bytes = (min(self.size, 1 << PAGE_BITS) + 7) // 8
+        self._pages: dict[int, np.ndarray] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of distinct block ids added so far."""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently allocated for bitmap pages."""
+        return sum(page.nbytes for page in self._pages.values())
+
+    def add(self, block_ids: np.ndarray) -> bool:
+        """Add ``block_ids``, reporting whether they were all new.
+
+        Parameters
+        ----------
+        block_ids : array-like of int
+            Block ids to add.
+
+        Returns
+        -------
+        bool
+            True if the ids are unique within the batch and none was added
+            before. On False the bitmap contents are unspecified; callers are
+            expected to treat it as a validation failure.
+
+        Raises
+        ------
+        ValueError
+            If any id is outside ``[0, size)``.
+        """
+        ids = np.asarray(block_ids, dtype=np.int64).ravel()
+        if not ids.size:
+            return True
+        # Canonical writes arrive in block_id order, so sorting is usually skipped.
+        if not np.all(ids[1:] > ids[:-1]):
+            ids = np.sort(ids)
+            if np.any(ids[1:] == ids[:-1]):
+                return False
+        if ids[0] < 0 or ids[-1] >= self.size:
+            raise ValueError(f"Block ids must be within [0, {self.size}).")
+
+        page_ids = ids >> PAGE_BITS
+        starts = np.flatnonzero(np.r_[True, page_ids[1:] != page_ids[:-1]])
+        ends = np.r_[starts[1:], ids.size]
+        for start, end in zip(starts, ends):
+            page = self._page(int(page_ids[start]))
+            local = ids[start:end] & ((1 << PAGE_BITS) - 1)
+            byte_index = local >> 3
+            masks = np.left_shift(1, local & 7).astype(np.uint8)
+            # ids are sorted, so equal bytes are adjacent: OR their masks together.
+            byte_starts = np.flatnonzero(np.r_[True, byte_index[1:] != byte_index[:-1]])
+            byte_index = byte_index[byte_starts]
+            masks = np.bitwise_or.reduceat(masks, byte_starts)
+            if np.any(page[byte_index] & masks):
+                return False
+            page[byte_index] |= masks
+        self._count += int(ids.size)
+        return True
+
+    def _page(self, page_id: int) -> np.ndarray:
+        page = self._pages.get(page_id)
+        if page is None:
+            page = np.zeros(self._page_bytes, dtype=np.uint8)
+            self._pages[page_id] = page
+        return page
@@ -0,0 +1,180 @@
+"""Persistent block_id row-position index for canonical .pbm files.
+
+The index maps every ``block_id`` in a ``.pbm`` file to its row position,
+stored as a sorted ``block_id`` array plus the matching row positions. It is
+persisted as a small ``.npz`` sidecar next to the ``.pbm`` file and is only
+trusted while the file fingerprint (size and modification time) matches, so
+rewriting the model silently invalidates it.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from parq_tools.utils import atomic_output_file
+
+from parq_blockmodel.io.pbm_dataset import manifest_path
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".bidx"
+INDEX_FORMAT_VERSION = 1
+
+
+def sidecar_path(blockmodel_path: Path) -> Path:
+    """Return the index sidecar path for a ``.pbm`` file (``<name>.pbm.bidx``)."""
+    return blockmodel_path.with_name(blockmodel_path.name + SIDECAR_SUFFIX)
+
+
+def file_fingerprint(path: Path) -> tuple[int, int]:
+    """Return the ``(size, mtime_ns)`` fingerprint of ``path``.
+
+    A ``.pbmd`` dataset directory is fingerprinted by its manifest, which is
+    replaced on every rewrite.
+    """
+    if os.path.isdir(path):
+        path = manifest_path(path)
+    stat = os.stat(path)
+    return int(stat.st_size), int(stat.st_mtime_ns)
+
+
+def _compact_unsigned(values: np.ndarray) -> np.ndarray:
+    dtype = np.uint32 if values.size == 0 or int(values.max()) <= np.iinfo(np.uint32).max else np.uint64
+    return values.astype(dtype, copy=False)
+
+
+@dataclass(frozen=True)
+class BlockIdIndex:
+    """Sorted ``block_id`` to row-position index for one ``.pbm`` file.
+
+    Attributes
+    ----------
+    block_ids : np.ndarray
+        All block ids in the file, sorted ascending.
+    positions : np.ndarray
+        Row position in the file of each entry of ``block_ids``.
+    fingerprint : tuple[int, int]
+        ``(size, mtime_ns)`` of the file the index was built from.
+    """
+
+    block_ids: np.ndarray
+    positions: np.ndarray
+    fingerprint: tuple[int, int]
+
+    @classmethod
+    def from_row_block_ids(cls, row_block_ids: np.ndarray, fingerprint: tuple[int, int]) -> "BlockIdIndex":
+        """Build an index from block ids in file row order."""
+        row_block_ids = np.asarray(row_block_ids)
+        positions = np.argsort(row_block_ids, kind="stable")
+        return cls(
+            block_ids=_compact_unsigned(row_block_ids[positions]),
+            positions=_compact_unsigned(positions),
+            fingerprint=fingerprint,
+        )
+
+    def __len__(self) -> int:
+        return int(self.block_ids.size)
+
+    @property
+    def is_unique(self) -> bool:
+        """True when no block id appears more than once."""
+        return bool(np.all(np.diff(self.block_ids.astype(np.int64)) > 0))
+
+    def row_block_ids(self) -> np.ndarray:
+        """Return block ids in file row order."""
+        row_block_ids = np.empty_like(self.block_ids)
+        row_block_ids[self.positions] = self.block_ids
+        return row_block_ids
+
+    def lookup(self, block_ids: np.ndarray) -> np.ndarray:
+        """Return the row position of each of ``block_ids``, or -1 when absent.
+
+        Parameters
+        ----------
+        block_ids : array-like of int
+            Block ids to look up.
+
+        Returns
+        -------
+        np.ndarray
+            int64 row positions aligned with ``block_ids``.
+        """
+        block_ids = np.asarray(block_ids, dtype=np.int64).ravel()
+        positions = np.full(block_ids.size, -1, dtype=np.int64)
+        if not len(self):
+            return positions
+        sorted_ids = self.block_ids.astype(np.int64, copy=False)
+        found = np.searchsorted(sorted_ids, block_ids)
+        in_range = found < sorted_ids.size
+        hit = np.zeros(block_ids.size, dtype=bool)
+        hit[in_range] = sorted_ids[found[in_range]] == block_ids[in_range]
+        positions[hit] = self.positions[found[hit]]
+        return positions
+
+    def is_current(self, path: Path) -> bool:
+        """True when ``path`` still has the fingerprint the index was built from."""
+        try:
+            return file_fingerprint(path) == tuple(self.fingerprint)
+        except OSError:
+            return False
+
+    def save(self, path: Path) -> None:
+        """Atomically write the index to ``path`` as an ``.npz`` archive."""
+        with atomic_output_file(path) as tmp_path:
+            with open(tmp_path, "wb") as fh:
+                np.savez(
+                    fh,
+                    version=np.array([INDEX_FORMAT_VERSION], dtype=np.int64),
+                    fingerprint=np.array(self.fingerprint, dtype=np.int64),
+                    block_ids=self.block_ids,
+                    positions=self.positions,
+                )
+
+    @classmethod
+    def load(cls, path: Path) -> "BlockIdIndex":
+        """Read an index previously written with :meth:`save`."""
+        with np.load(path) as archive:
+            version = int(archive["version"][0])
+            if version != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported block index format version: {version}")
+            return cls(
+                block_ids=archive["block_ids"],
+                positions=archive["positions"],
+                fingerprint=tuple(int(v) for v in archive["fingerprint"]),
+            )
+
+
+def load_current_index(blockmodel_path: Path) -> Optional[BlockIdIndex]:
+    """Load the sidecar index for ``blockmodel_path`` if it exists and is current.
+
+    Returns
+    -------
+    BlockIdIndex or None
+        The index, or None when the sidecar is missing, unreadable or stale.
+    """
+    path = sidecar_path(blockmodel_path)
+    if not path.exists():
+        return None
+    try:
+        index = BlockIdIndex.load(path)
+    except (OSError, ValueError, KeyError) as exc:
+        logger.debug("Ignoring unreadable block index %s: %s", path, exc)
+        return None
+    return index if index.is_current(blockmodel_path) else None
+
+
+def save_index(index: BlockIdIndex, blockmodel_path: Path) -> bool:
+    """Persist ``index`` as the sidecar of ``blockmodel_path``.
+
+    Failures (e.g. a read-only directory) are logged and reported as False;
+    the index remains usable in memory.
+    """
+    try:
+        index.save(sidecar_path(blockmodel_path))
+    except OSError as exc:
+        logger.debug("Could not persist block index for %s: %s", blockmodel_path, exc)
+        return False
+    return True
@@ -0,0 +1,291 @@
+"""Column-family sidecars for cheap column additions to ``.pbm`` files.
+
+Appending a column to a ``.pbm`` file would otherwise rewrite every existing
+column. Instead, new columns can be stored as a *column family*: a separate
+Parquet file holding only those columns, row-aligned with the main file and
+written with the same row-group sizes. Families live in a
+``<name>.pbm.cols/`` directory next to the model::
+
+    model.pbm
+    model.pbm.cols/
+        _manifest.json
+        family-00000.parquet
+        family-00001.parquet
+
+The manifest lists the families, their columns and the compression policy
+each was written with, and is bound to the main file's fingerprint
+``(size, mtime_ns)``, like the block index sidecar. Writing a family never
+touches the main file, whose footer keeps its own compression policy.
+Rewriting the main file therefore invalidates the families; writers in this
+package fold them in first (see
+:meth:`~parq_blockmodel.blockmodel.ParquetBlockModel.compact`) and then
+remove them with :func:`remove_sidecars`.
+"""
+import json
+import logging
+import shutil
+import typing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from parq_tools.utils import atomic_output_file
+
+from parq_blockmodel.io import read_utils
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_DIR_SUFFIX = ".cols"
+MANIFEST_FILENAME = "_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def sidecar_dir(blockmodel_path: Path) -> Path:
+    """Return the column-family directory of a ``.pbm`` file (``<name>.pbm.cols``)."""
+    blockmodel_path = Path(blockmodel_path)
+    return blockmodel_path.with_name(blockmodel_path.name + SIDECAR_DIR_SUFFIX)
+
+
+def manifest_fingerprint(blockmodel_path: Path) -> tuple[int, ...]:
+    """Return ``(size, mtime_ns)`` of the family manifest, or ``()`` when there is none."""
+    path = sidecar_dir(blockmodel_path) / MANIFEST_FILENAME
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+    return int(stat.st_size), int(stat.st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class ColumnFamily:
+    """One column-family file.
+
+    Attributes
+    ----------
+    path : str
+        File name relative to the sidecar directory.
+    columns : tuple[str, ...]
+        Columns stored in the family, in file order.
+    compression : dict or None
+        Compression policy the family was written with, or None if unknown.
+    """
+
+    path: str
+    columns: tuple[str, ...]
+    compression: Optional[dict[str, typing.Any]] = None
+
+
+@dataclass(frozen=True)
+class SidecarManifest:
+    """Column families attached to one ``.pbm`` file.
+
+    Attributes
+    ----------
+    fingerprint : tuple[int, int]
+        Fingerprint of the main file the families are aligned with.
+    families : tuple[ColumnFamily, ...]
+        Families in the order their columns follow the main file's columns.
+    """
+
+    fingerprint: tuple[int, int]
+    families: tuple[ColumnFamily, ...]
+
+    @property
+    def columns(self) -> list[str]:
+        return [col for family in self.families for col in family.columns]
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "fingerprint": list(self.fingerprint),
+            "families": [
+                {"path": f.path, "columns": list(f.columns), "compression": f.compression} for f in self.families
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, typing.Any]) -> "SidecarManifest":
+        if payload.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported column sidecar manifest version: {payload.get('version')!r}.")
+        return cls(
+            fingerprint=tuple(int(v) for v in payload["fingerprint"]),
+            families=tuple(
+                ColumnFamily(path=f["path"], columns=tuple(f["columns"]), compression=f.get("compression"))
+                for f in payload["families"]
+            ),
+        )
+
+
+def load_sidecars(blockmodel_path: Path, fingerprint: tuple[int, int]) -> Optional[SidecarManifest]:
+    """Return the families of ``blockmodel_path``, or None when absent or stale.
+
+    Families whose manifest fingerprint does not match ``fingerprint`` (the
+    main file was rewritten by other means) are ignored with a warning.
+    """
+    path = sidecar_dir(blockmodel_path) / MANIFEST_FILENAME
+    if not path.exists():
+        return None
+    try:
+        manifest = SidecarManifest.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError) as exc:
+        logger.warning("Ignoring unreadable column sidecar manifest %s: %s", path, exc)
+        return None
+    if tuple(manifest.fingerprint) != tuple(fingerprint):
+        logger.warning("Ignoring column sidecars of %s: the main file has changed since they were written.",
+                       blockmodel_path)
+        return None
+    return manifest if manifest.families else None
+
+
+def write_family(
+    blockmodel_path: Path,
+    manifest: Optional[SidecarManifest],
+    fingerprint: tuple[int, int],
+    tables: Iterable[pa.Table],
+    schema: pa.Schema,
+    compression_policy: Optional[dict[str, typing.Any]] = None,
+    **pq_write_kwargs: typing.Any,
+) -> SidecarManifest:
+    """Write a new column family and register it in the manifest.
+
+    Parameters
+    ----------
+    blockmodel_path : Path
+        The main ``.pbm`` file.
+    manifest : SidecarManifest or None
+        Current families, if any.
+    fingerprint : tuple[int, int]
+        Fingerprint of the main file.
+    tables : Iterable[pa.Table]
+        The family's rows, one table per main-file row group, in order.
+        Each table is written as one row group.
+    schema : pa.Schema
+        Schema of the family.
+    compression_policy : dict, optional
+        Resolved compression policy the family is written with, recorded in
+        the manifest.
+    **pq_write_kwargs
+        Extra arguments for :class:`pyarrow.parquet.ParquetWriter`.
+
+    Returns
+    -------
+    SidecarManifest
+        The committed manifest.
+    """
+    directory = sidecar_dir(blockmodel_path)
+    directory.mkdir(exist_ok=True)
+    families = manifest.families if manifest is not None else ()
+    index = max((int(Path(f.path).stem.rsplit("-", 1)[-1]) for f in families), default=-1) + 1
+    family_path = directory / f"family-{index:05d}.parquet"
+    with atomic_output_file(family_path) as tmp_path:
+        writer = pq.ParquetWriter(tmp_path, schema, **pq_write_kwargs)
+        try:
+            for table in tables:
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        finally:
+            writer.close()
+    new_manifest = SidecarManifest(
+        fingerprint=tuple(fingerprint),
+        families=families + (
+            ColumnFamily(path=family_path.name, columns=tuple(schema.names), compression=compression_policy),
+        ),
+    )
+    with atomic_output_file(directory / MANIFEST_FILENAME) as tmp_path:
+        tmp_path.write_text(json.dumps(new_manifest.to_dict(), indent=1), encoding="utf-8")
+    return new_manifest
+
+
+def remove_sidecars(blockmodel_path: Path) -> None:
+    """Delete the column-family directory of ``blockmodel_path``, if any."""
+    directory = sidecar_dir(blockmodel_path)
+    if directory.exists():
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def combined_schema(main_schema: pa.Schema, blockmodel_path: Path, manifest: SidecarManifest) -> pa.Schema:
+    """Return ``main_schema`` extended with the fields of every family."""
+    directory = sidecar_dir(blockmodel_path)
+    fields = list(main_schema)
+    for family in manifest.families:
+        fields.extend(pq.read_schema(directory / family.path))
+    return pa.schema(fields, metadata=main_schema.metadata)
+
+
+class SidecarParquetFile:
+    """Read-only :class:`pyarrow.parquet.ParquetFile` view of a ``.pbm`` plus its families.
+
+    Columns are served from whichever file stores them. Families share the
+    main file's row-group layout, so row groups are read pairwise.
+    """
+
+    def __init__(self, main: pq.ParquetFile, blockmodel_path: Path, manifest: SidecarManifest,
+                 schema_arrow: Optional[pa.Schema] = None) -> None:
+        self.main = main
+        self.path = Path(blockmodel_path)
+        self.manifest = manifest
+        self.directory = sidecar_dir(blockmodel_path)
+        self.metadata = main.metadata
+        self.schema = main.schema
+        self.schema_arrow = schema_arrow or combined_schema(main.schema_arrow, blockmodel_path, manifest)
+        self._family_of = {col: family for family in manifest.families for col in family.columns}
+
+    def _split(self, columns: Optional[list[str]]) -> tuple[list[str], list[tuple[ColumnFamily, list[str]]]]:
+        names = list(columns) if columns is not None else self.schema_arrow.names
+        main_columns = [col for col in names if col not in self._family_of]
+        family_columns = [
+            (family, [col for col in names if col in family.columns])
+            for family in self.manifest.families
+            if any(col in family.columns for col in names)
+        ]
+        return main_columns, family_columns
+
+    def read_row_groups(self, row_groups: Iterable[int], columns: Optional[list[str]] = None, **kwargs) -> pa.Table:
+        row_groups = list(row_groups)
+        names = list(columns) if columns is not None else self.schema_arrow.names
+        main_columns, family_columns = self._split(names)
+        table = self.main.read_row_groups(row_groups, columns=main_columns, **kwargs)
+        for family, cols in family_columns:
+            pf = pq.ParquetFile(self.directory / family.path)
+            try:
+                part = pf.read_row_groups(row_groups, columns=cols, **kwargs)
+            finally:
+                pf.close()
+            for col in cols:
+                table = table.append_column(part.schema.field(col), part.column(col))
+        return table.select(names)
+
+    def read_row_group(self, index: int, columns: Optional[list[str]] = None, **kwargs) -> pa.Table:
+        return self.read_row_groups([index], columns=columns, **kwargs)
+
+    def read(self, columns: Optional[list[str]] = None, **kwargs) -> pa.Table:
+        return self.read_row_groups(range(self.metadata.num_row_groups), columns=columns, **kwargs)
+
+    def iter_filtered(self, filter_expression: pc.Expression, columns: Optional[list[str]] = None) -> Iterator[pa.Table]:
+        """Yield the rows matching ``filter_expression``, one row group at a time.
+
+        Row groups are pruned using the main file's column statistics; the
+        filter is then evaluated on each remaining row group, reading only
+        the requested and referenced columns from the main file and families.
+        """
+        names = list(columns) if columns is not None else self.schema_arrow.names
+        referenced = read_utils.expression_columns(filter_expression, self.schema_arrow)
+        needed = names + [col for col in referenced if col not in names]
+        fragment = next(iter(ds.dataset(self.path, format="parquet").get_fragments()))
+        for part in fragment.split_by_row_group(filter_expression, schema=self.schema_arrow):
+            table = self.read_row_group(part.row_groups[0].id, columns=needed)
+            yield table.filter(filter_expression).select(names)
+
+    def iter_batches(self, batch_size: int = 65536, columns: Optional[list[str]] = None, **kwargs) -> Iterator[pa.RecordBatch]:
+        _, family_columns = self._split(columns)
+        if not family_columns:
+            yield from self.main.iter_batches(batch_size=batch_size, columns=columns, **kwargs)
+            return
+        for rg in range(self.metadata.num_row_groups):
+            yield from self.read_row_group(rg, columns=columns, **kwargs).to_batches(max_chunksize=batch_size)
+
+    def close(self) -> None:
+        self.main.close()
@@ -0,0 +1,158 @@
+"""External merge sort of Arrow record batches by an integer key.
+
+Used to re-cluster ``.pbm`` files that may not fit in memory. Input batches
+are gathered into runs of ``run_rows`` rows; each run is sorted in memory
+and, unless the whole input fits in a single run, spilled to a temporary
+Parquet file together with its key. The runs are then merged in bounded
+steps: every step takes from each run the rows whose key is at most the
+smallest last-buffered key of any run (ties broken by run order), so at
+least one buffer is consumed per step and only ``merge_rows`` rows per run are held in memory.
+
+Ties keep input order, because runs are cut in input order and each run is
+sorted stably.
+"""
+import shutil
+import tempfile
+import typing
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SORT_KEY_COLUMN = "__pbm_sort_key"
+
+
+def _sorted_run(tables: list[pa.Table], keys: list[np.ndarray]) -> tuple[pa.Table, np.ndarray]:
+    table = pa.concat_tables(tables)
+    key = np.concatenate(keys)
+    order = np.argsort(key, kind="stable")
+    return table.take(pa.array(order)), key[order]
+
+
+def _rebatch(tables: Iterable[pa.Table], rows: int) -> Iterator[pa.Table]:
+    """Re-chunk a stream of tables into tables of exactly ``rows`` rows (the last may be shorter)."""
+    pending: list[pa.Table] = []
+    pending_rows = 0
+    for table in tables:
+        pending.append(table)
+        pending_rows += table.num_rows
+        if pending_rows < rows:
+            continue
+        combined = pa.concat_tables(pending)
+        start = 0
+        while combined.num_rows - start >= rows:
+            yield combined.slice(start, rows)
+            start += rows
+        pending = [combined.slice(start)] if start < combined.num_rows else []
+        pending_rows = combined.num_rows - start
+    if pending_rows:
+        yield pa.concat_tables(pending)
+
+
+def _merge_runs(paths: list[Path], merge_rows: int) -> Iterator[pa.Table]:
+    readers = [pq.ParquetFile(path).iter_batches(batch_size=merge_rows) for path in paths]
+    buffers: list[Optional[pa.Table]] = [None] * len(readers)
+
+    def refill(index: int) -> None:
+        # Leaves buffers[index] as None once the run is exhausted.
+        buffers[index] = None
+        for batch in readers[index]:
+            if batch.num_rows:
+                buffers[index] = pa.Table.from_batches([batch])
+                return
+
+    for index in range(len(readers)):
+        refill(index)
+    while True:
+        active = [index for index, buffer in enumerate(buffers) if buffer is not None]
+        if not active:
+            return
+        keys = {index: np.asarray(buffers[index].column(SORT_KEY_COLUMN)) for index in active}
+        # Emit every buffered row ordered at or before (key, run) = (threshold, last_run);
+        # rows still on disk all order after it, which keeps ties in run order.
+        threshold, last_run = min((keys[index][-1], index) for index in active)
+        parts = []
+        for index in active:
+            side = "right" if index <= last_run else "left"
+            count = int(np.searchsorted(keys[index], threshold, side=side))
+            parts.append(buffers[index].slice(0, count))
+            buffers[index] = buffers[index].slice(count)
+            if buffers[index].num_rows == 0:
+                refill(index)
+        merged = pa.concat_tables(parts)
+        order = np.argsort(np.asarray(merged.column(SORT_KEY_COLUMN)), kind="stable")
+        yield merged.take(pa.array(order)).drop_columns([SORT_KEY_COLUMN])
+
+
+def sort_batches(
+    batches: Iterable[typing.Union[pa.RecordBatch, pa.Table]],
+    key: Callable[[pa.Table], np.ndarray],
+    *,
+    output_rows: int,
+    run_rows: int,
+    merge_rows: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+) -> Iterator[pa.Table]:
+    """Yield the rows of ``batches`` sorted by ``key``, as tables of ``output_rows`` rows.
+
+    Parameters
+    ----------
+    batches : Iterable[pa.RecordBatch or pa.Table]
+        Input rows; all batches must share one schema.
+    key : Callable[[pa.Table], np.ndarray]
+        Returns the sort key (an unsigned or signed integer array) of a table.
+    output_rows : int
+        Rows per yielded table (the last table may be shorter).
+    run_rows : int
+        Rows sorted in memory per run before spilling to disk.
+    merge_rows : int, optional
+        Rows buffered per run while merging. Defaults to
+        ``max(1, run_rows // number_of_runs)``.
+    spill_dir : Path, optional
+        Directory in which a temporary spill directory is created. Defaults
+        to the system temporary directory.
+    """
+    if output_rows <= 0 or run_rows <= 0:
+        raise ValueError("output_rows and run_rows must be > 0")
+
+    def sorted_tables() -> Iterator[pa.Table]:
+        spill = None
+        runs: list[Path] = []
+        tables: list[pa.Table] = []
+        keys: list[np.ndarray] = []
+        rows = 0
+        try:
+            for batch in batches:
+                table = batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+                if table.num_rows == 0:
+                    continue
+                tables.append(table)
+                keys.append(np.asarray(key(table)))
+                rows += table.num_rows
+                if rows < run_rows:
+                    continue
+                if spill is None:
+                    spill = Path(tempfile.mkdtemp(prefix="pbm-sort-", dir=spill_dir))
+                run, run_key = _sorted_run(tables, keys)
+                runs.append(spill / f"run-{len(runs):05d}.parquet")
+                pq.write_table(run.append_column(SORT_KEY_COLUMN, pa.array(run_key)), runs[-1])
+                tables, keys, rows = [], [], 0
+
+            if not runs:
+                # Everything fits in one run: sort in memory without spilling.
+                if tables:
+                    yield _sorted_run(tables, keys)[0]
+                return
+            if tables:
+                run, run_key = _sorted_run(tables, keys)
+                runs.append(spill / f"run-{len(runs):05d}.parquet")
+                pq.write_table(run.append_column(SORT_KEY_COLUMN, pa.array(run_key)), runs[-1])
+                tables, keys = [], []
+            yield from _merge_runs(runs, merge_rows or max(1, run_rows // len(runs)))
+        finally:
+            if spill is not None:
+                shutil.rmtree(spill, ignore_errors=True)
+
+    yield from _rebatch(sorted_tables(), output_rows)
@@ -4,26 +4,53 @@ This module provides stateless validation and encoding helpers for
 the data ingestion pipeline. All functions are pure (no side effects)
 and can be reused independently.
 """
+import glob
 import logging
+import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
 
 from parq_blockmodel.geometry import RegularGeometry
+from parq_blockmodel.io.block_bitmap import BlockIdBitmap
 from parq_blockmodel.utils.spatial_encoding import (
     DEFAULT_AXIS_BITS,
+    DEFAULT_CURVE,
     ENCODED_X_BITS,
     ENCODED_Y_BITS,
     ENCODED_Z_BITS,
+    ID_ENCODING_CURVES,
     decode_world_coordinates,
     encode_world_coordinates,
+    get_world_id_curve,
     get_world_id_encoding_params,
 )
 
 logger = logging.getLogger(__name__)
 
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+# Positional columns are always parsed with fixed types when streaming CSV, so
+# type inference on the first block cannot disagree with later blocks.
+CSV_POSITION_COLUMN_TYPES: dict[str, pa.DataType] = {
+    "block_id": pa.int64(),
+    "world_id": pa.int64(),
+    "i": pa.int64(),
+    "j": pa.int64(),
+    "k": pa.int64(),
+    "x": pa.float64(),
+    "y": pa.float64(),
+    "z": pa.float64(),
+}
+CSV_BLOCK_SIZE = 16 << 20
+
 
 def assert_block_id_xyz_consistent(
     block_ids: np.ndarray,
@@ -115,7 +142,7 @@ def validate_geometry(
         geometry = RegularGeometry.from_parquet(filepath)
 
     dense_count = int(np.prod(geometry.local.shape))
-    seen: set[int] = set()
+    seen = BlockIdBitmap(dense_count)
 
     pf = pq.ParquetFile(filepath)
     if has_block_id and has_xyz:
@@ -154,9 +181,10 @@ def validate_geometry(
             offset, scale, bits_per_axis = get_world_id_encoding_params(
                 geometry.world_id_encoding
             )
+            curve = get_world_id_curve(geometry.world_id_encoding)
             world_ids = np.asarray(batch.column(0), dtype=np.int64)
             x, y, z = decode_world_coordinates(
-                world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis
+                world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
             )
             block_ids = geometry.row_index_from_xyz(x, y, z, tol=tol).astype(np.uint32)
         elif has_xyz:
@@ -173,9 +201,7 @@ def validate_geometry(
         if np.any(block_ids < 0) or np.any(block_ids >= dense_count):
             raise ValueError("Sparse positions must be a subset of the dense geometry grid.")
 
-        seen_before = len(seen)
-        seen.update(block_ids.tolist())
-        if len(seen) - seen_before != len(block_ids):
+        if not seen.add(block_ids):
             raise ValueError("Duplicate block positions detected in dataset.")
 
     logger.debug(f"Geometry validation completed successfully for {filepath}.")
@@ -228,6 +254,7 @@ def build_world_id_encoding_from_xyz(
     z: np.ndarray,
     scale: float = 10.0,
     bits_per_axis: tuple[int, int, int] = DEFAULT_AXIS_BITS,
+    curve: str = DEFAULT_CURVE,
 ) -> dict[str, object]:
     """Build default world_id encoding metadata from xyz ranges.
 
@@ -238,7 +265,9 @@ def build_world_id_encoding_from_xyz(
     scale : float, default 10.0
         Quantization scale factor.
     bits_per_axis : tuple[int, int, int], default DEFAULT_AXIS_BITS
-        Number of bits per axis for Morton encoding.
+        Number of bits per axis.
+    curve : {"morton", "hilbert"}, default "morton"
+        Space-filling curve used to order the encoded ids.
 
     Returns
     -------
@@ -248,8 +277,10 @@ def build_world_id_encoding_from_xyz(
     Raises
     ------
     ValueError
-        If axis bit counts are invalid or exceed supported limits.
+        If axis bit counts are invalid or exceed supported limits, or the curve is unknown.
     """
+    if curve not in ID_ENCODING_CURVES:
+        raise ValueError(f"Unsupported curve {curve!r}; expected one of {sorted(ID_ENCODING_CURVES)}.")
     x_bits, y_bits, z_bits = tuple(int(v) for v in bits_per_axis)
     if x_bits <= 0 or y_bits <= 0 or z_bits <= 0:
         raise ValueError("axis bit counts must be positive integers.")
@@ -282,7 +313,7 @@ def build_world_id_encoding_from_xyz(
         "frame": "world_xyz",
         "axis_order": ["x", "y", "z"],
         "encoding": {
-            "type": "morton_zorder",
+            "type": ID_ENCODING_CURVES[curve],
             "version": "1.0",
             "bits_per_axis": x_bits,
             "axis_bits": {"x": x_bits, "y": y_bits, "z": z_bits},
@@ -305,3 +336,264 @@ def build_world_id_encoding_from_xyz(
         "overflow_policy": "error",
         "null_policy": "no_nulls",
     }
+
+
+def ordered_map(
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    workers: int = 1,
+    max_pending: Optional[int] = None,
+) -> Iterator[R]:
+    """Apply ``func`` to each item on a thread pool, yielding results in order.
+
+    Items are submitted as they are drawn from ``iterable`` and results are
+    yielded in submission order through a bounded reorder window, so at most
+    ``max_pending`` items are in flight (or finished and waiting) at a time.
+    Exceptions are raised in the consumer when the failing item's turn comes.
+
+    Parameters
+    ----------
+    func : Callable
+        Function applied to each item. It must be safe to call concurrently.
+    iterable : Iterable
+        Items to process, consumed in the calling thread.
+    workers : int, default 1
+        Number of worker threads. ``1`` applies ``func`` in the calling
+        thread without a pool.
+    max_pending : int, optional
+        Size of the reorder window; defaults to ``2 * workers``.
+
+    Returns
+    -------
+    Iterator
+        ``func(item)`` for each item, in the order of ``iterable``.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1.")
+    if max_pending is not None and max_pending < workers:
+        raise ValueError("max_pending must be >= workers.")
+    return _ordered_map(func, iterable, workers, max_pending or 2 * workers)
+
+
+def _ordered_map(func: Callable[[T], R], iterable: Iterable[T], workers: int, max_pending: int) -> Iterator[R]:
+    if workers == 1:
+        for item in iterable:
+            yield func(item)
+        return
+
+    pending: "deque[Future[R]]" = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parq-blockmodel-ingest") as pool:
+        try:
+            for item in iterable:
+                pending.append(pool.submit(func, item))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Reached on error or early close: drop work that has not started.
+            for future in pending:
+                future.cancel()
+
+
+def rebatch(batches: Iterable[pa.RecordBatch], batch_size: int) -> Iterator[pa.RecordBatch]:
+    """Regroup record batches into batches of exactly ``batch_size`` rows.
+
+    The final batch may be shorter. Useful for sources such as streaming CSV
+    readers whose batch sizes are set in bytes rather than rows.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows < batch_size:
+            continue
+        table = pa.Table.from_batches(pending)
+        offset = 0
+        while pending_rows - offset >= batch_size:
+            yield table.slice(offset, batch_size).combine_chunks().to_batches()[0]
+            offset += batch_size
+        pending = table.slice(offset).to_batches()
+        pending_rows -= offset
+    if pending_rows:
+        yield pa.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+
+def csv_convert_options(
+    columns: Optional[list[str]] = None,
+    column_types: Optional[typing.Mapping[str, pa.DataType]] = None,
+) -> pacsv.ConvertOptions:
+    """Build CSV convert options with fixed types for positional columns."""
+    return pacsv.ConvertOptions(
+        column_types={**CSV_POSITION_COLUMN_TYPES, **dict(column_types or {})},
+        include_columns=columns,
+    )
+
+
+def csv_column_names(csv_path: Path, parse_options: Optional[pacsv.ParseOptions] = None) -> list[str]:
+    """Return the column names of a CSV file from its header."""
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        parse_options=parse_options,
+        convert_options=csv_convert_options(),
+    )
+    try:
+        return list(reader.schema.names)
+    finally:
+        reader.close()
+
+
+def iter_csv_batches(
+    csv_path: Path,
+    columns: Optional[list[str]] = None,
+    batch_size: int = 1_000_000,
+    column_types: Optional[typing.Mapping[str, pa.DataType]] = None,
+    parse_options: Optional[pacsv.ParseOptions] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Stream a CSV file as record batches of ``batch_size`` rows.
+
+    The file is parsed incrementally with :func:`pyarrow.csv.open_csv`, so
+    memory use is bounded by ``batch_size`` regardless of file size.
+
+    Parameters
+    ----------
+    csv_path : Path
+        Path to the CSV file.
+    columns : list[str], optional
+        Columns to read, in output order. Defaults to all columns.
+    batch_size : int, default 1_000_000
+        Number of rows per yielded batch.
+    column_types : Mapping[str, pa.DataType], optional
+        Explicit Arrow types for attribute columns. Positional columns always
+        use :data:`CSV_POSITION_COLUMN_TYPES`; other columns are inferred from
+        the first block, so pin any column whose inferred type could change
+        later in the file (e.g. integers that later contain decimals).
+    parse_options : pyarrow.csv.ParseOptions, optional
+        Delimiter, quoting and similar parser settings.
+
+    Yields
+    ------
+    pa.RecordBatch
+    """
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        parse_options=parse_options,
+        convert_options=csv_convert_options(columns, column_types),
+    )
+    try:
+        yield from rebatch(reader, batch_size)
+    finally:
+        reader.close()
+
+
+def resolve_source_paths(sources: typing.Union[str, Path, Iterable[typing.Union[str, Path]]]) -> list[Path]:
+    """Expand ingest sources into a list of file paths.
+
+    Parameters
+    ----------
+    sources : str, Path or Iterable
+        A glob pattern (e.g. ``"exports/*.parquet"``), a directory (all
+        ``*.parquet`` files in it), a single file, or an iterable of files.
+        Pattern and directory matches are sorted by name.
+
+    Returns
+    -------
+    list[Path]
+
+    Raises
+    ------
+    ValueError
+        If no files match or a listed file does not exist.
+    """
+    if isinstance(sources, (str, Path)):
+        source = Path(sources)
+        if glob.has_magic(str(sources)):
+            paths = [Path(p) for p in sorted(glob.glob(str(sources)))]
+        elif source.is_dir():
+            paths = sorted(source.glob("*.parquet"))
+        else:
+            paths = [source]
+    else:
+        paths = [Path(p) for p in sources]
+
+    if not paths:
+        raise ValueError(f"No source files found for {sources!r}.")
+    missing = [str(p) for p in paths if not p.is_file()]
+    if missing:
+        raise ValueError(f"Source files do not exist: {missing}")
+    return paths
+
+
+def unify_parquet_schemas(paths: Iterable[Path]) -> pa.Schema:
+    """Return a schema covering the columns of all ``paths``.
+
+    Columns keep their first-seen order. Types that differ between files are
+    promoted where Arrow allows (e.g. ``int32`` and ``float64`` to
+    ``float64``); incompatible types raise :class:`pyarrow.ArrowTypeError`.
+    """
+    schemas = [pq.read_schema(path).remove_metadata() for path in paths]
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def iter_parquet_sources(
+    paths: list[Path],
+    schema: pa.Schema,
+    columns: Optional[list[str]] = None,
+    batch_size: int = 1_000_000,
+    workers: int = 1,
+) -> Iterator[pa.RecordBatch]:
+    """Stream several Parquet files as one sequence of conforming batches.
+
+    Row groups are decoded on a pool of ``workers`` threads, several files at
+    once, and yielded in file then row-group order. Each batch is cast to
+    ``schema``, with columns missing from a file filled with nulls.
+
+    Parameters
+    ----------
+    paths : list[Path]
+        Source Parquet files.
+    schema : pa.Schema
+        Target schema, typically from :func:`unify_parquet_schemas`.
+    columns : list[str], optional
+        Columns to yield, in order. Defaults to all columns of ``schema``.
+    batch_size : int, default 1_000_000
+        Number of rows per yielded batch.
+    workers : int, default 1
+        Number of threads decoding row groups. At most ``2 * workers`` row
+        groups are held in memory at a time.
+
+    Yields
+    ------
+    pa.RecordBatch
+    """
+    columns = list(schema.names) if columns is None else list(columns)
+    target = pa.schema([schema.field(name) for name in columns])
+    footers = {path: pq.read_metadata(path) for path in paths}
+    tasks = [(path, rg) for path in paths for rg in range(footers[path].num_row_groups)]
+
+    def read_row_group(task: tuple[Path, int]) -> pa.Table:
+        path, rg = task
+        pf = pq.ParquetFile(path, metadata=footers[path])
+        try:
+            present = [name for name in columns if name in pf.schema_arrow.names]
+            table = pf.read_row_group(rg, columns=present)
+        finally:
+            pf.close()
+        arrays = [
+            table.column(field.name).cast(field.type)
+            if field.name in present
+            else pa.nulls(table.num_rows, field.type)
+            for field in target
+        ]
+        return pa.Table.from_arrays(arrays, schema=target)
+
+    tables = ordered_map(read_row_group, tasks, workers=workers)
+    try:
+        yield from rebatch((batch for table in tables for batch in table.to_batches()), batch_size)
+    finally:
+        tables.close()
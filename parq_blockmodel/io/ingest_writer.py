@@ -12,14 +12,27 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
 
 from parq_blockmodel.geometry import RegularGeometry
-from parq_blockmodel.io.ingest_utils import assert_block_id_xyz_consistent, build_world_id_encoding_from_xyz
+from parq_blockmodel.io import metadata_cache, read_utils
+from parq_blockmodel.io.block_bitmap import BlockIdBitmap
+from parq_blockmodel.io.ingest_utils import (
+    assert_block_id_xyz_consistent,
+    build_world_id_encoding_from_xyz,
+    csv_column_names,
+    iter_csv_batches,
+    iter_parquet_sources,
+    ordered_map,
+    unify_parquet_schemas,
+)
 from parq_blockmodel.schema import utils as schema_utils
 from parq_blockmodel.utils.spatial_encoding import (
     decode_world_coordinates,
     encode_world_coordinates,
+    get_world_id_curve,
     get_world_id_encoding_params,
 )
 from parq_tools.utils import atomic_output_file
@@ -33,13 +46,14 @@ logger = logging.getLogger(__name__)
 class IngestWriter:
     """Stateful writer for streaming Parquet data into canonical .pbm files.
 
-    This class manages the ingestion of data from a source Parquet file into
+    This class manages the ingestion of data from a source Parquet (or CSV) file into
     a canonical .pbm (Parquet block model) file with automatic block_id
     derivation, spatial column coercion, and optional schema validation and
     df-eval operations.
 
     The writer handles:
-    - Streaming batches from source Parquet files
+    - Streaming batches from source Parquet or CSV files, or from several
+      Parquet files as one source
     - Deriving block_id from positional columns (block_id, world_id, ijk, or xyz)
     - Validating consistency between block_id and xyz if both present
     - Ensuring all spatial columns are present in output
@@ -49,7 +63,10 @@ class IngestWriter:
     Attributes
     ----------
     input_path : Path
-        Path to the source Parquet file.
+        Path to the source Parquet or CSV file (the first file for
+        multi-file sources).
+    input_paths : list[Path]
+        All source files.
     output_path : Path
         Path to the output .pbm file.
     geometry : RegularGeometry
@@ -63,19 +80,25 @@ class IngestWriter:
 
     def __init__(
         self,
-        input_path: typing.Union[str, Path],
+        input_path: typing.Union[str, Path, typing.Sequence[typing.Union[str, Path]]],
         output_path: typing.Union[str, Path],
         geometry: RegularGeometry,
         schema: Optional["DataFrameSchema"] = None,
         engine_initializer: Optional[typing.Callable] = None,
         compression: typing.Any = "fast",
+        csv_column_types: Optional[typing.Mapping[str, pa.DataType]] = None,
+        csv_parse_options: Optional[pacsv.ParseOptions] = None,
     ) -> None:
         """Initialize the IngestWriter with input/output paths and geometry.
 
         Parameters
         ----------
         input_path : str or Path
-            Path to the source Parquet file. Use None for DataFrame-based writes.
+            Path to the source Parquet file, or a CSV file (``.csv``, optionally
+            compressed, e.g. ``.csv.gz``) which is streamed with
+            :func:`pyarrow.csv.open_csv`. A sequence of Parquet files is
+            ingested as one source in the given order, with columns unified
+            across files. Use None for DataFrame-based writes.
         output_path : str or Path
             Path to the output .pbm file.
         geometry : RegularGeometry
@@ -84,29 +107,57 @@ class IngestWriter:
             Optional pandera schema for validation and df-eval operations.
         engine_initializer : Optional[Callable], default None
             Optional callable to configure the df-eval Engine.
+        csv_column_types : Optional[Mapping[str, pa.DataType]], default None
+            Explicit Arrow types for CSV attribute columns. Positional columns
+            always use fixed types.
+        csv_parse_options : Optional[pyarrow.csv.ParseOptions], default None
+            CSV parser settings such as the delimiter.
 
         Raises
         ------
         ValueError
-            If input_path is provided but does not exist or is not a valid Parquet file.
+            If input_path is provided but does not exist or is not a valid Parquet
+            file, or if several input files include a CSV file.
         """
-        self.input_path = Path(input_path) if input_path is not None else None
+        if input_path is None:
+            self.input_paths: list[Path] = []
+        elif isinstance(input_path, (str, Path)):
+            self.input_paths = [Path(input_path)]
+        else:
+            self.input_paths = [Path(p) for p in input_path]
+        self.input_path = self.input_paths[0] if self.input_paths else None
         self.output_path = Path(output_path)
         self.geometry = geometry
         self.schema = schema
         self.engine_initializer = engine_initializer
         self.compression = compression
+        self.csv_column_types = csv_column_types
+        self.csv_parse_options = csv_parse_options
+
+        for path in self.input_paths:
+            if not path.exists():
+                raise ValueError(f"Input file does not exist: {path}")
+        if len(self.input_paths) > 1 and any(self._is_csv_path(p) for p in self.input_paths):
+            raise ValueError("Multiple input files must all be Parquet files.")
 
-        if self.input_path is not None and not self.input_path.exists():
-            raise ValueError(f"Input file does not exist: {self.input_path}")
+    @staticmethod
+    def _is_csv_path(path: Path) -> bool:
+        return ".csv" in [s.lower() for s in path.suffixes]
+
+    @property
+    def is_csv(self) -> bool:
+        """Whether the source file is read as CSV rather than Parquet."""
+        return self.input_path is not None and self._is_csv_path(self.input_path)
 
     def write(
         self,
         columns: Optional[list[str]] = None,
         chunk_size: int = 1_000_000,
         tol: float = 1e-6,
+        prefetch: int = 0,
+        workers: int = 1,
     ) -> None:
-        """Stream data from source Parquet file into canonical .pbm file.
+        """Stream data from source Parquet or CSV file into canonical .pbm file.
 
         Orchestrates the streaming write process:
         1. Determines source columns and output columns
@@ -119,15 +170,27 @@ class IngestWriter:
            - Applies schema validation and df-eval operations if schema provided
            - Writes to output Parquet
 
+        With ``workers > 1`` the per-batch steps run in parallel on a thread
+        pool, while uniqueness checking and writing stay in source order, so
+        the output is identical to a sequential write.
+
         Parameters
         ----------
         columns : Optional[list[str]], default None
             Optional subset of columns to persist. If None, all columns in the
             source file plus any missing special columns are persisted.
         chunk_size : int, default 1_000_000
-            Batch size for reading Parquet data.
+            Batch size for reading source data.
         tol : float, default 1e-6
             Tolerance for xyz to ijk conversion when deriving block_id.
+        prefetch : int, default 0
+            Number of source batches to decode ahead on a background thread
+            while the current batch is processed. ``0`` disables read-ahead.
+        workers : int, default 1
+            Number of threads transforming batches concurrently. At most
+            ``2 * workers`` transformed batches are held in memory while
+            waiting to be written in order. Multi-file sources also decode
+            row groups on ``workers`` threads.
 
         Raises
         ------
@@ -140,8 +203,16 @@ class IngestWriter:
         # Lazy import to avoid circular dependencies
         from parq_blockmodel.blockmodel import ParquetBlockModel
 
-        pf = pq.ParquetFile(self.input_path)
-        src_cols = pf.schema.names
+        pf = None
+        source_schema = None
+        if self.is_csv:
+            src_cols = csv_column_names(self.input_path, self.csv_parse_options)
+        elif len(self.input_paths) > 1:
+            source_schema = unify_parquet_schemas(self.input_paths)
+            src_cols = source_schema.names
+        else:
+            pf = pq.ParquetFile(self.input_path)
+            src_cols = pf.schema.names
         compression_policy = schema_utils.resolve_active_compression_policy(self.compression)
 
         # Determine output columns
@@ -181,6 +252,7 @@ class IngestWriter:
                 np.array([zmin, zmax], dtype=float),
             )
         offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
+        curve = get_world_id_curve(self.geometry.world_id_encoding)
 
         # Order columns and prepare read columns
         output_cols = ParquetBlockModel._ordered_columns(output_cols)
@@ -260,113 +332,192 @@ class IngestWriter:
         # Stream data through batches
         with atomic_output_file(self.output_path) as tmp_path:
             writer = None
-            seen_block_ids: set[int] = set()
-            try:
-                for batch in pf.iter_batches(columns=read_cols, batch_size=chunk_size):
-                    df_batch = pa.Table.from_batches([batch]).to_pandas(ignore_metadata=True)
-
-                    # Validate consistency if both block_id and xyz present
-                    if "block_id" in df_batch.columns and {"x", "y", "z"}.issubset(df_batch.columns):
-                        assert_block_id_xyz_consistent(
-                            block_ids=df_batch["block_id"].to_numpy(dtype=np.uint32),
-                            x=df_batch["x"].to_numpy(dtype=float),
-                            y=df_batch["y"].to_numpy(dtype=float),
-                            z=df_batch["z"].to_numpy(dtype=float),
-                            geometry=self.geometry,
-                            tol=tol,
-                            context=f"canonical write for {self.input_path}",
-                        )
+            dense_count = int(np.prod(self.geometry.local.shape))
+            seen_block_ids = BlockIdBitmap(dense_count)
+            if source_schema is not None:
+                source_batches = iter_parquet_sources(
+                    self.input_paths,
+                    source_schema,
+                    columns=[c for c in read_cols if c in src_cols],
+                    batch_size=chunk_size,
+                    workers=workers,
+                )
+            elif pf is None:
+                source_batches = iter_csv_batches(
+                    self.input_path,
+                    columns=[c for c in read_cols if c in src_cols],
+                    batch_size=chunk_size,
+                    column_types=self.csv_column_types,
+                    parse_options=self.csv_parse_options,
+                )
+            else:
+                source_batches = pf.iter_batches(columns=read_cols, batch_size=chunk_size)
+            batches = read_utils.prefetch_iter(source_batches, prefetch)
+
+            special_dtypes = {
+                col: pa.from_numpy_dtype(np.dtype(dtype))
+                for col, dtype in ParquetBlockModel.SPECIAL_COLUMN_DTYPES.items()
+            }
+
+            def derive_block_ids(get: typing.Callable[[str], np.ndarray], present: set[str]) -> np.ndarray:
+                """Derive in-bounds block ids from the positional columns of a batch."""
+                # Validate consistency if both block_id and xyz present
+                if "block_id" in present and {"x", "y", "z"}.issubset(present):
+                    assert_block_id_xyz_consistent(
+                        block_ids=get("block_id").astype(np.uint32),
+                        x=get("x").astype(float),
+                        y=get("y").astype(float),
+                        z=get("z").astype(float),
+                        geometry=self.geometry,
+                        tol=tol,
+                        context=f"canonical write for {self.input_path}",
+                    )
 
-                    # Derive block_id from available positional columns
-                    if "block_id" in df_batch.columns:
-                        block_ids = df_batch["block_id"].to_numpy(dtype=np.uint32)
-                    elif "world_id" in df_batch.columns:
-                        world_ids = df_batch["world_id"].to_numpy(dtype=np.int64)
-                        xw, yw, zw = decode_world_coordinates(
-                            world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis
-                        )
-                        block_ids = self.geometry.row_index_from_xyz(xw, yw, zw, tol=tol).astype(np.uint32)
-                    elif {"x", "y", "z"}.issubset(df_batch.columns):
-                        block_ids = self.geometry.row_index_from_xyz(
-                            df_batch["x"].to_numpy(),
-                            df_batch["y"].to_numpy(),
-                            df_batch["z"].to_numpy(),
-                            tol=tol,
-                        ).astype(np.uint32)
-                    else:
-                        block_ids = self.geometry.row_index_from_ijk(
-                            df_batch["i"].to_numpy(),
-                            df_batch["j"].to_numpy(),
-                            df_batch["k"].to_numpy(),
-                        ).astype(np.uint32)
-
-                    # Validate block_ids are within bounds
-                    if np.any(block_ids < 0) or np.any(block_ids >= int(np.prod(self.geometry.local.shape))):
-                        raise ValueError("Source data contains positions outside geometry bounds.")
-
-                    # Validate uniqueness within batch
-                    if np.unique(block_ids).size != block_ids.size:
-                        raise ValueError("Canonical .pbm requires unique block_id values.")
+                # Derive block_id from available positional columns
+                if "block_id" in present:
+                    block_ids = get("block_id").astype(np.uint32)
+                elif "world_id" in present:
+                    world_ids = get("world_id").astype(np.int64)
+                    xw, yw, zw = decode_world_coordinates(
+                        world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
+                    )
+                    block_ids = self.geometry.row_index_from_xyz(xw, yw, zw, tol=tol).astype(np.uint32)
+                elif {"x", "y", "z"}.issubset(present):
+                    block_ids = self.geometry.row_index_from_xyz(
+                        get("x"), get("y"), get("z"), tol=tol
+                    ).astype(np.uint32)
+                else:
+                    block_ids = self.geometry.row_index_from_ijk(
+                        get("i"), get("j"), get("k")
+                    ).astype(np.uint32)
+
+                # Validate block_ids are within bounds
+                if np.any(block_ids < 0) or np.any(block_ids >= dense_count):
+                    raise ValueError("Source data contains positions outside geometry bounds.")
+                return block_ids
+
+            def finish_table(table: pa.Table) -> pa.Table:
+                meta = ParquetBlockModel._build_schema_metadata(
+                    geometry=self.geometry,
+                    schema=self.schema,
+                    base_metadata=dict(table.schema.metadata or {}),
+                    compression=compression_policy,
+                )
+                return table.replace_schema_metadata(meta)
+
+            # Per-batch canonicalization; runs on worker threads when workers > 1.
+            def transform_pandas(batch: pa.RecordBatch) -> tuple[np.ndarray, pa.Table]:
+                df_batch = pa.Table.from_batches([batch]).to_pandas(ignore_metadata=True)
+                block_ids = derive_block_ids(lambda c: df_batch[c].to_numpy(), set(df_batch.columns))
+
+                # Ensure all spatial columns are present
+                df_batch["block_id"] = block_ids
+                if not {"x", "y", "z"}.issubset(df_batch.columns):
+                    x, y, z = self.geometry.xyz_from_row_index(block_ids)
+                    df_batch["x"] = x
+                    df_batch["y"] = y
+                    df_batch["z"] = z
+                if not {"i", "j", "k"}.issubset(df_batch.columns):
+                    i, j, k = self.geometry.ijk_from_row_index(block_ids)
+                    df_batch["i"] = i.astype(np.int32)
+                    df_batch["j"] = j.astype(np.int32)
+                    df_batch["k"] = k.astype(np.int32)
+
+                # Coerce spatial column dtypes
+                df_batch = ParquetBlockModel._coerce_special_column_dtypes(
+                    df_batch,
+                    columns=["block_id", "i", "j", "k", "x", "y", "z"],
+                )
 
-                    # Validate global uniqueness across all batches
-                    seen_before = len(seen_block_ids)
-                    seen_block_ids.update(block_ids.tolist())
-                    if len(seen_block_ids) - seen_before != block_ids.size:
-                        raise ValueError("Canonical .pbm requires unique block_id values.")
+                # Ensure world_id is present
+                if "world_id" not in df_batch.columns:
+                    x = df_batch["x"].to_numpy(dtype=float)
+                    y = df_batch["y"].to_numpy(dtype=float)
+                    z = df_batch["z"].to_numpy(dtype=float)
+                    df_batch["world_id"] = encode_world_coordinates(
+                        x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
+                    ).astype(np.int64)
 
-                    # Ensure all spatial columns are present
-                    df_batch["block_id"] = block_ids
-                    if not {"x", "y", "z"}.issubset(df_batch.columns):
-                        x, y, z = self.geometry.xyz_from_row_index(block_ids)
-                        df_batch["x"] = x
-                        df_batch["y"] = y
-                        df_batch["z"] = z
-                    if not {"i", "j", "k"}.issubset(df_batch.columns):
-                        i, j, k = self.geometry.ijk_from_row_index(block_ids)
-                        df_batch["i"] = i.astype(np.int32)
-                        df_batch["j"] = j.astype(np.int32)
-                        df_batch["k"] = k.astype(np.int32)
-
-                    # Coerce spatial column dtypes
-                    df_batch = ParquetBlockModel._coerce_special_column_dtypes(
+                df_batch = ParquetBlockModel._coerce_special_column_dtypes(df_batch)
+
+                # Apply schema validation and df-eval operations if schema provided
+                if self.schema is not None:
+                    df_batch = ParquetBlockModel._apply_df_eval_operations(
                         df_batch,
-                        columns=["block_id", "i", "j", "k", "x", "y", "z"],
+                        self.schema,
+                        operations=selected_persist_operations,
+                        engine_initializer=self.engine_initializer,
                     )
+                    df_batch = ParquetBlockModel._validate_chunk(df_batch, self.schema)
+
+                # Select output columns, guarding against any cols absent from df_batch
+                ordered = ParquetBlockModel._ordered_columns(output_cols)
+                ordered = [c for c in ordered if c in df_batch.columns]
+                write_df = df_batch[ordered]
+
+                table = pa.Table.from_pandas(write_df, preserve_index=False)
+                return block_ids, finish_table(table)
+
+            # Arrow-native canonicalization: attribute columns are carried through
+            # zero-copy and only the positional columns are computed.
+            def transform_arrow(batch: pa.RecordBatch) -> tuple[np.ndarray, pa.Table]:
+                present = set(batch.schema.names)
+                block_ids = derive_block_ids(
+                    lambda c: batch.column(c).to_numpy(zero_copy_only=False), present
+                )
 
-                    # Ensure world_id is present
-                    if "world_id" not in df_batch.columns:
-                        x = df_batch["x"].to_numpy(dtype=float)
-                        y = df_batch["y"].to_numpy(dtype=float)
-                        z = df_batch["z"].to_numpy(dtype=float)
-                        df_batch["world_id"] = encode_world_coordinates(
-                            x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis
+                columns: dict[str, pa.Array] = {name: batch.column(name) for name in batch.schema.names}
+                columns["block_id"] = pa.array(block_ids)
+                if not {"x", "y", "z"}.issubset(present):
+                    for name, values in zip("xyz", self.geometry.xyz_from_row_index(block_ids)):
+                        columns[name] = pa.array(values)
+                if not {"i", "j", "k"}.issubset(present):
+                    for name, values in zip("ijk", self.geometry.ijk_from_row_index(block_ids)):
+                        columns[name] = pa.array(values)
+                for name in ["block_id", "i", "j", "k", "x", "y", "z"]:
+                    columns[name] = pc.cast(columns[name], special_dtypes[name], safe=False)
+
+                if "world_id" not in present:
+                    x, y, z = (columns[name].to_numpy().astype(float) for name in "xyz")
+                    columns["world_id"] = pa.array(
+                        encode_world_coordinates(
+                            x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
                         ).astype(np.int64)
+                    )
+                columns["world_id"] = pc.cast(columns["world_id"], special_dtypes["world_id"], safe=False)
+
+                ordered = [c for c in ParquetBlockModel._ordered_columns(output_cols) if c in columns]
+                table = pa.Table.from_arrays([columns[c] for c in ordered], names=ordered)
+
+                if self.schema is not None:
+                    # pandera validates pandas frames: take the (possibly coerced)
+                    # schema columns from the validated frame and carry the rest
+                    # through as Arrow arrays.
+                    validated = ParquetBlockModel._validate_chunk(table.to_pandas(), self.schema)
+                    schema_columns = set(getattr(self.schema, "columns", {}) or {})
+                    kept = [name for name in ordered if name in validated.columns]
+                    table = pa.Table.from_arrays(
+                        [
+                            pa.Array.from_pandas(validated[name]) if name in schema_columns else table.column(name)
+                            for name in kept
+                        ],
+                        names=kept,
+                    )
+                return block_ids, finish_table(table)
 
-                    df_batch = ParquetBlockModel._coerce_special_column_dtypes(df_batch)
-
-                    # Apply schema validation and df-eval operations if schema provided
-                    if self.schema is not None:
-                        df_batch = ParquetBlockModel._apply_df_eval_operations(
-                            df_batch,
-                            self.schema,
-                            operations=selected_persist_operations,
-                            engine_initializer=self.engine_initializer,
-                        )
-                        df_batch = ParquetBlockModel._validate_chunk(df_batch, self.schema)
-
-                    # Select output columns, guarding against any cols absent from df_batch
-                    ordered = ParquetBlockModel._ordered_columns(output_cols)
-                    ordered = [c for c in ordered if c in df_batch.columns]
-                    write_df = df_batch[ordered]
+            transform = (
+                transform_pandas
+                if selected_persist_operations or schema_utils.schema_has_df_eval_metadata(self.schema)
+                else transform_arrow
+            )
 
-                    table = pa.Table.from_pandas(write_df, preserve_index=False)
-                    meta = ParquetBlockModel._build_schema_metadata(
-                        geometry=self.geometry,
-                        schema=self.schema,
-                        base_metadata=dict(table.schema.metadata or {}),
-                        compression=compression_policy,
-                    )
-                    table = table.replace_schema_metadata(meta)
+            transformed = ordered_map(transform, batches, workers=workers)
+            try:
+                for block_ids, table in transformed:
+                    # Validate uniqueness within the batch and across all batches,
+                    # in source order.
+                    if not seen_block_ids.add(block_ids):
+                        raise ValueError("Canonical .pbm requires unique block_id values.")
 
                     # Write batch (first batch initializes writer)
                     if writer is None:
@@ -381,13 +532,17 @@ class IngestWriter:
                     writer.write_table(table)
 
             finally:
+                transformed.close()
+                batches.close()
                 if writer is not None:
                     writer.close()
-                try:
-                    pf.close()
-                except Exception:
-                    pass
+                if pf is not None:
+                    try:
+                        pf.close()
+                    except Exception:
+                        pass
 
+        metadata_cache.invalidate(self.output_path)
         logger.debug(
             f"Successfully wrote canonical .pbm file to {self.output_path} "
             f"from source {self.input_path}"
@@ -461,6 +616,7 @@ class IngestWriter:
                 np.array([zmin, zmax], dtype=float),
             )
         offset, scale, bits_per_axis = get_world_id_encoding_params(self.geometry.world_id_encoding)
+        curve = get_world_id_curve(self.geometry.world_id_encoding)
 
         # Derive block_id from available positional columns
         if "block_id" in df_work.columns:
@@ -468,7 +624,7 @@ class IngestWriter:
         elif "world_id" in df_work.columns:
             world_ids = df_work["world_id"].to_numpy(dtype=np.int64)
             xw, yw, zw = decode_world_coordinates(
-                world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis
+                world_ids, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
             )
             block_ids = self.geometry.row_index_from_xyz(xw, yw, zw, tol=tol).astype(np.uint32)
         elif {"x", "y", "z"}.issubset(df_work.columns):
@@ -516,7 +672,7 @@ class IngestWriter:
             y = df_work["y"].to_numpy(dtype=float)
             z = df_work["z"].to_numpy(dtype=float)
             df_work["world_id"] = encode_world_coordinates(
-                x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis
+                x, y, z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
             ).astype(np.int64)
 
         df_work = ParquetBlockModel._coerce_special_column_dtypes(df_work)
@@ -603,4 +759,5 @@ class IngestWriter:
             **schema_utils.build_parquet_compression_kwargs(ordered, compression_policy),
         )
 
+        metadata_cache.invalidate(self.output_path)
         logger.debug(f"Successfully wrote canonical .pbm file to {self.output_path} from DataFrame.")
@@ -0,0 +1,155 @@
+"""Process-wide cache of parsed ``.pbm`` footer metadata.
+
+Opening a :class:`~parq_blockmodel.blockmodel.ParquetBlockModel` needs the
+Parquet footer plus the embedded geometry (JSON), pandera schema (YAML) and
+compression policy. Services that open the same models repeatedly pay that
+parsing cost on every open, so the parsed objects are cached per file, keyed
+by the resolved path and the file fingerprint ``(size, mtime_ns)``, extended
+with the fingerprint of any column-family manifest
+(:mod:`~parq_blockmodel.io.column_sidecars`). Rewriting a file changes its
+fingerprint, so stale entries are never returned; writers in this package
+also drop the entry explicitly with :func:`invalidate`.
+
+The pandera schema is the expensive part to parse, so only its YAML text is
+read with the footer; it is parsed on first use and then shared.
+
+Cached objects are shared between callers and must be treated as read-only;
+:class:`~parq_blockmodel.blockmodel.ParquetBlockModel` shares them and only
+copies the mutable ones on first access through its public attributes.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from parq_blockmodel.geometry import RegularGeometry
+from parq_blockmodel.io import column_sidecars
+from parq_blockmodel.io import pbm_dataset
+from parq_blockmodel.io.block_index import file_fingerprint
+from parq_blockmodel.schema import utils as schema_utils
+
+if TYPE_CHECKING:
+    from pandera import DataFrameSchema  # type: ignore[import]
+
+MAX_CACHE_ENTRIES = 256
+
+_cache: "OrderedDict[Path, PbmFileMetadata]" = OrderedDict()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PbmFileMetadata:
+    """Parsed footer metadata of one ``.pbm`` file.
+
+    Attributes
+    ----------
+    fingerprint : tuple[int, ...]
+        ``(size, mtime_ns)`` of the file the metadata was read from, followed
+        by that of its column-family manifest, if any.
+    parquet_metadata : pq.FileMetaData
+        The Parquet footer; pass it to ``pq.ParquetFile(..., metadata=...)``
+        to open the file without re-reading the footer.
+    schema_arrow : pa.Schema
+        Arrow schema of the file, including column-family columns.
+    geometry : RegularGeometry or None
+        Embedded geometry, or None if the file has no geometry metadata.
+    schema_yaml : str or None
+        Embedded pandera schema as YAML, or None if not present. The parsed
+        schema is available as :attr:`schema`.
+    compression : dict or None
+        Embedded compression policy, or None if not present.
+    sort_order : dict or None
+        Recorded row order (see
+        :meth:`~parq_blockmodel.blockmodel.ParquetBlockModel.recluster`), or None.
+    sidecars : SidecarManifest or None
+        Column families attached to the file, or None.
+    """
+
+    fingerprint: tuple[int, ...]
+    parquet_metadata: pq.FileMetaData
+    schema_arrow: pa.Schema
+    geometry: Optional[RegularGeometry]
+    schema_yaml: Optional[str]
+    compression: Optional[dict[str, Any]]
+    sidecars: Optional[column_sidecars.SidecarManifest] = None
+    sort_order: Optional[dict[str, Any]] = None
+
+    @cached_property
+    def schema(self) -> Optional["DataFrameSchema"]:
+        """Embedded pandera schema, or None if not present; parsed on first access."""
+        return schema_utils.load_schema(self.schema_yaml) if self.schema_yaml is not None else None
+
+    @property
+    def num_rows(self) -> int:
+        return int(self.parquet_metadata.num_rows)
+
+
+def _read_file_metadata(path: Path, fingerprint: tuple[int, ...]) -> PbmFileMetadata:
+    parquet_metadata = pbm_dataset.read_metadata(path)
+    schema_arrow = parquet_metadata.schema.to_arrow_schema()
+    sidecars = None
+    if len(fingerprint) > 2:
+        sidecars = column_sidecars.load_sidecars(path, fingerprint[:2])
+        if sidecars is not None:
+            schema_arrow = column_sidecars.combined_schema(schema_arrow, path, sidecars)
+    payload = schema_utils.decode_embedded_metadata(parquet_metadata.metadata)
+    geometry_payload = (payload or {}).get("geometry")
+    geometry = RegularGeometry.from_metadata(geometry_payload) if isinstance(geometry_payload, dict) else None
+    return PbmFileMetadata(
+        fingerprint=fingerprint,
+        parquet_metadata=parquet_metadata,
+        schema_arrow=schema_arrow,
+        geometry=geometry,
+        schema_yaml=(payload or {}).get("schema_yaml"),
+        compression=schema_utils.compression_from_embedded_metadata(payload),
+        sidecars=sidecars,
+        sort_order=schema_utils.sort_order_from_embedded_metadata(payload),
+    )
+
+
+def get_file_metadata(path: Path) -> PbmFileMetadata:
+    """Return the parsed footer metadata of ``path``, reading it only when needed.
+
+    Parameters
+    ----------
+    path : Path
+        Path to a ``.pbm`` (or other Parquet) file, or a ``.pbmd`` dataset.
+
+    Returns
+    -------
+    PbmFileMetadata
+        The cached entry when the file fingerprint is unchanged, otherwise
+        freshly parsed metadata (which replaces the cached entry).
+    """
+    key = Path(path).resolve()
+    fingerprint = file_fingerprint(key) + column_sidecars.manifest_fingerprint(key)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry.fingerprint == fingerprint:
+            _cache.move_to_end(key)
+            return entry
+
+    entry = _read_file_metadata(key, fingerprint)
+    with _lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return entry
+
+
+def invalidate(path: Path) -> None:
+    """Drop the cached metadata of ``path``, if any."""
+    with _lock:
+        _cache.pop(Path(path).resolve(), None)
+
+
+def clear_metadata_cache() -> None:
+    """Drop all cached metadata."""
+    with _lock:
+        _cache.clear()
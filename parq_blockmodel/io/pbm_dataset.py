@@ -0,0 +1,660 @@
+"""Partitioned ``.pbmd`` block model datasets.
+
+A ``.pbmd`` dataset is a directory holding one canonical block model split
+across several Parquet files ("partitions"), plus a JSON manifest::
+
+    model.pbmd/
+        _manifest.json
+        part-00000-00000000000000000000.parquet
+        part-00000-00000000000000000001.parquet
+        ...
+
+Rows are assigned to partitions either by ranges of ``k`` (benches) or by
+Morton tiles of ``world_id`` (the bits above a fixed shift). Each partition is
+a Parquet file with the model's columns. The manifest carries the embedded
+``parq-blockmodel`` metadata (geometry, schema, compression) and lists the
+partitions in dataset row order, together with the min/max of their
+positional columns. :func:`open_dataset` turns those bounds into
+``pyarrow.dataset`` partition expressions, so filters on positional columns
+skip whole partitions.
+
+Rewrites never modify partition files in place. New files are written under
+the next *generation* number, then the manifest is replaced atomically and
+the previous generation's files are removed. Readers that resolve files
+through the manifest therefore always see a consistent dataset.
+"""
+import json
+import logging
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from parq_tools.utils import atomic_output_file
+
+from parq_blockmodel.schema.utils import PBM_METADATA_KEY
+
+if typing.TYPE_CHECKING:
+    from parq_blockmodel.geometry import RegularGeometry
+
+logger = logging.getLogger(__name__)
+
+DATASET_SUFFIX = ".pbmd"
+MANIFEST_FILENAME = "_manifest.json"
+MANIFEST_VERSION = 1
+PARTITION_SCHEMES = ("k", "world_id")
+# Positional columns whose per-partition min/max are recorded for pruning.
+BOUND_COLUMNS = ("block_id", "world_id", "i", "j", "k", "x", "y", "z")
+# Default partitioning splits a model into about this many partitions.
+DEFAULT_PARTITION_COUNT = 8
+
+
+def is_dataset_path(path: Path) -> bool:
+    """Return True if ``path`` names a partitioned ``.pbmd`` dataset."""
+    return Path(path).suffix == DATASET_SUFFIX
+
+
+def manifest_path(dataset_path: Path) -> Path:
+    """Return the manifest path of a ``.pbmd`` dataset."""
+    return Path(dataset_path) / MANIFEST_FILENAME
+
+
+@dataclass(frozen=True)
+class PbmPartition:
+    """One partition file of a ``.pbmd`` dataset.
+
+    Attributes
+    ----------
+    path : str
+        File name relative to the dataset directory.
+    num_rows : int
+        Number of rows in the partition.
+    bounds : dict[str, tuple]
+        Inclusive ``(min, max)`` of each positional column in the partition.
+    """
+
+    path: str
+    num_rows: int
+    bounds: dict[str, tuple[Any, Any]]
+
+    @property
+    def key(self) -> int:
+        """Partition key encoded in the file name."""
+        return int(Path(self.path).stem.rsplit("-", 1)[-1])
+
+    def expression(self, schema: pa.Schema) -> pc.Expression:
+        """Return a ``pyarrow.dataset`` expression true for every row of the partition."""
+        expression = pc.scalar(True)
+        for name, (lo, hi) in self.bounds.items():
+            if name not in schema.names:
+                continue
+            field_type = schema.field(name).type
+            expression = (
+                expression
+                & (pc.field(name) >= pa.scalar(lo, type=field_type))
+                & (pc.field(name) <= pa.scalar(hi, type=field_type))
+            )
+        return expression
+
+
+@dataclass(frozen=True)
+class PbmManifest:
+    """Contents of a ``.pbmd`` manifest.
+
+    Attributes
+    ----------
+    partition_by : str
+        ``"k"`` (bench ranges) or ``"world_id"`` (Morton tiles).
+    partition_size : int
+        Benches per partition for ``"k"``; number of low ``world_id`` bits
+        within a tile for ``"world_id"``.
+    generation : int
+        Generation number of the current partition files.
+    partitions : tuple[PbmPartition, ...]
+        Partitions in dataset row order.
+    metadata : dict
+        Decoded ``parq-blockmodel`` payload (geometry, schema, compression).
+    """
+
+    partition_by: str
+    partition_size: int
+    generation: int
+    partitions: tuple[PbmPartition, ...]
+    metadata: dict[str, Any]
+
+    @property
+    def num_rows(self) -> int:
+        return sum(partition.num_rows for partition in self.partitions)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "partition_by": self.partition_by,
+            "partition_size": self.partition_size,
+            "generation": self.generation,
+            "metadata": self.metadata,
+            "partitions": [
+                {"path": p.path, "num_rows": p.num_rows, "bounds": {k: list(v) for k, v in p.bounds.items()}}
+                for p in self.partitions
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "PbmManifest":
+        if payload.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported .pbmd manifest version: {payload.get('version')!r}.")
+        return cls(
+            partition_by=payload["partition_by"],
+            partition_size=int(payload["partition_size"]),
+            generation=int(payload["generation"]),
+            metadata=dict(payload["metadata"]),
+            partitions=tuple(
+                PbmPartition(
+                    path=p["path"],
+                    num_rows=int(p["num_rows"]),
+                    bounds={k: (v[0], v[1]) for k, v in p["bounds"].items()},
+                )
+                for p in payload["partitions"]
+            ),
+        )
+
+
+def read_manifest(dataset_path: Path) -> PbmManifest:
+    """Read the manifest of a ``.pbmd`` dataset.
+
+    Raises
+    ------
+    ValueError
+        If the manifest is missing or malformed.
+    """
+    path = manifest_path(dataset_path)
+    if not path.exists():
+        raise ValueError(f"{dataset_path} is not a .pbmd dataset: missing {MANIFEST_FILENAME}.")
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Malformed .pbmd manifest {path}: {exc}") from exc
+    return PbmManifest.from_dict(payload)
+
+
+def commit_manifest(dataset_path: Path, manifest: PbmManifest) -> None:
+    """Atomically replace the manifest, then remove files of older generations."""
+    dataset_path = Path(dataset_path)
+    with atomic_output_file(manifest_path(dataset_path)) as tmp_path:
+        tmp_path.write_text(json.dumps(manifest.to_dict(), indent=1), encoding="utf-8")
+    current = {partition.path for partition in manifest.partitions}
+    for stale in dataset_path.glob("part-*.parquet"):
+        if stale.name not in current:
+            try:
+                stale.unlink()
+            except OSError as exc:  # pragma: no cover - e.g. file still open on Windows
+                logger.debug("Could not remove stale partition %s: %s", stale, exc)
+
+
+def partition_file_name(generation: int, key: int) -> str:
+    return f"part-{generation:05d}-{key:020d}.parquet"
+
+
+class DatasetMetadata:
+    """Combined footer metadata of all partitions of a ``.pbmd`` dataset.
+
+    Mirrors the parts of :class:`pyarrow.parquet.FileMetaData` used by this
+    package. Row groups are numbered across partitions in manifest order, and
+    :attr:`metadata` carries the manifest's ``parq-blockmodel`` payload.
+    """
+
+    def __init__(self, dataset_path: Path, manifest: PbmManifest) -> None:
+        self.dataset_path = Path(dataset_path)
+        self.manifest = manifest
+        self.paths = [self.dataset_path / partition.path for partition in manifest.partitions]
+        self.footers = [pq.read_metadata(path) for path in self.paths]
+        self._row_groups = [
+            (index, rg) for index, footer in enumerate(self.footers) for rg in range(footer.num_row_groups)
+        ]
+        first = self.footers[0]
+        self.schema = first.schema
+        self.num_columns = first.num_columns
+        self.num_rows = sum(footer.num_rows for footer in self.footers)
+        self.num_row_groups = len(self._row_groups)
+        self.metadata = {
+            **dict(first.metadata or {}),
+            PBM_METADATA_KEY: json.dumps(manifest.metadata).encode("utf-8"),
+        }
+
+    def row_group(self, index: int) -> pq.RowGroupMetaData:
+        partition, rg = self._row_groups[index]
+        return self.footers[partition].row_group(rg)
+
+    def locate_row_group(self, index: int) -> tuple[int, int]:
+        """Return ``(partition index, row group within partition)``."""
+        return self._row_groups[index]
+
+
+def read_metadata(path: Path) -> typing.Union[pq.FileMetaData, DatasetMetadata]:
+    """Read footer metadata of a ``.pbm`` file or a ``.pbmd`` dataset."""
+    if is_dataset_path(path):
+        return DatasetMetadata(path, read_manifest(path))
+    return pq.read_metadata(path)
+
+
+class PartitionedParquetFile:
+    """Read-only :class:`pyarrow.parquet.ParquetFile` view over a ``.pbmd`` dataset.
+
+    Partitions are read one after another in manifest order, so row
+    positions match the dataset row order.
+    """
+
+    def __init__(self, dataset_path: Path, metadata: Optional[DatasetMetadata] = None) -> None:
+        self.metadata = metadata if metadata is not None else read_metadata(dataset_path)
+        self.schema = self.metadata.schema
+        self.schema_arrow = self.metadata.schema.to_arrow_schema()
+
+    def _partition_file(self, index: int) -> pq.ParquetFile:
+        return pq.ParquetFile(self.metadata.paths[index], metadata=self.metadata.footers[index])
+
+    def iter_batches(self, batch_size: int = 65536, columns: Optional[list[str]] = None, **kwargs) -> Iterator[pa.RecordBatch]:
+        for index in range(len(self.metadata.paths)):
+            pf = self._partition_file(index)
+            try:
+                yield from pf.iter_batches(batch_size=batch_size, columns=columns, **kwargs)
+            finally:
+                pf.close()
+
+    def read_row_groups(self, row_groups: Iterable[int], columns: Optional[list[str]] = None, **kwargs) -> pa.Table:
+        tables = []
+        for index in row_groups:
+            partition, rg = self.metadata.locate_row_group(int(index))
+            pf = self._partition_file(partition)
+            try:
+                tables.append(pf.read_row_group(rg, columns=columns, **kwargs))
+            finally:
+                pf.close()
+        if not tables:
+            schema = self.schema_arrow
+            if columns is not None:
+                schema = pa.schema([schema.field(name) for name in columns], metadata=schema.metadata)
+            return schema.empty_table()
+        return pa.concat_tables(tables)
+
+    def read_row_group(self, index: int, columns: Optional[list[str]] = None, **kwargs) -> pa.Table:
+        return self.read_row_groups([index], columns=columns, **kwargs)
+
+    def read(self, columns: Optional[list[str]] = None, **kwargs) -> pa.Table:
+        return self.read_row_groups(range(self.metadata.num_row_groups), columns=columns, **kwargs)
+
+    def close(self) -> None:
+        """Partition files are opened per call, so there is nothing to release."""
+
+
+def open_parquet_file(
+    path: Path, metadata: typing.Union[pq.FileMetaData, DatasetMetadata, None] = None
+) -> typing.Union[pq.ParquetFile, PartitionedParquetFile]:
+    """Open a ``.pbm`` file, or a ``.pbmd`` dataset through :class:`PartitionedParquetFile`."""
+    if is_dataset_path(path):
+        return PartitionedParquetFile(path, metadata=metadata)
+    return pq.ParquetFile(path, metadata=metadata)
+
+
+def open_dataset(dataset_path: Path, metadata: Optional[DatasetMetadata] = None) -> ds.FileSystemDataset:
+    """Open a ``.pbmd`` dataset as a :class:`pyarrow.dataset.Dataset`.
+
+    Each partition carries an expression built from its positional bounds,
+    so scans filtered on ``block_id``, ``world_id``, ijk or xyz only open
+    the partitions that can match. Fragments are in manifest (row) order.
+    """
+    metadata = metadata if metadata is not None else read_metadata(dataset_path)
+    schema = metadata.schema.to_arrow_schema()
+    return ds.FileSystemDataset.from_paths(
+        [str(path.resolve()) for path in metadata.paths],
+        schema=schema,
+        format=ds.ParquetFileFormat(),
+        filesystem=pafs.LocalFileSystem(),
+        partitions=[partition.expression(schema) for partition in metadata.manifest.partitions],
+    )
+
+
+def default_partition_size(
+    geometry: "RegularGeometry", partition_by: str, world_ids: Optional[np.ndarray] = None
+) -> int:
+    """Return a partition size giving about :data:`DEFAULT_PARTITION_COUNT` partitions.
+
+    For ``"world_id"`` this is the largest tile shift that still splits
+    ``world_ids`` into at least that many non-empty tiles.
+    """
+    if partition_by == "k":
+        return max(1, -(-int(geometry.local.shape[2]) // DEFAULT_PARTITION_COUNT))
+    if partition_by == "world_id":
+        if world_ids is None:
+            raise ValueError("world_ids are required to size world_id partitions.")
+        tiles = np.unique(np.asarray(world_ids, dtype=np.int64))
+        shift = 0
+        while tiles.size > 1:
+            coarser = np.unique(tiles >> 1)
+            if coarser.size < DEFAULT_PARTITION_COUNT:
+                break
+            tiles = coarser
+            shift += 1
+        return shift
+    raise ValueError(f"partition_by must be one of {PARTITION_SCHEMES}, got {partition_by!r}.")
+
+
+def partition_keys(
+    table: typing.Union[pa.Table, pa.RecordBatch],
+    geometry: "RegularGeometry",
+    partition_by: str,
+    partition_size: int,
+) -> np.ndarray:
+    """Return the partition key of each row of ``table``."""
+    names = table.schema.names
+    if partition_by == "k":
+        if "k" in names:
+            k = np.asarray(table.column(names.index("k")), dtype=np.int64)
+        elif "block_id" in names:
+            k = np.asarray(geometry.ijk_from_row_index(np.asarray(table.column(names.index("block_id"))))[2])
+        else:
+            raise ValueError("Partitioning by k requires a 'k' or 'block_id' column.")
+        return k.astype(np.int64) // int(partition_size)
+    if partition_by == "world_id":
+        if "world_id" not in names:
+            raise ValueError("Partitioning by world_id requires a 'world_id' column.")
+        world_ids = np.asarray(table.column(names.index("world_id")), dtype=np.int64)
+        return world_ids >> int(partition_size)
+    raise ValueError(f"partition_by must be one of {PARTITION_SCHEMES}, got {partition_by!r}.")
+
+
+def _column_bounds(table: pa.Table) -> dict[str, tuple[Any, Any]]:
+    bounds = {}
+    for name in BOUND_COLUMNS:
+        if name in table.schema.names and table.num_rows:
+            result = pc.min_max(table.column(name))
+            bounds[name] = (result["min"].as_py(), result["max"].as_py())
+    return bounds
+
+
+def _merge_bounds(current: dict[str, tuple[Any, Any]], update: dict[str, tuple[Any, Any]]) -> dict[str, tuple[Any, Any]]:
+    merged = dict(current)
+    for name, (lo, hi) in update.items():
+        if name in merged:
+            merged[name] = (min(merged[name][0], lo), max(merged[name][1], hi))
+        else:
+            merged[name] = (lo, hi)
+    return merged
+
+
+def partition_from_file(dataset_path: Path, file_name: str) -> PbmPartition:
+    """Describe an existing partition file, reading its positional bounds."""
+    path = Path(dataset_path) / file_name
+    pf = pq.ParquetFile(path)
+    try:
+        columns = [name for name in BOUND_COLUMNS if name in pf.schema_arrow.names]
+        table = pf.read(columns=columns)
+    finally:
+        pf.close()
+    return PbmPartition(path=file_name, num_rows=table.num_rows, bounds=_column_bounds(table))
+
+
+class PartitionedDatasetWriter:
+    """Stream tables into the partition files of a new dataset generation.
+
+    Rows are routed to partitions by :func:`partition_keys`, buffered per
+    partition, and flushed as row groups of about ``row_group_size`` rows.
+    Partitions due for a flush are written concurrently on ``workers``
+    threads. Call :meth:`close` to finish the files and obtain the
+    partition list (in key order), or :meth:`abort` to remove them.
+
+    Parameters
+    ----------
+    dataset_path : Path
+        Target ``.pbmd`` directory (created if missing).
+    geometry : RegularGeometry
+        Geometry used to derive ``k`` from ``block_id`` when needed.
+    partition_by : str
+        ``"k"`` or ``"world_id"``.
+    partition_size : int
+        See :class:`PbmManifest`.
+    generation : int
+        Generation number used in the partition file names.
+    schema_metadata : dict[bytes, bytes]
+        Key-value metadata stamped on every partition file.
+    compression_kwargs : Callable[[list[str]], dict]
+        Returns ``pq.ParquetWriter`` compression arguments for given columns.
+    row_group_size : int, default 1_000_000
+        Rows buffered per partition before a flush.
+    workers : int, default 1
+        Threads writing partitions concurrently.
+    """
+
+    def __init__(
+        self,
+        dataset_path: Path,
+        geometry: "RegularGeometry",
+        partition_by: str,
+        partition_size: int,
+        generation: int,
+        schema_metadata: dict[bytes, bytes],
+        compression_kwargs: Callable[[list[str]], dict[str, Any]],
+        row_group_size: int = 1_000_000,
+        workers: int = 1,
+    ) -> None:
+        if partition_by not in PARTITION_SCHEMES:
+            raise ValueError(f"partition_by must be one of {PARTITION_SCHEMES}, got {partition_by!r}.")
+        if partition_size < (1 if partition_by == "k" else 0):
+            raise ValueError("partition_size must be >= 1 for k and >= 0 for world_id partitioning.")
+        if workers < 1:
+            raise ValueError("workers must be >= 1.")
+        self.dataset_path = Path(dataset_path)
+        self.geometry = geometry
+        self.partition_by = partition_by
+        self.partition_size = int(partition_size)
+        self.generation = int(generation)
+        self.schema_metadata = schema_metadata
+        self.compression_kwargs = compression_kwargs
+        self.row_group_size = int(row_group_size)
+        self.workers = int(workers)
+        self._schema: Optional[pa.Schema] = None
+        self._writers: dict[int, pq.ParquetWriter] = {}
+        self._buffers: dict[int, list[pa.Table]] = {}
+        self._buffered_rows: dict[int, int] = {}
+        self._rows: dict[int, int] = {}
+        self._bounds: dict[int, dict[str, tuple[Any, Any]]] = {}
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parq-blockmodel-partition") if workers > 1 else None
+        self.dataset_path.mkdir(parents=True, exist_ok=True)
+
+    def write_table(self, table: typing.Union[pa.Table, pa.RecordBatch]) -> None:
+        """Route the rows of ``table`` to their partitions."""
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+        if self._schema is None:
+            self._schema = table.schema.with_metadata(self.schema_metadata)
+        elif table.schema.remove_metadata() != self._schema.remove_metadata():
+            table = table.cast(self._schema.remove_metadata())
+        if not table.num_rows:
+            return
+
+        keys = partition_keys(table, self.geometry, self.partition_by, self.partition_size)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        ends = np.r_[starts[1:], sorted_keys.size]
+        for start, end in zip(starts, ends):
+            key = int(sorted_keys[start])
+            self._buffers.setdefault(key, []).append(table.take(order[start:end]))
+            self._buffered_rows[key] = self._buffered_rows.get(key, 0) + int(end - start)
+
+        ready = [key for key, rows in self._buffered_rows.items() if rows >= self.row_group_size]
+        if sum(self._buffered_rows.values()) > 4 * self.row_group_size:
+            ready = [key for key, rows in self._buffered_rows.items() if rows]
+        self._flush(ready)
+
+    def _flush(self, keys: list[int]) -> None:
+        if not keys:
+            return
+        if self._pool is None:
+            for key in keys:
+                self._write_partition(key)
+        else:
+            for future in [self._pool.submit(self._write_partition, key) for key in keys]:
+                future.result()
+
+    def _write_partition(self, key: int) -> None:
+        table = pa.concat_tables(self._buffers.pop(key)).replace_schema_metadata(self.schema_metadata)
+        self._buffered_rows[key] = 0
+        writer = self._writers.get(key)
+        if writer is None:
+            writer = pq.ParquetWriter(
+                self.dataset_path / partition_file_name(self.generation, key),
+                self._schema,
+                **self.compression_kwargs(self._schema.names),
+            )
+            self._writers[key] = writer
+        writer.write_table(table)
+        self._rows[key] = self._rows.get(key, 0) + table.num_rows
+        self._bounds[key] = _merge_bounds(self._bounds.get(key, {}), _column_bounds(table))
+
+    def close(self, schema: Optional[pa.Schema] = None) -> list[PbmPartition]:
+        """Flush and close all partitions.
+
+        ``schema`` is used to write a single empty partition when no rows
+        were written.
+        """
+        try:
+            self._flush([key for key, rows in self._buffered_rows.items() if rows])
+        finally:
+            self._close_writers()
+        if not self._rows:
+            if self._schema is None and schema is None:
+                raise ValueError("Cannot write an empty dataset without a schema.")
+            empty_schema = (self._schema or schema).with_metadata(self.schema_metadata)
+            file_name = partition_file_name(self.generation, 0)
+            pq.write_table(empty_schema.empty_table(), self.dataset_path / file_name,
+                           **self.compression_kwargs(empty_schema.names))
+            return [PbmPartition(path=file_name, num_rows=0, bounds={})]
+        return [
+            PbmPartition(path=partition_file_name(self.generation, key), num_rows=self._rows[key], bounds=self._bounds[key])
+            for key in sorted(self._rows)
+        ]
+
+    def abort(self) -> None:
+        """Close and remove all files written by this writer."""
+        self._close_writers()
+        for key in list(self._rows) + list(self._writers):
+            path = self.dataset_path / partition_file_name(self.generation, key)
+            if path.exists():
+                path.unlink()
+
+    def _close_writers(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+
+def write_dataset(
+    dataset_path: Path,
+    tables: Iterable[typing.Union[pa.Table, pa.RecordBatch]],
+    geometry: "RegularGeometry",
+    partition_by: str,
+    partition_size: int,
+    schema_metadata: dict[bytes, bytes],
+    compression_kwargs: Callable[[list[str]], dict[str, Any]],
+    metadata_payload: dict[str, Any],
+    schema: Optional[pa.Schema] = None,
+    row_group_size: int = 1_000_000,
+    workers: int = 1,
+) -> PbmManifest:
+    """Write ``tables`` as the next generation of a ``.pbmd`` dataset and commit it.
+
+    An existing dataset at ``dataset_path`` is replaced only once the new
+    partitions are complete.
+
+    Returns
+    -------
+    PbmManifest
+        The committed manifest.
+    """
+    dataset_path = Path(dataset_path)
+    generation = read_manifest(dataset_path).generation + 1 if manifest_path(dataset_path).exists() else 0
+    writer = PartitionedDatasetWriter(
+        dataset_path,
+        geometry=geometry,
+        partition_by=partition_by,
+        partition_size=partition_size,
+        generation=generation,
+        schema_metadata=schema_metadata,
+        compression_kwargs=compression_kwargs,
+        row_group_size=row_group_size,
+        workers=workers,
+    )
+    try:
+        for table in tables:
+            writer.write_table(table)
+        partitions = writer.close(schema=schema)
+    except BaseException:
+        writer.abort()
+        raise
+    manifest = PbmManifest(
+        partition_by=partition_by,
+        partition_size=int(partition_size),
+        generation=generation,
+        partitions=tuple(partitions),
+        metadata=metadata_payload,
+    )
+    commit_manifest(dataset_path, manifest)
+    return manifest
+
+
+def rewrite_partitions(
+    dataset_path: Path,
+    rewrite: Callable[[Path, Path], None],
+    metadata_payload: dict[str, Any],
+    workers: int = 1,
+) -> PbmManifest:
+    """Rewrite every partition as the next generation and commit the result.
+
+    ``rewrite(source, target)`` must write the new content of ``source`` to
+    ``target``; calls for different partitions run concurrently on
+    ``workers`` threads. Row counts are re-read from the new files, while
+    positional bounds are kept, so ``rewrite`` must not move rows between
+    partitions.
+    """
+    from parq_blockmodel.io.ingest_utils import ordered_map
+
+    dataset_path = Path(dataset_path)
+    manifest = read_manifest(dataset_path)
+    generation = manifest.generation + 1
+    targets = [dataset_path / partition_file_name(generation, partition.key) for partition in manifest.partitions]
+
+    def run(index: int) -> PbmPartition:
+        partition = manifest.partitions[index]
+        rewrite(dataset_path / partition.path, targets[index])
+        return PbmPartition(
+            path=targets[index].name,
+            num_rows=int(pq.read_metadata(targets[index]).num_rows),
+            bounds=partition.bounds,
+        )
+
+    try:
+        partitions = list(ordered_map(run, range(len(manifest.partitions)), workers=max(1, workers)))
+    except BaseException:
+        for target in targets:
+            if target.exists():
+                target.unlink()
+        raise
+    new_manifest = PbmManifest(
+        partition_by=manifest.partition_by,
+        partition_size=manifest.partition_size,
+        generation=generation,
+        partitions=tuple(partitions),
+        metadata=metadata_payload,
+    )
+    commit_manifest(dataset_path, new_manifest)
+    return new_manifest
@@ -0,0 +1,582 @@
+"""Pure utility functions for reading canonical .pbm files.
+
+This module provides stateless helpers used by the read paths of
+:class:`parq_blockmodel.blockmodel.ParquetBlockModel`, such as turning
+user-facing row filters into pyarrow dataset expressions that can be
+pushed down to the Parquet scanner.
+"""
+import logging
+import queue
+import threading
+import typing
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+FilterTuple = tuple[str, str, typing.Any]
+FilterSpec = Union[list[FilterTuple], list[list[FilterTuple]], pc.Expression]
+IndexRange = tuple[int, int]
+IJKWindow = tuple[IndexRange, IndexRange, IndexRange]
+
+T = typing.TypeVar("T")
+
+
+def filter_columns(filters: Optional[FilterSpec]) -> set[str]:
+    """Return the column names referenced by DNF-style ``filters``.
+
+    Parameters
+    ----------
+    filters : list of tuples, list of lists of tuples, pyarrow Expression, or None
+        Filters in the form accepted by :func:`pyarrow.parquet.read_table`.
+
+    Returns
+    -------
+    set[str]
+        Referenced column names. Expressions cannot be introspected and
+        return an empty set.
+    """
+    if filters is None or isinstance(filters, pc.Expression):
+        return set()
+    groups = filters if filters and isinstance(filters[0], list) else [filters]
+    return {str(predicate[0]) for group in groups for predicate in group}
+
+
+def expression_columns(expression: pc.Expression, schema: pa.Schema) -> list[str]:
+    """Return the columns of ``schema`` referenced by ``expression``.
+
+    Expressions cannot be introspected, so each column is dropped in turn and
+    the expression is bound against the remaining columns of an empty table.
+
+    Parameters
+    ----------
+    expression : pyarrow.compute.Expression
+        Filter expression.
+    schema : pa.Schema
+        Schema the expression is evaluated against.
+
+    Returns
+    -------
+    list[str]
+        Referenced column names, in schema order.
+    """
+    referenced = []
+    for name in schema.names:
+        reduced = pa.schema([field for field in schema if field.name != name])
+        try:
+            reduced.empty_table().filter(expression)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            referenced.append(name)
+    return referenced
+
+
+def resolve_filter_expression(
+    filters: Optional[FilterSpec],
+    available_columns: typing.Iterable[str],
+) -> Optional[pc.Expression]:
+    """Validate ``filters`` and convert them to a pyarrow dataset expression.
+
+    Parameters
+    ----------
+    filters : list of tuples, list of lists of tuples, pyarrow Expression, or None
+        Row filters. Tuples follow the ``(column, op, value)`` convention of
+        :func:`pyarrow.parquet.read_table`, where ``op`` is one of ``==``,
+        ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` or ``not in``. A flat list
+        is a conjunction (AND); a list of lists is a disjunction (OR) of
+        conjunctions. Expressions are passed through unchanged.
+    available_columns : Iterable[str]
+        Column names physically present in the file being read.
+
+    Returns
+    -------
+    pyarrow.compute.Expression or None
+        The filter expression, or None when no filtering is requested.
+
+    Raises
+    ------
+    ValueError
+        If the filters reference columns that are not present in the file.
+    """
+    if filters is None:
+        return None
+    if isinstance(filters, pc.Expression):
+        return filters
+    if not filters:
+        return None
+
+    available = set(available_columns)
+    unknown = sorted(c for c in filter_columns(filters) if c not in available)
+    if unknown:
+        raise ValueError(
+            "Filters can only reference persisted columns; "
+            f"not found on disk: {unknown}"
+        )
+    return pq.filters_to_expression(filters)
+
+
+def clip_index_range(
+    bounds: Optional[typing.Sequence[int]],
+    size: int,
+) -> Optional[IndexRange]:
+    """Clip an inclusive ``(lo, hi)`` index range to ``[0, size - 1]``.
+
+    Parameters
+    ----------
+    bounds : sequence of two ints, or None
+        Inclusive index bounds. ``None`` selects the whole axis.
+    size : int
+        Number of blocks along the axis.
+
+    Returns
+    -------
+    tuple[int, int] or None
+        The clipped range, or None when it does not intersect the axis.
+    """
+    if bounds is None:
+        return 0, size - 1
+    if len(bounds) != 2:
+        raise ValueError(f"Index window bounds must be a (lo, hi) pair, got {bounds!r}.")
+    lo = max(int(bounds[0]), 0)
+    hi = min(int(bounds[1]), size - 1)
+    if lo > hi:
+        return None
+    return lo, hi
+
+
+def clip_ijk_window(
+    shape: typing.Sequence[int],
+    i: Optional[typing.Sequence[int]] = None,
+    j: Optional[typing.Sequence[int]] = None,
+    k: Optional[typing.Sequence[int]] = None,
+) -> Optional[IJKWindow]:
+    """Clip inclusive ijk bounds to a grid ``shape``.
+
+    Returns
+    -------
+    tuple of three (lo, hi) ranges, or None
+        The clipped window, or None when the window lies outside the grid.
+    """
+    ranges = (
+        clip_index_range(i, int(shape[0])),
+        clip_index_range(j, int(shape[1])),
+        clip_index_range(k, int(shape[2])),
+    )
+    if any(r is None for r in ranges):
+        return None
+    return typing.cast(IJKWindow, ranges)
+
+
+def ijk_window_block_id_ranges(shape: typing.Sequence[int], window: IJKWindow) -> np.ndarray:
+    """Decompose an ijk window into contiguous inclusive block_id runs.
+
+    Block ids follow the canonical C-order ``ravel_multi_index`` layout,
+    so ``k`` runs are contiguous within each ``(i, j)`` column, and whole
+    ``j``/``k`` planes collapse into longer runs.
+
+    Parameters
+    ----------
+    shape : sequence of three ints
+        Grid shape ``(ni, nj, nk)``.
+    window : tuple of three (lo, hi) ranges
+        Clipped inclusive ijk window (see :func:`clip_ijk_window`).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(n_runs, 2)`` with inclusive ``[lo, hi]`` block ids,
+        sorted ascending.
+    """
+    _, nj, nk = (int(v) for v in shape)
+    (i0, i1), (j0, j1), (k0, k1) = window
+    ii = np.arange(i0, i1 + 1, dtype=np.int64)
+    if k0 == 0 and k1 == nk - 1:
+        if j0 == 0 and j1 == nj - 1:
+            return np.array([[i0 * nj * nk, (i1 + 1) * nj * nk - 1]], dtype=np.int64)
+        lo = (ii * nj + j0) * nk
+        hi = (ii * nj + j1) * nk + nk - 1
+    else:
+        jj = np.arange(j0, j1 + 1, dtype=np.int64)
+        base = ((ii[:, None] * nj + jj[None, :]) * nk).ravel()
+        lo = base + k0
+        hi = base + k1
+    return np.column_stack([lo, hi])
+
+
+def ijk_window_block_ids(shape: typing.Sequence[int], window: IJKWindow) -> np.ndarray:
+    """Return every block id inside an ijk window in ascending C-order."""
+    runs = ijk_window_block_id_ranges(shape, window)
+    lengths = runs[:, 1] - runs[:, 0] + 1
+    starts = np.repeat(runs[:, 0] - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+    return starts + np.arange(int(lengths.sum()), dtype=np.int64)
+
+
+def coalesce_ranges(runs: np.ndarray, max_ranges: int) -> np.ndarray:
+    """Merge sorted inclusive ``[lo, hi]`` runs across their smallest gaps.
+
+    Parameters
+    ----------
+    runs : np.ndarray
+        Array of shape ``(n, 2)`` with disjoint runs sorted ascending.
+    max_ranges : int
+        Maximum number of runs to return.
+
+    Returns
+    -------
+    np.ndarray
+        At most ``max_ranges`` runs covering every input run.
+    """
+    if len(runs) <= max_ranges:
+        return runs
+    gaps = runs[1:, 0] - runs[:-1, 1]
+    splits = np.sort(np.argpartition(gaps, -(max_ranges - 1))[-(max_ranges - 1):]) if max_ranges > 1 else []
+    starts = runs[np.r_[0, np.asarray(splits, dtype=np.int64) + 1], 0]
+    ends = runs[np.r_[np.asarray(splits, dtype=np.int64), len(runs) - 1], 1]
+    return np.column_stack([starts, ends])
+
+
+def ijk_window_mask(shape: typing.Sequence[int], window: Optional[IJKWindow], block_ids: np.ndarray) -> np.ndarray:
+    """Return a boolean mask of the ``block_ids`` inside an ijk window."""
+    if window is None:
+        return np.zeros(np.shape(block_ids), dtype=bool)
+    ijk = np.unravel_index(np.asarray(block_ids, dtype=np.int64), tuple(int(v) for v in shape))
+    inside = np.ones(np.shape(block_ids), dtype=bool)
+    for values, (lo, hi) in zip(ijk, window):
+        inside &= (values >= lo) & (values <= hi)
+    return inside
+
+
+def ijk_window_is_exact(shape: typing.Sequence[int], window: Optional[IJKWindow],
+                        available_columns: typing.Iterable[str]) -> bool:
+    """Return whether :func:`ijk_window_filters` selects exactly the window."""
+    if window is None or {"i", "j", "k"}.issubset(set(available_columns)):
+        return True
+    return len(ijk_window_block_id_ranges(shape, window)) == 1
+
+
+def ijk_window_filters(
+    shape: typing.Sequence[int],
+    window: Optional[IJKWindow],
+    available_columns: typing.Iterable[str],
+    max_ranges: int = 16,
+) -> pc.Expression:
+    """Build a pushdown filter expression selecting an ijk window.
+
+    The expression always bounds ``block_id`` by the window envelope so row
+    groups can be pruned using ``block_id`` statistics. When ``i``, ``j``
+    and ``k`` are persisted they refine the envelope exactly. Otherwise the
+    window's contiguous ``block_id`` runs are coalesced into at most
+    ``max_ranges`` ranges, keeping the expression small; the rows read may
+    then include blocks outside the window (see :func:`ijk_window_is_exact`)
+    and must be refined with :func:`ijk_window_mask`.
+
+    Parameters
+    ----------
+    shape : sequence of three ints
+        Grid shape ``(ni, nj, nk)``.
+    window : tuple of three (lo, hi) ranges, or None
+        Clipped inclusive ijk window. ``None`` selects no rows.
+    available_columns : Iterable[str]
+        Column names physically present in the file being read.
+    max_ranges : int, default 16
+        Maximum number of ``block_id`` ranges pushed down without ``i``/``j``/``k``.
+
+    Returns
+    -------
+    pyarrow.compute.Expression
+        Filter expression suitable for :func:`pyarrow.parquet.read_table`.
+    """
+    block_id = pc.field("block_id")
+    if window is None:
+        return block_id < 0
+
+    runs = ijk_window_block_id_ranges(shape, window)
+    expression = (block_id >= int(runs[0, 0])) & (block_id <= int(runs[-1, 1]))
+    if len(runs) == 1:
+        return expression
+
+    available = set(available_columns)
+    if {"i", "j", "k"}.issubset(available):
+        for name, (lo, hi) in zip(["i", "j", "k"], window):
+            expression = expression & (pc.field(name) >= lo) & (pc.field(name) <= hi)
+        return expression
+
+    run_expression = None
+    for lo, hi in coalesce_ranges(runs, max_ranges):
+        term = (block_id >= int(lo)) & (block_id <= int(hi))
+        run_expression = term if run_expression is None else run_expression | term
+    return expression & run_expression
+
+
+class _PrefetchError:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_PREFETCH_DONE = object()
+
+
+def prefetch_iter(iterable: Iterable[T], prefetch: int = 2) -> Iterator[T]:
+    """Iterate ``iterable`` with a bounded read-ahead on a background thread.
+
+    While the caller processes one item, up to ``prefetch`` following items
+    are produced (e.g. record batches decoded) on a worker thread, so I/O and
+    decoding overlap with the caller's CPU work. Arrow releases the GIL while
+    decoding, so the overlap is real for Parquet batch iterators.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        Source of items, typically a record batch iterator.
+    prefetch : int
+        Maximum number of items buffered ahead of the consumer. ``0`` disables
+        read-ahead and iterates ``iterable`` directly.
+
+    Returns
+    -------
+    Iterator
+        The items of ``iterable``, in order. Exceptions raised by the source
+        are re-raised in the consuming thread. Closing the iterator (or
+        abandoning it) stops the worker thread.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0.")
+    return _prefetch(iterable, prefetch)
+
+
+def _prefetch(iterable: Iterable[T], prefetch: int) -> Iterator[T]:
+    if prefetch == 0:
+        yield from iterable
+        return
+
+    buffer: "queue.Queue[typing.Any]" = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: typing.Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(_PREFETCH_DONE)
+        except BaseException as exc:
+            put(_PrefetchError(exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    worker = threading.Thread(target=produce, name="parq-blockmodel-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.exc
+            yield item
+    finally:
+        # Also reached when the consumer stops early: release the worker.
+        stop.set()
+        worker.join()
+
+
+def arrow_to_numpy(data: Union[pa.Table, pa.RecordBatch]) -> dict[str, np.ndarray]:
+    """Convert Arrow columns to a dict of NumPy arrays.
+
+    Single-chunk numeric columns without nulls are returned as zero-copy views
+    of the Arrow buffers; other columns (multiple chunks, nulls, strings or
+    dictionaries) are materialised. Dictionary columns are decoded to their
+    values.
+
+    Parameters
+    ----------
+    data : pyarrow.Table or pyarrow.RecordBatch
+        Arrow data to convert.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Column name to array, in column order.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    for name, column in zip(data.schema.names, data.columns):
+        if isinstance(column, pa.ChunkedArray) and column.num_chunks == 1:
+            column = column.chunk(0)
+        arrays[name] = column.to_numpy(zero_copy_only=False)
+    return arrays
+
+
+class DenseColumnBuilder:
+    """Scatter batches of one column into a flat dense array by block id.
+
+    Numeric columns are written into a NumPy array pre-filled with
+    ``fill_value``. Dictionary (categorical) and string columns are stored as
+    integer codes, with ``-1`` marking missing cells, plus a category table;
+    string categories are sorted, matching :class:`pandas.Categorical`.
+
+    Parameters
+    ----------
+    size : int
+        Number of cells in the dense grid.
+    fill_value : scalar, default np.nan
+        Value for cells that receive no data. Integer and boolean columns are
+        promoted when ``fill_value`` cannot be represented in their dtype.
+    complete : bool, default False
+        True when every cell is known to receive a value (a dense model read
+        without filters), in which case dtypes are never promoted.
+    dtype : np.dtype or pd.CategoricalDtype, optional
+        Dtype of the source column. A categorical dtype fixes the category
+        table (order included) up front, so builders filled from different
+        subsets of the rows agree on their codes; other dtypes set the dtype
+        of the result when no values are added.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        fill_value: typing.Any = np.nan,
+        complete: bool = False,
+        dtype: Optional[Union[np.dtype, pd.CategoricalDtype]] = None,
+    ):
+        self.size = int(size)
+        self.fill_value = fill_value
+        self.complete = complete
+        self.dtype = dtype
+        self._values: Optional[np.ndarray] = None
+        self._codes: Optional[np.ndarray] = None
+        self._categories: dict[typing.Any, int] = {}
+        self._sort_categories = False
+        if isinstance(dtype, pd.CategoricalDtype):
+            self._codes = np.full(self.size, -1, dtype=np.int32)
+            self._categories = {value: code for code, value in enumerate(dtype.categories)}
+
+    def add(self, block_ids: np.ndarray, values: Union[pa.Array, pa.ChunkedArray]) -> None:
+        """Scatter ``values`` into the cells addressed by ``block_ids``."""
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+            # Seeded categories are already in source order.
+            self._sort_categories = not isinstance(self.dtype, pd.CategoricalDtype)
+            values = pc.dictionary_encode(values)
+        if pa.types.is_dictionary(values.type):
+            self._add_codes(block_ids, values)
+        else:
+            self._add_values(block_ids, values.to_numpy(zero_copy_only=False))
+
+    def finish(self, shape: typing.Sequence[int]) -> tuple[np.ndarray, Optional[pd.Index]]:
+        """Return the dense C-order array and, for categorical columns, its categories."""
+        shape = tuple(int(v) for v in shape)
+        if self._codes is not None:
+            categories = pd.Index(list(self._categories))
+            codes = self._codes
+            if self._sort_categories and len(categories):
+                order = np.argsort(categories.to_numpy(), kind="stable")
+                remap = np.empty(len(order), dtype=codes.dtype)
+                remap[order] = np.arange(len(order), dtype=codes.dtype)
+                valid = codes >= 0
+                codes = codes.copy()
+                codes[valid] = remap[codes[valid]]
+                categories = categories[order]
+            return codes.reshape(shape), categories
+        if self._values is None:
+            dtype = np.dtype(self.dtype) if self.dtype is not None else np.dtype(np.float64)
+            self._values = np.full(self.size, self.fill_value, dtype=self._fill_dtype(dtype))
+        return self._values.reshape(shape), None
+
+    def _fill_dtype(self, dtype: np.dtype) -> np.dtype:
+        if self.complete:
+            return dtype
+        try:
+            return np.result_type(dtype, self.fill_value)
+        except TypeError:
+            return np.dtype(object)
+
+    def _add_values(self, block_ids: np.ndarray, values: np.ndarray) -> None:
+        if self._values is None:
+            dtype = self._fill_dtype(values.dtype)
+            if self.complete:
+                self._values = np.zeros(self.size, dtype=dtype)
+            else:
+                self._values = np.full(self.size, self.fill_value, dtype=dtype)
+        elif values.dtype != self._values.dtype:
+            try:
+                promoted = np.result_type(self._values.dtype, values.dtype)
+            except TypeError:
+                promoted = np.dtype(object)
+            if promoted != self._values.dtype:
+                self._values = self._values.astype(promoted)
+        self._values[block_ids] = values
+
+    def _add_codes(self, block_ids: np.ndarray, values: pa.DictionaryArray) -> None:
+        if self._codes is None:
+            self._codes = np.full(self.size, -1, dtype=np.int32)
+        dictionary = values.dictionary.to_pylist()
+        lookup = np.fromiter(
+            (self._categories.setdefault(value, len(self._categories)) for value in dictionary),
+            dtype=np.int32,
+            count=len(dictionary),
+        )
+        indices = pc.fill_null(values.indices, -1).to_numpy(zero_copy_only=False).astype(np.int64)
+        codes = np.full(len(indices), -1, dtype=np.int32)
+        valid = indices >= 0
+        codes[valid] = lookup[indices[valid]]
+        self._codes[block_ids] = codes
+
+
+def collect_categories(batches: Iterable[Union[pa.RecordBatch, pa.Table]]) -> dict[str, pd.CategoricalDtype]:
+    """Return the categorical dtype of every column of ``batches``.
+
+    Only the dictionaries (or distinct values) of each batch are kept, so
+    memory is bounded by the number of categories rather than rows. The
+    categories follow :class:`DenseColumnBuilder`: dictionary columns keep
+    their first-seen dictionary order and ``ordered`` flag, and string
+    columns are sorted, matching :class:`pandas.Categorical`.
+
+    Parameters
+    ----------
+    batches : Iterable[pa.RecordBatch or pa.Table]
+        Batches holding only dictionary or string columns.
+
+    Returns
+    -------
+    dict[str, pd.CategoricalDtype]
+        Dtype per column.
+    """
+    seen: dict[str, dict[typing.Any, None]] = {}
+    ordered: dict[str, bool] = {}
+    sort: dict[str, bool] = {}
+    for batch in batches:
+        for name, column in zip(batch.schema.names, batch.columns):
+            if isinstance(column, pa.ChunkedArray):
+                column = column.combine_chunks()
+            if pa.types.is_dictionary(column.type):
+                ordered[name] = ordered.get(name, False) or bool(column.type.ordered)
+                values = column.dictionary
+            else:
+                sort[name] = True
+                values = pc.unique(column).drop_null()
+            categories = seen.setdefault(name, {})
+            for value in values.to_pylist():
+                categories.setdefault(value, None)
+    dtypes: dict[str, pd.CategoricalDtype] = {}
+    for name, categories in seen.items():
+        values = list(categories)
+        if sort.get(name) and values:
+            values = sorted(values)
+        dtypes[name] = pd.CategoricalDtype(values, ordered=ordered.get(name, False))
+    return dtypes
@@ -110,17 +110,18 @@ class PolygonField:
     def evaluate(self, grid: Any) -> np.ndarray:
         """Return a boolean mask where centroid XY points intersect polygon geometry.
 
-        Evaluation is strictly 2D in the world XY plane. Z is ignored.
-        Boundary points are classified as inside.
+        Evaluation is strictly 2D in the world XY plane. Z is ignored, so the
+        polygon test runs once per block column. Boundary points are
+        classified as inside.
         """
         geometry = _resolve_geometry_like(grid)
-        x = np.asarray(geometry.centroid_x, dtype=float)
-        y = np.asarray(geometry.centroid_y, dtype=float)
-
-        if hasattr(shapely, "intersects_xy"):
-            # intersects(point, polygon) includes interior and boundary.
-            mask = shapely.intersects_xy(self.geometry, x, y)
-        else:
-            points = shapely.points(x, y)
-            mask = shapely.intersects(self.geometry, points)
-        return np.asarray(mask, dtype=bool)
+
+        def intersects(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+            x = np.asarray(x, dtype=float)
+            y = np.asarray(y, dtype=float)
+            if hasattr(shapely, "intersects_xy"):
+                # intersects(point, polygon) includes interior and boundary.
+                return shapely.intersects_xy(self.geometry, x, y)
+            return shapely.intersects(self.geometry, shapely.points(x, y))
+
+        return np.asarray(geometry.evaluate_xy(intersects), dtype=bool)
@@ -11,10 +11,14 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-from parq_blockmodel.reblocking.conversion import tabular_to_3d_dict, dict_3d_to_tabular
+from parq_blockmodel.reblocking.conversion import dict_3d_to_tabular
 from parq_blockmodel.reblocking.downsample import downsample_attributes
 from parq_blockmodel.reblocking.upsample import upsample_attributes
-from parq_blockmodel.utils.spatial_encoding import encode_world_coordinates, get_world_id_encoding_params
+from parq_blockmodel.utils.spatial_encoding import (
+    encode_world_coordinates,
+    get_world_id_curve,
+    get_world_id_encoding_params,
+)
 from parq_blockmodel.io.ingest_utils import build_world_id_encoding_from_xyz
 
 if TYPE_CHECKING:
@@ -61,9 +65,9 @@ def _prepare_arrays_and_index(
     the new :class:`RegularGeometry` to avoid inconsistencies.
     """
 
-    # Read a dense ijk-indexed view of the data. ``ParquetBlockModel.read``
-    # already returns a C-order (i, j, k) MultiIndex when ``index="ijk"``,
-    # which is exactly what ``tabular_to_3d_dict`` expects.
+    # Scatter the data straight into dense C-order (i, j, k) arrays by
+    # block_id; the result has the same layout as ``tabular_to_3d_dict``
+    # without building a dense MultiIndex and reindexing.
     #
     # Only load true attributes; drop geometry/identity columns which
     # will be regenerated for the reblocked grid.
@@ -72,8 +76,7 @@ def _prepare_arrays_and_index(
         cols = [c for c in cols if c in requested_columns]
         extras = sorted(c for c in requested_columns if c not in cols)
         cols.extend(extras)
-    df: pd.DataFrame = blockmodel.read(columns=cols, index="ijk", dense=True)
-    arrays, categories = tabular_to_3d_dict(df)
+    arrays, categories = blockmodel.read_dense_arrays(columns=cols)
     return arrays, categories
 
 def _calculate_factors(blockmodel, new_block_size):
@@ -197,6 +200,7 @@ def downsample_blockmodel(blockmodel, new_block_size, aggregation_config) -> "Pa
             reblocked_df["z"].to_numpy(dtype=float),
         )
     offset, scale, bits_per_axis = get_world_id_encoding_params(new_geometry.world_id_encoding)
+    curve = get_world_id_curve(new_geometry.world_id_encoding)
     reblocked_df["world_id"] = encode_world_coordinates(
         reblocked_df["x"].to_numpy(dtype=float),
         reblocked_df["y"].to_numpy(dtype=float),
@@ -204,6 +208,7 @@ def downsample_blockmodel(blockmodel, new_block_size, aggregation_config) -> "Pa
         offset=offset,
         scale=scale,
         bits_per_axis=bits_per_axis,
+        curve=curve,
     ).astype(np.int64)
     ordered_cols = ["block_id", "world_id", "x", "y", "z", "i", "j", "k"]
     ordered_cols.extend([c for c in reblocked_df.columns if c not in ordered_cols])
@@ -303,6 +308,7 @@ def upsample_blockmodel(blockmodel, new_block_size, upsample_config=None, interp
             reblocked_df["z"].to_numpy(dtype=float),
         )
     offset, scale, bits_per_axis = get_world_id_encoding_params(new_geometry.world_id_encoding)
+    curve = get_world_id_curve(new_geometry.world_id_encoding)
     reblocked_df["world_id"] = encode_world_coordinates(
         reblocked_df["x"].to_numpy(dtype=float),
         reblocked_df["y"].to_numpy(dtype=float),
@@ -310,6 +316,7 @@ def upsample_blockmodel(blockmodel, new_block_size, upsample_config=None, interp
         offset=offset,
         scale=scale,
         bits_per_axis=bits_per_axis,
+        curve=curve,
     ).astype(np.int64)
     ordered_cols = ["block_id", "world_id", "x", "y", "z", "i", "j", "k"]
     ordered_cols.extend([c for c in reblocked_df.columns if c not in ordered_cols])
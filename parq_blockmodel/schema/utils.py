@@ -103,44 +103,44 @@ def dump_schema_yaml(schema: "DataFrameSchema") -> str:
     return yaml_text
 
 
-def load_embedded_schema(parquet_path: Path) -> Optional["DataFrameSchema"]:
-    """Extract and load a schema embedded in Parquet metadata.
+def decode_embedded_metadata(metadata: Optional[typing.Mapping]) -> Optional[dict[str, typing.Any]]:
+    """Decode the PBM JSON payload from Parquet key-value metadata.
 
     Parameters
     ----------
-    parquet_path : Path
-        Path to the Parquet file.
+    metadata : Mapping or None
+        Parquet key-value metadata, e.g. ``pq.read_metadata(path).metadata``.
 
     Returns
     -------
-    DataFrameSchema or None
-        The embedded schema, or None if not present.
+    dict or None
+        The decoded payload, or None if the PBM key is not present.
     """
-    metadata = pq.read_metadata(parquet_path).metadata or {}
-    payload = metadata.get(PBM_METADATA_KEY)
+    payload = (metadata or {}).get(PBM_METADATA_KEY)
     if payload is None:
         return None
     payload_text = payload.decode("utf-8") if isinstance(payload, (bytes, bytearray)) else str(payload)
     payload_dict = json.loads(payload_text)
     if not isinstance(payload_dict, dict):
         raise ValueError("Embedded PBM metadata must decode to a dictionary.")
-    schema_yaml = payload_dict.get("schema_yaml")
+    return payload_dict
+
+
+def schema_from_embedded_metadata(payload: Optional[dict[str, typing.Any]]) -> Optional["DataFrameSchema"]:
+    """Load the schema from a decoded PBM payload, or None if not present."""
+    if payload is None:
+        return None
+    schema_yaml = payload.get("schema_yaml")
     if schema_yaml is None:
         return None
     return load_schema(schema_yaml)
 
 
-def load_embedded_compression(parquet_path: Path) -> Optional[dict[str, typing.Any]]:
-    """Extract compression policy metadata embedded in a Parquet file."""
-    metadata = pq.read_metadata(parquet_path).metadata or {}
-    payload = metadata.get(PBM_METADATA_KEY)
+def compression_from_embedded_metadata(payload: Optional[dict[str, typing.Any]]) -> Optional[dict[str, typing.Any]]:
+    """Return the compression policy from a decoded PBM payload, or None if not present."""
     if payload is None:
         return None
-    json_text = payload.decode("utf-8") if isinstance(payload, (bytes, bytearray)) else str(payload)
-    compression_payload = json.loads(json_text)
-    if not isinstance(compression_payload, dict):
-        raise ValueError("Embedded PBM metadata must decode to a dictionary.")
-    compression = compression_payload.get("compression")
+    compression = payload.get("compression")
     if compression is None:
         return None
     if not isinstance(compression, dict):
@@ -148,6 +148,55 @@ def load_embedded_compression(parquet_path: Path) -> Optional[dict[str, typing.A
     return compression
 
 
+def sort_order_from_embedded_metadata(payload: Optional[dict[str, typing.Any]]) -> Optional[dict[str, typing.Any]]:
+    """Return the recorded row sort order from a decoded PBM payload, or None if not present."""
+    if payload is None:
+        return None
+    sort_order = payload.get("sort_order")
+    if sort_order is None:
+        return None
+    if not isinstance(sort_order, dict):
+        raise ValueError("Embedded sort order metadata must decode to a dictionary.")
+    return sort_order
+
+
+def with_sort_order(
+    metadata: dict[bytes, bytes], sort_order: Optional[dict[str, typing.Any]]
+) -> dict[bytes, bytes]:
+    """Return ``metadata`` with the PBM payload's ``sort_order`` set, or removed when None."""
+    metadata = dict(metadata)
+    payload = decode_embedded_metadata(metadata) or {}
+    if sort_order is None:
+        payload.pop("sort_order", None)
+    else:
+        payload["sort_order"] = sort_order
+    metadata[PBM_METADATA_KEY] = json.dumps(payload).encode("utf-8")
+    return metadata
+
+
+def load_embedded_schema(parquet_path: Path) -> Optional["DataFrameSchema"]:
+    """Extract and load a schema embedded in Parquet metadata.
+
+    Parameters
+    ----------
+    parquet_path : Path
+        Path to the Parquet file.
+
+    Returns
+    -------
+    DataFrameSchema or None
+        The embedded schema, or None if not present.
+    """
+    payload = decode_embedded_metadata(pq.read_metadata(parquet_path).metadata)
+    return schema_from_embedded_metadata(payload)
+
+
+def load_embedded_compression(parquet_path: Path) -> Optional[dict[str, typing.Any]]:
+    """Extract compression policy metadata embedded in a Parquet file."""
+    payload = decode_embedded_metadata(pq.read_metadata(parquet_path).metadata)
+    return compression_from_embedded_metadata(payload)
+
+
 def _normalize_compression_spec(
     value: typing.Any,
     *,
@@ -319,6 +368,24 @@ def schema_uses_strict_filter(schema: Optional["DataFrameSchema"]) -> bool:
     return isinstance(strict_mode, str) and strict_mode.lower() == "filter"
 
 
+def schema_has_df_eval_metadata(schema: Optional["DataFrameSchema"]) -> bool:
+    """Return True if any schema column carries a ``df-eval`` metadata section.
+
+    Such schemas need the pandas ingest path, which applies aliases, decimals
+    and calculated columns before validation.
+    """
+    if schema is None:
+        return False
+    schema_columns = getattr(schema, "columns", {})
+    if not isinstance(schema_columns, dict):
+        return False
+    for col_spec in schema_columns.values():
+        metadata = getattr(col_spec, "metadata", None) or {}
+        if isinstance(metadata, dict) and isinstance(metadata.get("df-eval"), dict):
+            return True
+    return False
+
+
 def extract_column_aliases_from_schema(schema: "DataFrameSchema") -> dict[str, str]:
     """Extract alias mappings from schema df-eval metadata.
 
@@ -468,6 +535,57 @@ def df_eval_operations_from_schema(schema: "DataFrameSchema") -> dict[str, dict[
     return df_eval_operations_from_pandera(schema)
 
 
+def df_eval_operation_dependencies(operation: dict[str, typing.Any]) -> Optional[set[str]]:
+    """Return the column names a df-eval operation reads.
+
+    Parameters
+    ----------
+    operation : dict[str, typing.Any]
+        A single operation spec (``expr``, ``lookup``, ``function`` or
+        ``alias`` kind).
+
+    Returns
+    -------
+    set[str] or None
+        Referenced column names, or None when they cannot be determined
+        (unknown kinds, or functions without explicit ``inputs`` which
+        receive every column).
+    """
+    kind = operation.get("kind")
+
+    if kind == "expr":
+        expr_text = operation.get("expr")
+        if not isinstance(expr_text, str):
+            return set()
+        try:
+            float(expr_text)
+            return set()
+        except ValueError:
+            pass
+        try:
+            from df_eval.expr import Expression
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                "Calculated column support requires 'df-eval'. Install it with: "
+                "pip install 'parq-blockmodel[schema]'"
+            ) from exc
+        return set(Expression(expr_text).dependencies)
+    if kind == "lookup":
+        lookup_spec = operation.get("lookup") or {}
+        key_column = lookup_spec.get("key")
+        return {key_column} if isinstance(key_column, str) else set()
+    if kind == "function":
+        function_spec = operation.get("function") or {}
+        inputs = function_spec.get("inputs")
+        if not isinstance(inputs, list):
+            return None
+        return {dependency for dependency in inputs if isinstance(dependency, str)}
+    if kind == "alias":
+        source_column = operation.get("alias")
+        return {source_column} if isinstance(source_column, str) else set()
+    return None
+
+
 def select_df_eval_operations(
     operations: dict[str, dict[str, typing.Any]],
     targets: typing.Iterable[str],
@@ -500,35 +618,8 @@ def select_df_eval_operations(
             return
 
         in_progress.add(column)
-        kind = operation.get("kind")
-
-        if kind == "expr":
-            expr_text = operation.get("expr")
-            if isinstance(expr_text, str):
-                try:
-                    float(expr_text)
-                except ValueError:
-                    try:
-                        from df_eval.expr import Expression
-                    except ImportError as exc:  # pragma: no cover
-                        raise ImportError(
-                            "Calculated column support requires 'df-eval'. Install it with: "
-                            "pip install 'parq-blockmodel[schema]'"
-                        ) from exc
-                    for dependency in Expression(expr_text).dependencies:
-                        include_operation(dependency)
-        elif kind == "lookup":
-            lookup_spec = operation.get("lookup") or {}
-            key_column = lookup_spec.get("key")
-            if isinstance(key_column, str):
-                include_operation(key_column)
-        elif kind == "function":
-            function_spec = operation.get("function") or {}
-            inputs = function_spec.get("inputs")
-            if isinstance(inputs, list):
-                for dependency in inputs:
-                    if isinstance(dependency, str):
-                        include_operation(dependency)
+        for dependency in sorted(df_eval_operation_dependencies(operation) or ()):
+            include_operation(dependency)
 
         in_progress.remove(column)
         selected[column] = operation
@@ -537,3 +628,35 @@ def select_df_eval_operations(
         include_operation(target)
 
     return {name: operations[name] for name in operations if name in selected}
+
+
+def required_input_columns(
+    operations: dict[str, dict[str, typing.Any]],
+    targets: typing.Iterable[str],
+    available_columns: typing.Iterable[str],
+) -> Optional[list[str]]:
+    """Resolve the persisted columns needed to evaluate calculated ``targets``.
+
+    Parameters
+    ----------
+    operations : dict[str, dict[str, typing.Any]]
+        Available operations keyed by column name.
+    targets : Iterable[str]
+        Calculated column names to evaluate.
+    available_columns : Iterable[str]
+        Persisted column names, in the order they should be returned.
+
+    Returns
+    -------
+    list[str] or None
+        Persisted columns referenced anywhere in the dependency graph of
+        ``targets``, or None when an operation's inputs cannot be determined
+        and every column must be read.
+    """
+    needed: set[str] = set()
+    for operation in select_df_eval_operations(operations, targets).values():
+        dependencies = df_eval_operation_dependencies(operation)
+        if dependencies is None:
+            return None
+        needed.update(dependencies)
+    return [column for column in available_columns if column in needed]
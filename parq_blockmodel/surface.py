@@ -218,9 +218,11 @@ class RasterSurface:
 
     def surface_z(self, grid: Any) -> np.ndarray:
         geometry = _resolve_geometry_like(grid)
-        x = np.asarray(geometry.centroid_x, dtype=float)
-        y = np.asarray(geometry.centroid_y, dtype=float)
-        return _bilinear_interpolate(self._x, self._y, self._values, x, y)
+        return geometry.evaluate_xy(
+            lambda x, y: _bilinear_interpolate(
+                self._x, self._y, self._values, np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+            )
+        )
 
     def evaluate(self, grid: Any) -> np.ndarray:
         geometry = _resolve_geometry_like(grid)
@@ -313,8 +315,11 @@ class MeshSurface:
 
     def surface_z(self, grid: Any) -> np.ndarray:
         geometry = _resolve_geometry_like(grid)
-        x = np.asarray(geometry.centroid_x, dtype=float)
-        y = np.asarray(geometry.centroid_y, dtype=float)
+        return geometry.evaluate_xy(self._surface_z_xy)
+
+    def _surface_z_xy(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
         points_xy = np.column_stack([x, y])
         z = np.full(points_xy.shape[0], np.nan, dtype=float)
         assigned = np.zeros(points_xy.shape[0], dtype=bool)
@@ -2,11 +2,15 @@ from .demo_block_model import create_demo_blockmodel
 from .spatial_encoding import (
 	get_id_encoding_params,
 	get_world_id_encoding_params,
+	get_id_encoding_curve,
+	get_world_id_curve,
 	encode_coordinates,
 	decode_coordinates,
 	encode_frame_coordinates,
 	decode_frame_coordinates,
 	encode_world_coordinates,
 	decode_world_coordinates,
+	world_id_ranges,
+	world_id_range_expression,
 )
 from .geometry_utils import angles_to_axes, rotate_points
\ No newline at end of file
@@ -92,6 +92,49 @@ def df_to_pv_image_data(df: pd.DataFrame,
     return grid
 
 
+def dense_arrays_to_pv_image_data(arrays: dict[str, np.ndarray],
+                                  geometry: RegularGeometry,
+                                  categories: Optional[dict[str, pd.Index]] = None,
+                                  fill_value=np.nan,
+                                  frame: str = "world",
+                                  ) -> pv.ImageData:
+    """
+    Convert dense C-order ijk arrays to a PyVista ImageData object.
+
+    This is the array counterpart of :func:`df_to_pv_image_data` for the output of
+    ``ParquetBlockModel.read_dense_arrays``, and avoids building a dense DataFrame.
+
+    Args:
+        arrays: Mapping of attribute name to an ``(ni, nj, nk)`` array in C-order.
+        geometry: RegularGeometry instance (provides shape, spacing, origin).
+        categories: Category tables for columns stored as integer codes (``-1`` is missing).
+        fill_value: Value to use for missing numeric cells.
+        frame: Coordinate frame for the output grid. ``"world"`` applies geometry orientation;
+            ``"local"`` uses axis-aligned local ijk orientation.
+
+    Returns:
+        pv.ImageData: PyVista ImageData object with cell data.
+    """
+    categories = categories or {}
+    grid: pv.ImageData = geometry.to_pyvista(frame=frame)
+
+    for attr, values in arrays.items():
+        # PyVista ImageData expects cell_data in Fortran (i-fastest) order.
+        if attr in categories:
+            codes = values.astype(float).ravel(order='F')
+            # Keep missing categories as real NaN so plotting backends can
+            # use nan_color/nan_opacity semantics instead of synthetic codes.
+            codes[codes < 0] = np.nan
+            grid.cell_data[attr] = codes
+            from parq_blockmodel.utils.pyvista.categorical_utils import store_mapping_dict
+            store_mapping_dict(grid, attr, dict(enumerate(categories[attr].tolist())))
+        else:
+            arr = values.ravel(order='F')
+            grid.cell_data[attr] = np.where(pd.isna(arr), fill_value, arr)
+
+    return grid
+
+
 def pv_image_data_to_df(image_data: pv.ImageData) -> pd.DataFrame:
     """
     Convert a PyVista ImageData object to a DataFrame using cell centroids.
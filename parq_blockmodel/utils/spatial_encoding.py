@@ -1,7 +1,8 @@
 import numpy as np
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow.compute as pc
 
 Point = Tuple[float, float, float]
 BlockDimension = Tuple[float, float, float]
@@ -22,6 +23,15 @@ ENCODED_Z_MAX_INT = (1 << ENCODED_Z_BITS) - 1
 
 DEFAULT_AXIS_BITS = (ENCODED_X_BITS, ENCODED_Y_BITS, ENCODED_Z_BITS)
 
+# Space-filling curves available for id encoding, keyed by the name accepted by the
+# ``curve`` arguments and mapped to the ``encoding.type`` recorded in metadata.
+ID_ENCODING_CURVES = {"morton": "morton_zorder", "hilbert": "hilbert"}
+DEFAULT_CURVE = "morton"
+
+# Safety cap on the number of partially covered curve nodes refined per level
+# when decomposing a box into world_id ranges.
+_MAX_PARTIAL_NODES = 1 << 16
+
 
 def _normalize_axis_bits(
     bits_per_axis: int | tuple[int, int, int] | list[int] | dict[str, int]
@@ -113,46 +123,203 @@ def get_world_id_encoding_params(
     return get_id_encoding_params(world_id_encoding)
 
 
+def _normalize_curve(curve: str) -> str:
+    curve = str(curve).lower()
+    if curve not in ID_ENCODING_CURVES:
+        raise ValueError(f"Unsupported curve {curve!r}; expected one of {sorted(ID_ENCODING_CURVES)}.")
+    return curve
+
+
+def get_id_encoding_curve(id_encoding: dict | None) -> str:
+    """Return the space-filling curve (``"morton"`` or ``"hilbert"``) of encoding metadata.
+
+    Payloads without an ``encoding.type`` (or with ``"morton_zorder"``) use Morton order.
+    """
+    encoding_type = ((id_encoding or {}).get("encoding") or {}).get("type") or ID_ENCODING_CURVES[DEFAULT_CURVE]
+    for curve, type_name in ID_ENCODING_CURVES.items():
+        if encoding_type == type_name:
+            return curve
+    raise ValueError(f"Unsupported id encoding type {encoding_type!r}.")
+
+
+def get_world_id_curve(world_id_encoding: dict | None) -> str:
+    """Alias for :func:`get_id_encoding_curve`."""
+    return get_id_encoding_curve(world_id_encoding)
+
+
+# Magic-number bit spreading: each step moves groups of bits apart until
+# consecutive input bits land ``stride`` positions apart. Stride 3 handles up
+# to 21 bits and stride 2 up to 32 bits, which covers every axis_bits
+# configuration accepted by ``_normalize_axis_bits`` (total <= 64).
+_SPREAD_STEPS = {
+    2: ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F),
+        (2, 0x3333333333333333), (1, 0x5555555555555555)),
+    3: ((32, 0x001F00000000FFFF), (16, 0x001F0000FF0000FF), (8, 0x100F00F00F00F00F),
+        (4, 0x10C30C30C30C30C3), (2, 0x1249249249249249)),
+}
+
+
+def _spread_int(value: int, stride: int) -> int:
+    """Spread the bits of a Python int ``stride`` positions apart (used for masks)."""
+    spread = 0
+    for bit in range(value.bit_length()):
+        spread |= ((value >> bit) & 1) << (bit * stride)
+    return spread
+
+
+def _morton_segments(axis_bits: tuple[int, int, int]) -> list[tuple[int, int, list[int], int]]:
+    """Split the interleaving into runs of bit levels with the same active axes.
+
+    Returns ``(lo, hi, axes, position)`` per run: bit levels ``lo..hi-1`` of
+    each axis in ``axes`` (in x, y, z order) are interleaved with stride
+    ``len(axes)`` starting at bit ``position`` of the code.
+    """
+    segments = []
+    position = 0
+    lo = 0
+    for hi in sorted(set(axis_bits)):
+        axes = [axis for axis in range(3) if axis_bits[axis] >= hi]
+        if hi > lo:
+            segments.append((lo, hi, axes, position))
+            position += (hi - lo) * len(axes)
+        lo = hi
+    return segments
+
+
+def _spread_bits(values: np.ndarray, length: int, stride: int) -> np.ndarray:
+    """Spread the low ``length`` bits of ``values`` (uint64) ``stride`` positions apart."""
+    out = values & np.uint64((1 << length) - 1)
+    if stride == 1:
+        return out
+    scratch = np.empty_like(out)
+    for shift, mask in _SPREAD_STEPS[stride]:
+        np.left_shift(out, np.uint64(shift), out=scratch)
+        out |= scratch
+        out &= np.uint64(mask)
+    return out
+
+
+def _compact_bits(values: np.ndarray, length: int, stride: int) -> np.ndarray:
+    """Inverse of :func:`_spread_bits`: gather every ``stride``-th bit of ``values``."""
+    out = values & np.uint64(_spread_int((1 << length) - 1, stride))
+    if stride == 1:
+        return out
+    scratch = np.empty_like(out)
+    steps = _SPREAD_STEPS[stride]
+    for index in range(len(steps) - 1, -1, -1):
+        shift = steps[index][0]
+        mask = steps[index - 1][1] if index else (1 << 32) - 1
+        np.right_shift(out, np.uint64(shift), out=scratch)
+        out |= scratch
+        out &= np.uint64(mask)
+    return out
+
+
 def _morton_encode_3d(
     ix: np.ndarray, iy: np.ndarray, iz: np.ndarray, axis_bits: tuple[int, int, int]
 ) -> np.ndarray:
-    x_bits, y_bits, z_bits = axis_bits
-    encoded = np.zeros_like(ix, dtype=np.uint64)
-    bit_position = 0
-    max_bits = max(x_bits, y_bits, z_bits)
-    for bit in range(max_bits):
-        if bit < x_bits:
-            encoded |= ((ix >> bit) & 1).astype(np.uint64) << bit_position
-            bit_position += 1
-        if bit < y_bits:
-            encoded |= ((iy >> bit) & 1).astype(np.uint64) << bit_position
-            bit_position += 1
-        if bit < z_bits:
-            encoded |= ((iz >> bit) & 1).astype(np.uint64) << bit_position
-            bit_position += 1
+    axes = (
+        np.asarray(ix, dtype=np.uint64),
+        np.asarray(iy, dtype=np.uint64),
+        np.asarray(iz, dtype=np.uint64),
+    )
+    encoded = np.zeros(np.broadcast(*axes).shape, dtype=np.uint64)
+    for lo, hi, active, position in _morton_segments(axis_bits):
+        stride = len(active)
+        for rank, axis in enumerate(active):
+            values = axes[axis] >> np.uint64(lo) if lo else axes[axis]
+            spread = _spread_bits(values, hi - lo, stride)
+            spread <<= np.uint64(position + rank)
+            encoded |= spread
     return encoded
 
 
 def _morton_decode_3d(
     encoded: np.ndarray, axis_bits: tuple[int, int, int]
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    x_bits, y_bits, z_bits = axis_bits
-    ix = np.zeros_like(encoded, dtype=np.uint64)
-    iy = np.zeros_like(encoded, dtype=np.uint64)
-    iz = np.zeros_like(encoded, dtype=np.uint64)
-    bit_position = 0
-    max_bits = max(x_bits, y_bits, z_bits)
-    for bit in range(max_bits):
-        if bit < x_bits:
-            ix |= ((encoded >> bit_position) & 1).astype(np.uint64) << bit
-            bit_position += 1
-        if bit < y_bits:
-            iy |= ((encoded >> bit_position) & 1).astype(np.uint64) << bit
-            bit_position += 1
-        if bit < z_bits:
-            iz |= ((encoded >> bit_position) & 1).astype(np.uint64) << bit
-            bit_position += 1
-    return ix, iy, iz
+    encoded = np.asarray(encoded, dtype=np.uint64)
+    decoded = [np.zeros_like(encoded, dtype=np.uint64) for _ in range(3)]
+    for lo, hi, active, position in _morton_segments(axis_bits):
+        stride = len(active)
+        for rank, axis in enumerate(active):
+            values = _compact_bits(encoded >> np.uint64(position + rank), hi - lo, stride)
+            if lo:
+                values <<= np.uint64(lo)
+            decoded[axis] |= values
+    return decoded[0], decoded[1], decoded[2]
+
+
+def _hilbert_encode_3d(
+    ix: np.ndarray, iy: np.ndarray, iz: np.ndarray, axis_bits: tuple[int, int, int]
+) -> np.ndarray:
+    """Hilbert index of quantized coordinates.
+
+    The low ``m = min(axis_bits)`` bits of every axis are mapped along a 3D
+    Hilbert curve (Skilling's transpose algorithm) into the low ``3 * m`` bits of
+    the code. Remaining high-order bits of the longer axes select the
+    ``2**m``-sided cube and are Morton-interleaved above them.
+    """
+    m = min(axis_bits)
+    low_mask = np.uint64((1 << m) - 1)
+    axes = [np.asarray(v, dtype=np.uint64) for v in (ix, iy, iz)]
+    # Skilling's X[0], X[1], X[2] are x, y, z; X[0] supplies the most significant bit per level.
+    X = [np.array(v & low_mask, dtype=np.uint64) for v in axes]
+    q = 1 << (m - 1)
+    while q > 1:
+        p = np.uint64(q - 1)
+        for i in range(3):
+            has_bit = (X[i] & np.uint64(q)) != 0
+            t = np.where(has_bit, np.uint64(0), (X[0] ^ X[i]) & p)
+            X[0] ^= np.where(has_bit, p, t)
+            if i:
+                X[i] ^= t
+        q >>= 1
+    X[1] ^= X[0]
+    X[2] ^= X[1]
+    t = np.zeros_like(X[2])
+    q = 1 << (m - 1)
+    while q > 1:
+        t ^= np.where((X[2] & np.uint64(q)) != 0, np.uint64(q - 1), np.uint64(0))
+        q >>= 1
+    for i in range(3):
+        X[i] ^= t
+    encoded = _morton_encode_3d(X[2], X[1], X[0], (m, m, m))
+    if max(axis_bits) > m:
+        high_bits = tuple(bits - m for bits in axis_bits)
+        high = _morton_encode_3d(*(v >> np.uint64(m) for v in axes), high_bits)
+        encoded |= high << np.uint64(3 * m)
+    return encoded
+
+
+def _hilbert_decode_3d(
+    encoded: np.ndarray, axis_bits: tuple[int, int, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Inverse of :func:`_hilbert_encode_3d`."""
+    m = min(axis_bits)
+    encoded = np.asarray(encoded, dtype=np.uint64)
+    low = encoded & np.uint64((1 << (3 * m)) - 1) if 3 * m < 64 else encoded
+    x2, x1, x0 = _morton_decode_3d(low, (m, m, m))
+    X = [x0, x1, x2]
+    t = X[2] >> np.uint64(1)
+    X[2] ^= X[1]
+    X[1] ^= X[0]
+    X[0] ^= t
+    q = 2
+    while q != (1 << m):
+        p = np.uint64(q - 1)
+        for i in (2, 1, 0):
+            has_bit = (X[i] & np.uint64(q)) != 0
+            t = np.where(has_bit, np.uint64(0), (X[0] ^ X[i]) & p)
+            X[0] ^= np.where(has_bit, p, t)
+            if i:
+                X[i] ^= t
+        q <<= 1
+    if max(axis_bits) > m:
+        high_bits = tuple(bits - m for bits in axis_bits)
+        high = _morton_decode_3d(encoded >> np.uint64(3 * m), high_bits)
+        for i in range(3):
+            X[i] |= high[i] << np.uint64(m)
+    return X[0], X[1], X[2]
 
 
 def encode_frame_coordinates(
@@ -162,11 +329,16 @@ def encode_frame_coordinates(
     offset: Point = (0.0, 0.0, 0.0),
     scale: float | tuple[float, float, float] = 10.0,
     bits_per_axis: int | tuple[int, int, int] | list[int] | dict[str, int] = DEFAULT_AXIS_BITS,
+    curve: str = DEFAULT_CURVE,
 ) -> Union[np.ndarray, int]:
-    """Encode xyz-like coordinates with quantization + 3D Morton/Z-order bit interleaving.
+    """Encode xyz-like coordinates with quantization + a 3D space-filling curve.
+
+    ``curve`` selects Morton/Z-order bit interleaving (``"morton"``, the default) or
+    Hilbert ordering (``"hilbert"``), which keeps spatial neighbours closer together.
 
     Returns an ``int`` for scalar inputs and an ``np.ndarray[int64]`` for array-like inputs.
     """
+    curve = _normalize_curve(curve)
     x_arr = np.asarray(x, dtype=float)
     y_arr = np.asarray(y, dtype=float)
     z_arr = np.asarray(z, dtype=float)
@@ -191,7 +363,8 @@ def encode_frame_coordinates(
     if np.any(x_q > x_max_int) or np.any(y_q > y_max_int) or np.any(z_q > z_max_int):
         raise ValueError("Encoding overflow. Check offsets, scale, or coordinate extents.")
 
-    encoded = _morton_encode_3d(
+    encode_3d = _hilbert_encode_3d if curve == "hilbert" else _morton_encode_3d
+    encoded = encode_3d(
         x_q.astype(np.uint64),
         y_q.astype(np.uint64),
         z_q.astype(np.uint64),
@@ -210,9 +383,12 @@ def encode_world_coordinates(
     offset: Point = (0.0, 0.0, 0.0),
     scale: float | tuple[float, float, float] = 10.0,
     bits_per_axis: int | tuple[int, int, int] | list[int] | dict[str, int] = DEFAULT_AXIS_BITS,
+    curve: str = DEFAULT_CURVE,
 ) -> Union[np.ndarray, int]:
     """Alias for :func:`encode_frame_coordinates` for global spatial identifiers."""
-    return encode_frame_coordinates(x=x, y=y, z=z, offset=offset, scale=scale, bits_per_axis=bits_per_axis)
+    return encode_frame_coordinates(
+        x=x, y=y, z=z, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
+    )
 
 
 def decode_frame_coordinates(
@@ -220,14 +396,17 @@ def decode_frame_coordinates(
     offset: Point = (0.0, 0.0, 0.0),
     scale: float | tuple[float, float, float] = 10.0,
     bits_per_axis: int | tuple[int, int, int] | list[int] | dict[str, int] = DEFAULT_AXIS_BITS,
+    curve: str = DEFAULT_CURVE,
 ) -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray], Point]:
-    """Decode Morton/Z-order ids back to xyz-like coordinates using offset+scale.
+    """Decode Morton/Z-order or Hilbert ids back to xyz-like coordinates using offset+scale.
 
     Returns a ``(x, y, z)`` tuple of floats for scalar input ids and arrays for vectorized input.
     """
+    curve = _normalize_curve(curve)
     encoded_arr = np.asarray(encoded, dtype=np.int64).astype(np.uint64)
     axis_bits = _normalize_axis_bits(bits_per_axis)
-    x_int, y_int, z_int = _morton_decode_3d(encoded_arr, axis_bits=axis_bits)
+    decode_3d = _hilbert_decode_3d if curve == "hilbert" else _morton_decode_3d
+    x_int, y_int, z_int = decode_3d(encoded_arr, axis_bits=axis_bits)
 
     ox, oy, oz = offset
     if isinstance(scale, (tuple, list)):
@@ -249,9 +428,165 @@ def decode_world_coordinates(
     offset: Point = (0.0, 0.0, 0.0),
     scale: float | tuple[float, float, float] = 10.0,
     bits_per_axis: int | tuple[int, int, int] | list[int] | dict[str, int] = DEFAULT_AXIS_BITS,
+    curve: str = DEFAULT_CURVE,
 ) -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray], Point]:
     """Alias for :func:`decode_frame_coordinates` for global spatial identifiers."""
-    return decode_frame_coordinates(encoded=encoded, offset=offset, scale=scale, bits_per_axis=bits_per_axis)
+    return decode_frame_coordinates(
+        encoded=encoded, offset=offset, scale=scale, bits_per_axis=bits_per_axis, curve=curve
+    )
+
+
+def _curve_refinement_steps(axis_bits: tuple[int, int, int], curve: str) -> list[tuple[int, tuple[int, int, int]]]:
+    """Return ``(code_bits, free_axis_bits)`` per refinement step, most significant first.
+
+    Fixing the next ``code_bits`` bits of an id prefix leaves a box whose extent is
+    ``2**free_axis_bits`` quantized units per axis. Morton prefixes are boxes at every
+    bit; Hilbert prefixes are cubes at every level (three bits) of the Hilbert part.
+    """
+    m = min(axis_bits) if curve == "hilbert" else 0
+    layout: list[int] = []
+    for lo, hi, active, _ in _morton_segments(tuple(bits - m for bits in axis_bits)):
+        for _ in range(lo, hi):
+            layout.extend(active)
+    steps = []
+    for n in range(len(layout) - 1, -1, -1):
+        below = layout[:n]
+        steps.append((1, (m + below.count(0), m + below.count(1), m + below.count(2))))
+    for level in range(m - 1, -1, -1):
+        steps.append((3, (level, level, level)))
+    return steps
+
+
+def _merge_ranges(lo: np.ndarray, hi: np.ndarray) -> list[tuple[int, int]]:
+    order = np.argsort(lo, kind="stable")
+    merged: list[tuple[int, int]] = []
+    for start, stop in zip(lo[order].tolist(), hi[order].tolist()):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def _signed_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Map unsigned code ranges onto the signed int64 values ``world_id`` is stored as.
+
+    Codes with the top bit set are negative once stored, so ranges crossing
+    ``2**63`` are split and the result is re-sorted and merged.
+    """
+    top = 1 << 63
+    pieces = []
+    for lo, hi in ranges:
+        pieces.extend([(lo, top - 1), (top, hi)] if lo < top <= hi else [(lo, hi)])
+    if not pieces:
+        return []
+    lo, hi = (np.array(bounds, dtype=np.uint64).astype(np.int64) for bounds in zip(*pieces))
+    return _merge_ranges(lo, hi)
+
+
+def world_id_ranges(
+    x: Optional[tuple[float, float]] = None,
+    y: Optional[tuple[float, float]] = None,
+    z: Optional[tuple[float, float]] = None,
+    offset: Point = (0.0, 0.0, 0.0),
+    scale: float | tuple[float, float, float] = 10.0,
+    bits_per_axis: int | tuple[int, int, int] | list[int] | dict[str, int] = DEFAULT_AXIS_BITS,
+    curve: str = DEFAULT_CURVE,
+    max_ranges: int = 64,
+) -> list[tuple[int, int]]:
+    """Decompose an xyz box into inclusive ``(lo, hi)`` world_id ranges.
+
+    Every id encoded from a point inside the box falls in one of the returned
+    ranges. The curve is refined prefix by prefix (the BIGMIN/LITMAX idea for
+    Z-order, applied to Hilbert cubes as well): nodes fully inside the box become
+    ranges, disjoint nodes are dropped and straddling nodes are split further.
+    Refinement stops before the merged result would exceed ``max_ranges``, so
+    the ranges may then also cover some ids outside the box; callers still
+    apply the exact predicate after pruning.
+
+    Args:
+        x: Inclusive ``(min, max)`` world X bounds; ``None`` is unbounded.
+        y: Inclusive ``(min, max)`` world Y bounds; ``None`` is unbounded.
+        z: Inclusive ``(min, max)`` world Z bounds; ``None`` is unbounded.
+        offset: Encoding offset, as for :func:`encode_world_coordinates`.
+        scale: Encoding scale, as for :func:`encode_world_coordinates`.
+        bits_per_axis: Encoding axis bits, as for :func:`encode_world_coordinates`.
+        curve: Encoding curve, as for :func:`encode_world_coordinates`.
+        max_ranges: Upper bound on the number of returned ranges.
+
+    Returns:
+        list[tuple[int, int]]: Sorted, non-overlapping, non-adjacent id ranges in the
+        signed int64 space ``world_id`` is stored in (64-bit codes with the top bit
+        set are negative); empty when the box misses the encodable space.
+    """
+    if max_ranges < 1:
+        raise ValueError("max_ranges must be a positive integer.")
+    axis_bits = _normalize_axis_bits(bits_per_axis)
+    curve = _normalize_curve(curve)
+    if isinstance(scale, (tuple, list)):
+        scales = (float(scale[0]), float(scale[1]), float(scale[2]))
+    else:
+        scales = (float(scale),) * 3
+
+    q_lo, q_hi = [], []
+    for bounds, origin, axis_scale, bits in zip((x, y, z), offset, scales, axis_bits):
+        axis_max = (1 << bits) - 1
+        if bounds is None:
+            lo, hi = 0, axis_max
+        else:
+            lo = int(np.rint((float(bounds[0]) - origin) * axis_scale))
+            hi = int(np.rint((float(bounds[1]) - origin) * axis_scale))
+            lo, hi = max(lo, 0), min(hi, axis_max)
+        if lo > hi:
+            return []
+        q_lo.append(np.uint64(lo))
+        q_hi.append(np.uint64(hi))
+
+    decode_3d = _hilbert_decode_3d if curve == "hilbert" else _morton_decode_3d
+    remaining = sum(axis_bits)
+    best = _signed_ranges([(0, (1 << remaining) - 1)])
+    full_lo: list[np.ndarray] = []
+    full_hi: list[np.ndarray] = []
+    partial = np.zeros(1, dtype=np.uint64)
+    for code_bits, free_bits in _curve_refinement_steps(axis_bits, curve):
+        remaining -= code_bits
+        offsets = np.arange(1 << code_bits, dtype=np.uint64) << np.uint64(remaining)
+        children = (partial[:, None] | offsets[None, :]).ravel()
+        inside = np.ones(children.size, dtype=bool)
+        overlap = np.ones(children.size, dtype=bool)
+        for coords, free, lo, hi in zip(decode_3d(children, axis_bits), free_bits, q_lo, q_hi):
+            box_lo = (coords >> np.uint64(free)) << np.uint64(free)
+            box_hi = box_lo + np.uint64((1 << free) - 1)
+            inside &= (box_lo >= lo) & (box_hi <= hi)
+            overlap &= (box_hi >= lo) & (box_lo <= hi)
+        span = np.uint64((1 << remaining) - 1)
+        full_lo.append(children[inside])
+        full_hi.append(children[inside] + span)
+        partial = children[overlap & ~inside]
+        merged = _signed_ranges(_merge_ranges(
+            np.concatenate(full_lo + [partial]),
+            np.concatenate(full_hi + [partial + span]),
+        ))
+        if len(merged) > max_ranges:
+            break
+        best = merged
+        if partial.size == 0 or partial.size > _MAX_PARTIAL_NODES:
+            break
+    return best
+
+
+def world_id_range_expression(ranges: list[tuple[int, int]], column: str = "world_id") -> pc.Expression:
+    """Return a pyarrow filter expression selecting ids within any of ``ranges``.
+
+    Each range becomes ``lo <= column <= hi`` so that row-group statistics of a
+    file sorted by ``column`` can skip groups outside every range.
+    """
+    field = pc.field(column)
+    expression = None
+    for lo, hi in ranges:
+        term = field == int(lo) if lo == hi else (field >= int(lo)) & (field <= int(hi))
+        expression = term if expression is None else expression | term
+    return pc.scalar(False) if expression is None else expression
 
 
 def is_integer(value):
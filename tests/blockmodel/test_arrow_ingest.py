@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.geometry import RegularGeometry
+from parq_blockmodel.io import IngestWriter
+from parq_blockmodel.schema import utils as schema_utils
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _write_source(tmp_path: Path) -> tuple[Path, RegularGeometry]:
+    df = create_demo_blockmodel(shape=(4, 3, 2), block_size=(1.0, 1.0, 1.0), corner=(0.0, 0.0, 0.0))
+    df = df.reset_index()[["x", "y", "z", "depth", "depth_category"]]
+    df["label"] = [f"b{v}" for v in range(len(df))]
+    source = tmp_path / "source.parquet"
+    df.to_parquet(source, index=False)
+    return source, RegularGeometry.from_parquet(source)
+
+
+def _ingest(source: Path, target: Path, geometry: RegularGeometry, **kwargs) -> pd.DataFrame:
+    IngestWriter(source, target, geometry=geometry, **kwargs).write(chunk_size=7)
+    return pd.read_parquet(target)
+
+
+def test_arrow_ingest_matches_pandas_ingest(tmp_path: Path, monkeypatch) -> None:
+    source, geometry = _write_source(tmp_path)
+    arrow_df = _ingest(source, tmp_path / "arrow.pbm", geometry)
+
+    monkeypatch.setattr(schema_utils, "schema_has_df_eval_metadata", lambda schema: True)
+    pandas_df = _ingest(source, tmp_path / "pandas.pbm", geometry)
+
+    pd.testing.assert_frame_equal(arrow_df, pandas_df)
+    assert list(arrow_df.columns[:8]) == ParquetBlockModel.SPECIAL_COLUMN_ORDER
+    file_schema = pq.read_schema(tmp_path / "arrow.pbm")
+    assert str(file_schema.field("block_id").type) == "int32"
+    assert str(file_schema.field("x").type) == "float"
+
+
+def test_arrow_ingest_skips_pandas_conversion(tmp_path: Path, monkeypatch) -> None:
+    source, geometry = _write_source(tmp_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pandas conversion should not be used without a schema")
+
+    monkeypatch.setattr(ParquetBlockModel, "_coerce_special_column_dtypes", fail)
+
+    df = _ingest(source, tmp_path / "arrow.pbm", geometry)
+
+    np.testing.assert_array_equal(np.sort(df["block_id"].to_numpy()), np.arange(24))
+    assert df["label"].tolist() == [f"b{v}" for v in range(24)]
+
+
+def test_arrow_ingest_validates_schema_without_df_eval(tmp_path: Path) -> None:
+    pandera = pytest.importorskip("pandera")
+    source, geometry = _write_source(tmp_path)
+    schema = pandera.DataFrameSchema(
+        columns={"label": pandera.Column("category", coerce=True)},
+        strict=False,
+    )
+
+    df = _ingest(source, tmp_path / "validated.pbm", geometry, schema=schema)
+
+    assert isinstance(df["label"].dtype, pd.CategoricalDtype)
+    assert df["depth"].dtype == np.float64
+
+    failing = pandera.DataFrameSchema(columns={"depth": pandera.Column(float, pandera.Check.lt(0))})
+    with pytest.raises(Exception, match="depth"):
+        _ingest(source, tmp_path / "invalid.pbm", geometry, schema=failing)
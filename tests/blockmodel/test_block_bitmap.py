@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import IngestWriter, block_bitmap, ingest_utils
+from parq_blockmodel.io.block_bitmap import BlockIdBitmap
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def test_bitmap_detects_duplicates_within_and_across_batches() -> None:
+    seen = BlockIdBitmap(100)
+
+    assert seen.add(np.array([5, 1, 9, 8]))
+    assert seen.add(np.array([], dtype=np.int64))
+    assert not seen.add(np.array([2, 2]))
+
+    seen = BlockIdBitmap(100)
+    assert seen.add(np.array([5, 1, 9, 8]))
+    assert not seen.add(np.array([3, 8]))
+
+
+def test_bitmap_spans_lazily_allocated_pages(monkeypatch) -> None:
+    monkeypatch.setattr(block_bitmap, "PAGE_BITS", 4)
+    seen = BlockIdBitmap(1_000)
+
+    assert seen.add(np.array([0, 15, 16, 999]))
+    assert len(seen) == 4
+    assert seen.nbytes == 3 * 2
+    assert seen.add(np.arange(17, 40))
+    assert not seen.add(np.array([500, 999]))
+
+
+def test_bitmap_memory_scales_with_occupied_region() -> None:
+    seen = BlockIdBitmap(10**12)
+
+    assert seen.add(np.arange(1_000, dtype=np.int64) + 5 * 10**11)
+
+    assert seen.nbytes == 1 << (block_bitmap.PAGE_BITS - 3)
+
+
+def test_bitmap_rejects_out_of_range_ids() -> None:
+    with pytest.raises(ValueError, match="within"):
+        BlockIdBitmap(10).add(np.array([10]))
+
+
+def test_validate_geometry_reports_duplicate_positions(tmp_path: Path) -> None:
+    df = create_demo_blockmodel(shape=(3, 2, 2), block_size=(1.0, 1.0, 1.0), corner=(0.0, 0.0, 0.0))
+    duplicated = pd.concat([df, df.iloc[[4]]]).reset_index()
+    path = tmp_path / "dup.parquet"
+    duplicated.to_parquet(path)
+
+    with pytest.raises(ValueError, match="Duplicate block positions"):
+        ingest_utils.validate_geometry(path, chunk_size=5)
+
+
+def test_ingest_rejects_duplicates_across_batches(tmp_path: Path) -> None:
+    pbm = ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(3, 2, 2))
+    df = pbm.read(index=None)
+    source = tmp_path / "dup.parquet"
+    pd.concat([df, df.iloc[[0]]]).to_parquet(source, index=False)
+
+    with pytest.raises(ValueError, match="unique block_id"):
+        IngestWriter(source, tmp_path / "dup.pbm", geometry=pbm.geometry).write(chunk_size=5)
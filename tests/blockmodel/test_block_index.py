@@ -0,0 +1,112 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io.block_index import BlockIdIndex, load_current_index, sidecar_path
+
+
+def _make_demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+
+def test_block_index_lookup_and_row_order() -> None:
+    row_block_ids = np.array([7, 2, 9, 0], dtype=np.int64)
+    index = BlockIdIndex.from_row_block_ids(row_block_ids, fingerprint=(0, 0))
+
+    np.testing.assert_array_equal(index.block_ids, [0, 2, 7, 9])
+    np.testing.assert_array_equal(index.row_block_ids(), row_block_ids)
+    np.testing.assert_array_equal(index.lookup([9, 3, 0, 100]), [2, -1, 3, -1])
+    assert index.is_unique
+
+
+def test_block_index_sidecar_written_on_create_and_reused(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    sidecar = sidecar_path(pbm.blockmodel_path)
+    assert sidecar.exists()
+    index = load_current_index(pbm.blockmodel_path)
+    assert index is not None
+    np.testing.assert_array_equal(np.sort(index.row_block_ids()), np.arange(24))
+
+    # Re-opening trusts the current sidecar instead of rescanning block_id.
+    def fail_iter_batches(*args, **kwargs):
+        raise AssertionError("block_id column should not be rescanned")
+
+    monkeypatch.setattr(ParquetBlockModel, "_iter_batches", fail_iter_batches)
+    reopened = ParquetBlockModel(pbm.blockmodel_path)
+    np.testing.assert_array_equal(reopened.block_index.block_ids, index.block_ids)
+
+
+def test_block_index_invalidated_by_rewrite(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    stale = pbm.block_index
+
+    df = pbm.read(index=None)
+    reordered = df.iloc[::-1].reset_index(drop=True)
+    pbm._persist_dataframe(reordered, compression_policy=pbm.compression)
+    os.utime(pbm.blockmodel_path, ns=(stale.fingerprint[1] + 10**9, stale.fingerprint[1] + 10**9))
+
+    assert not stale.is_current(pbm.blockmodel_path)
+    np.testing.assert_array_equal(pbm.block_index.row_block_ids(), reordered["block_id"].to_numpy())
+    # The file was touched outside the package: the index is rebuilt in memory only.
+    assert load_current_index(pbm.blockmodel_path) is None
+
+
+def test_open_and_read_do_not_write_block_index(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    sidecar = sidecar_path(pbm.blockmodel_path)
+    sidecar.unlink()
+
+    reopened = ParquetBlockModel(pbm.blockmodel_path)
+    reopened.get_blocks(np.array([5, 1]))
+    reopened.read(columns=["depth"], index="ijk")
+
+    assert len(reopened.block_index) == 24
+    assert not sidecar.exists()
+
+    reopened.write(reopened.read(index=None), merge=False)
+    assert load_current_index(pbm.blockmodel_path) is not None
+
+
+def test_read_without_positional_columns_uses_block_index(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    expected = pbm.read(columns=["block_id", "depth"], index="ijk")
+
+    def fail_iter_block_ids(*args, **kwargs):
+        raise AssertionError("positional columns should not be rescanned")
+
+    monkeypatch.setattr(ParquetBlockModel, "_iter_block_ids", fail_iter_block_ids)
+    result = pbm.read(columns=["depth"], index="ijk")
+
+    assert result.index.equals(expected.index)
+
+
+def test_block_index_follows_rename(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    old_sidecar = sidecar_path(pbm.blockmodel_path)
+
+    pbm.rename(tmp_path / "renamed.pbm")
+
+    assert not old_sidecar.exists()
+    assert load_current_index(tmp_path / "renamed.pbm") is not None
+
+
+def test_block_index_not_persisted_when_disabled(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ParquetBlockModel, "PERSIST_BLOCK_INDEX", False)
+    pbm = _make_demo_pbm(tmp_path)
+
+    assert len(pbm.block_index) == 24
+    assert not sidecar_path(pbm.blockmodel_path).exists()
+
+
+def test_block_index_load_rejects_unknown_version(tmp_path: Path) -> None:
+    path = tmp_path / "bad.bidx"
+    with open(path, "wb") as fh:
+        np.savez(fh, version=np.array([99]), fingerprint=np.array([0, 0]),
+                 block_ids=np.array([0]), positions=np.array([0]))
+
+    with pytest.raises(ValueError, match="version"):
+        BlockIdIndex.load(path)
@@ -524,6 +524,21 @@ def test_validate_special_columns_detects_invalid_world_id(tmp_path):
     assert not pbm.validate_special_columns(sample_size=0)
 
 
+def test_recompute_world_id_switches_to_hilbert(tmp_path):
+    parquet_path = tmp_path / "hilbert_source.parquet"
+    blocks = create_demo_blockmodel(shape=(4, 3, 2), block_size=(1.0, 1.0, 1.0), corner=(500000.0, 7000000.0, 100.0)).reset_index()
+    blocks[["x", "y", "z", "depth"]].to_parquet(parquet_path, index=False)
+    pbm = ParquetBlockModel.from_parquet(parquet_path, columns=["depth"], chunk_size=4)
+    morton_ids = pbm.read(columns=["world_id"], index=None)["world_id"].to_numpy()
+
+    pbm.recompute_world_id(curve="hilbert")
+
+    reopened = ParquetBlockModel(blockmodel_path=pbm.blockmodel_path)
+    assert reopened.geometry.world_id_encoding["encoding"]["type"] == "hilbert"
+    assert not np.array_equal(reopened.read(columns=["world_id"], index=None)["world_id"].to_numpy(), morton_ids)
+    assert reopened.validate_special_columns(sample_size=0)
+
+
 def test_parquet_blockmodel_exposes_corner_and_origin_properties(tmp_path):
     parquet_path = tmp_path / "origin_property_source.parquet"
     blocks = create_demo_blockmodel(
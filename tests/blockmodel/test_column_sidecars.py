@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import block_index, column_sidecars
+
+
+def _make_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(5, 4, 3))
+
+
+def _add_columns(pbm: ParquetBlockModel) -> pd.DataFrame:
+    payload = pbm.read(columns=["block_id"], index=None)
+    payload["grade"] = payload["block_id"].to_numpy(dtype=float) * 0.5
+    pbm.write(payload, merge=True, column_family=True)
+    flags = payload[["block_id"]].iloc[::2].copy()
+    flags["flag"] = pd.Categorical(["in"] * len(flags))
+    pbm.write(flags, merge=True, column_family=True)
+    return payload
+
+
+def test_column_family_leaves_main_file_untouched(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    before = pbm.blockmodel_path.stat()
+    payload = _add_columns(pbm)
+
+    after = pbm.blockmodel_path.stat()
+    assert (after.st_size, after.st_mtime_ns) == (before.st_size, before.st_mtime_ns)
+    assert "grade" not in pq.read_schema(pbm.blockmodel_path).names
+    assert pbm.columns[-2:] == ["grade", "flag"]
+    assert len(list(column_sidecars.sidecar_dir(pbm.blockmodel_path).glob("family-*.parquet"))) == 2
+
+    reopened = ParquetBlockModel(pbm.blockmodel_path)
+    result = reopened.read(columns=["block_id", "grade", "flag"], index=None)
+    np.testing.assert_allclose(result["grade"], payload["grade"])
+    assert result["flag"].notna().sum() == 30
+    assert isinstance(reopened.column_dtypes["flag"], pd.CategoricalDtype)
+
+
+def test_column_family_after_compress_keeps_main_file(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    pbm.compress(level=3)
+    before = block_index.file_fingerprint(pbm.blockmodel_path)
+    archive_policy = pbm.compression
+
+    payload = pbm.read(columns=["block_id"], index=None)
+    payload["grade"] = payload["block_id"].to_numpy(dtype=float) * 0.5
+    pbm.write(payload, merge=True, column_family=True, compression="fast")
+
+    assert block_index.file_fingerprint(pbm.blockmodel_path) == before
+    assert pbm.compression == archive_policy
+    manifest = column_sidecars.load_sidecars(pbm.blockmodel_path, before)
+    assert manifest is not None
+    assert manifest.families[0].compression["default"]["codec"] == "snappy"
+    np.testing.assert_allclose(pbm.read(columns=["grade"], index=None)["grade"], payload["grade"])
+
+    pbm.compact()
+    chunks = pq.ParquetFile(pbm.blockmodel_path).metadata.row_group(0)
+    codecs = {chunks.column(c).path_in_schema: chunks.column(c).compression for c in range(chunks.num_columns)}
+    assert codecs["grade"] == "SNAPPY"
+    assert codecs["block_id"] == "ZSTD"
+
+
+def test_filtered_reads_and_blocks_include_families(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    _add_columns(pbm)
+
+    on_main = pbm.read(columns=["grade"], filters=[("k", "==", 1)], index="ijk")
+    on_family = pbm.read(columns=["depth"], filters=[("grade", ">=", 25.0)], index=None)
+
+    assert set(on_main.index.get_level_values("k")) == {1}
+    np.testing.assert_allclose(on_main["grade"], on_main.index.get_level_values("k") * 0.5
+                               + on_main.index.get_level_values("j") * 1.5 + on_main.index.get_level_values("i") * 6.0)
+    assert len(on_family) == 10
+    blocks = pbm.get_blocks(np.array([7, 3]), columns=["grade"])
+    np.testing.assert_allclose(blocks["grade"], [3.5, 1.5])
+
+
+def test_family_filters_read_one_row_group_at_a_time(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_pbm(tmp_path)
+    pbm.write(pbm.read(index=None), merge=False, row_group_size=12)
+    _add_columns(pbm)
+    read_groups: list[list[int]] = []
+    original = column_sidecars.SidecarParquetFile.read_row_groups
+
+    def spy(self, row_groups, columns=None, **kwargs):
+        read_groups.append(list(row_groups))
+        return original(self, row_groups, columns=columns, **kwargs)
+
+    monkeypatch.setattr(column_sidecars.SidecarParquetFile, "read_row_groups", spy)
+    result = pbm.read(columns=["grade"], filters=[("block_id", ">=", 36), ("grade", "<", 20.0)], index=None)
+
+    np.testing.assert_allclose(result["grade"], np.arange(36, 40) * 0.5)
+    assert read_groups == [[3], [4]]
+
+
+def test_compact_folds_families_into_main_file(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    payload = _add_columns(pbm)
+    expected = pbm.read(index="ijk")
+
+    pbm.compact()
+
+    assert not column_sidecars.sidecar_dir(pbm.blockmodel_path).exists()
+    assert {"grade", "flag"} <= set(pq.read_schema(pbm.blockmodel_path).names)
+    pd.testing.assert_frame_equal(pbm.read(index="ijk"), expected)
+    np.testing.assert_allclose(pq.read_table(pbm.blockmodel_path, columns=["grade"])["grade"], payload["grade"])
+
+
+def test_stale_families_are_ignored(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    _add_columns(pbm)
+
+    table = pq.read_table(pbm.blockmodel_path)
+    pq.write_table(table, pbm.blockmodel_path, row_group_size=7)
+
+    assert "grade" not in ParquetBlockModel(pbm.blockmodel_path).columns
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.geometry import RegularGeometry
+from parq_blockmodel.io import ingest_utils
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _write_csv(tmp_path: Path, name: str = "source.csv", sep: str = ",") -> Path:
+    df = create_demo_blockmodel(shape=(4, 3, 2), block_size=(1.0, 1.0, 1.0), corner=(0.0, 0.0, 0.0))
+    df = df.reset_index()[["x", "y", "z", "depth"]]
+    df["code"] = [f"c{v % 3}" for v in range(len(df))]
+    csv_path = tmp_path / name
+    df.to_csv(csv_path, index=False, sep=sep)
+    return csv_path
+
+
+def test_streamed_csv_matches_in_memory_path(tmp_path: Path) -> None:
+    csv_path = _write_csv(tmp_path)
+
+    streamed = ParquetBlockModel.from_csv(csv_path, chunk_size=5)
+    in_memory = ParquetBlockModel.from_csv(
+        csv_path, filename=tmp_path / "pandas.parquet", sep=","
+    )
+
+    assert streamed.geometry.to_metadata_dict() == in_memory.geometry.to_metadata_dict()
+    pd.testing.assert_frame_equal(
+        streamed.read(columns=["depth", "code"], index="ijk"),
+        in_memory.read(columns=["depth", "code"], index="ijk"),
+    )
+    assert pq.ParquetFile(streamed.blockmodel_path).metadata.num_row_groups == 5
+
+
+def test_streamed_csv_uses_supplied_geometry(tmp_path: Path, monkeypatch) -> None:
+    csv_path = _write_csv(tmp_path, sep=";")
+    geometry = RegularGeometry(corner=(0.0, 0.0, 0.0), block_size=(1.0, 1.0, 1.0), shape=(4, 3, 2))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("geometry should not be inferred when supplied")
+
+    monkeypatch.setattr(RegularGeometry, "from_centroid_batches", fail)
+
+    pbm = ParquetBlockModel.from_csv(csv_path, geometry=geometry, delimiter=";")
+
+    assert pbm.geometry.local.shape == (4, 3, 2)
+    assert len(pbm.read(columns=["depth"])) == 24
+
+
+def test_streamed_csv_honours_column_types(tmp_path: Path) -> None:
+    csv_path = _write_csv(tmp_path)
+
+    pbm = ParquetBlockModel.from_csv(
+        csv_path, column_types={"depth": pa.float32(), "code": pa.dictionary(pa.int32(), pa.string())}
+    )
+
+    file_schema = pq.read_schema(pbm.blockmodel_path)
+    assert file_schema.field("depth").type == pa.float32()
+    assert pa.types.is_dictionary(file_schema.field("code").type)
+
+
+def test_iter_csv_batches_rebatches_by_rows(tmp_path: Path) -> None:
+    csv_path = _write_csv(tmp_path)
+
+    batches = list(ingest_utils.iter_csv_batches(csv_path, columns=["z", "depth"], batch_size=10))
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 4]
+    assert batches[0].schema.names == ["z", "depth"]
+    assert batches[0].schema.field("z").type == pa.float64()
+
+    with pytest.raises(ValueError, match="batch_size"):
+        list(ingest_utils.rebatch(batches, 0))
@@ -106,4 +106,73 @@ def test_write_explicit_zstd_level_is_persisted(tmp_path: Path) -> None:
 
     metadata = pq.read_metadata(pbm.blockmodel_path).metadata or {}
     payload = json.loads(metadata[b"parq-blockmodel"].decode("utf-8"))
-    assert payload["compression"]["default"] == {"codec": "zstd", "level": 5}
\ No newline at end of file
+    assert payload["compression"]["default"] == {"codec": "zstd", "level": 5}
+
+
+def test_write_merge_writes_metadata_in_single_pass(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    subset = pbm.read(columns=["block_id"], index=None)
+    subset["grade"] = 2.5
+    writers: list[object] = []
+    original = pq.ParquetWriter
+
+    class CountingWriter(original):
+        def __init__(self, *args, **kwargs):
+            writers.append(args[0])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(pq, "ParquetWriter", CountingWriter)
+    monkeypatch.setattr(pq, "write_table", lambda *a, **k: pytest.fail("merge should not rewrite the file again"))
+
+    pbm.write(subset, merge=True, compression=3)
+
+    assert len(writers) == 1
+    metadata = pq.read_metadata(pbm.blockmodel_path).metadata or {}
+    payload = json.loads(metadata[b"parq-blockmodel"].decode("utf-8"))
+    assert payload["compression"]["default"] == {"codec": "zstd", "level": 3}
+    assert "geometry" in payload
+    assert (pbm.read(columns=["grade"], index=None)["grade"] == 2.5).all()
+
+
+def test_write_streams_batches_into_row_groups(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    df = pbm.read(index=None)
+    df["note"] = None
+    df.loc[df.index[-1], "note"] = "last"
+
+    pbm.write(df, batch_size=7, row_group_size=5)
+
+    metadata = pq.read_metadata(pbm.blockmodel_path)
+    assert max(metadata.row_group(rg).num_rows for rg in range(metadata.num_row_groups)) == 5
+    assert metadata.num_rows == len(df)
+    assert pq.read_schema(pbm.blockmodel_path).field("note").type == "string"
+    assert list(tmp_path.glob("*.tmp")) == []
+    pd.testing.assert_frame_equal(pbm.read(index=None), df)
+
+
+def test_write_coerces_batches_without_touching_input_and_recovers_on_failure(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    expected = pbm.read(index=None)
+    df = expected[list(reversed(expected.columns))].copy()
+    df["block_id"] = df["block_id"].astype("int64")
+
+    pbm.write(df, batch_size=7)
+
+    assert list(df.columns) == list(reversed(expected.columns))
+    assert df["block_id"].dtype == "int64"
+    order = ParquetBlockModel._ordered_columns(list(df.columns))
+    assert order[0] == "block_id"
+    assert pq.read_schema(pbm.blockmodel_path).names == order
+    expected = expected[order]
+    pd.testing.assert_frame_equal(pbm.read(index=None), expected)
+
+    def fail(self, table, row_group_size=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pq.ParquetWriter, "write_table", fail)
+    with pytest.raises(OSError, match="disk full"):
+        pbm.write(df.assign(grade=0.0), batch_size=7)
+
+    assert pbm.pf is not None
+    assert pbm.data is not None
+    pd.testing.assert_frame_equal(pbm.read(index=None), expected)
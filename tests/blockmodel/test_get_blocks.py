@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _make_multi_row_group_pbm(tmp_path: Path) -> ParquetBlockModel:
+    df = create_demo_blockmodel(shape=(6, 5, 4), block_size=(1.0, 1.0, 1.0), corner=(0.0, 0.0, 0.0))
+    df = df.set_index(["x", "y", "z"])
+    pbm = ParquetBlockModel.from_dataframe(df, tmp_path / "blocks.parquet")
+    # Rewrite with small row groups, keeping the embedded metadata.
+    pq.write_table(pq.read_table(pbm.blockmodel_path), pbm.blockmodel_path, row_group_size=25)
+    pbm = ParquetBlockModel(pbm.blockmodel_path)
+    assert pbm.pf.metadata.num_row_groups > 1
+    return pbm
+
+
+def test_get_blocks_by_block_id_matches_full_read(tmp_path: Path) -> None:
+    pbm = _make_multi_row_group_pbm(tmp_path)
+    full = pbm.read(index=None).set_index("block_id")
+
+    result = pbm.get_blocks(block_ids=[97, 3, 3, 50], columns=["block_id", "depth"], index=None)
+
+    assert result["block_id"].tolist() == [97, 3, 50]
+    np.testing.assert_allclose(result["depth"].to_numpy(), full.loc[[97, 3, 50], "depth"].to_numpy())
+
+
+def test_get_blocks_by_ijk_and_xyz(tmp_path: Path) -> None:
+    pbm = _make_multi_row_group_pbm(tmp_path)
+
+    by_ijk = pbm.get_blocks(ijk=[(1, 2, 3), (5, 4, 0)], columns=["depth"])
+    assert list(by_ijk.index) == [(1, 2, 3), (5, 4, 0)]
+
+    x, y, z = pbm.geometry.xyz_from_ijk([1, 5], [2, 4], [3, 0])
+    by_xyz = pbm.get_blocks(xyz=np.column_stack([x, y, z]), columns=["depth"], index="ijk")
+    np.testing.assert_allclose(by_xyz["depth"].to_numpy(), by_ijk["depth"].to_numpy())
+
+    single = pbm.get_blocks(ijk=(1, 2, 3), columns=["depth", "volume"], index="xyz")
+    assert len(single) == 1
+    assert np.isclose(single["volume"].iloc[0], pbm.geometry.block_volume)
+
+
+def test_get_blocks_decodes_only_containing_row_groups(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_multi_row_group_pbm(tmp_path)
+    calls: list[list[int]] = []
+    original = pq.ParquetFile.read_row_groups
+
+    def spy(self, row_groups, *args, **kwargs):
+        calls.append(list(row_groups))
+        return original(self, row_groups, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+
+    pbm.get_blocks(block_ids=[0, 1], columns=["depth"])
+
+    assert calls == [[0]]
+
+
+def test_get_blocks_omits_missing_and_validates_arguments(tmp_path: Path) -> None:
+    pbm = _make_multi_row_group_pbm(tmp_path)
+    full = pbm.read(columns=["block_id", "depth"], index="xyz")
+    sparse = ParquetBlockModel.from_dataframe(
+        full[full["block_id"] % 2 == 0], tmp_path / "sparse.parquet", geometry=pbm.geometry
+    )
+
+    result = sparse.get_blocks(block_ids=[1, 2, 3, 4], columns=["block_id"], index=None)
+    assert result["block_id"].tolist() == [2, 4]
+
+    with pytest.raises(ValueError, match="exactly one"):
+        pbm.get_blocks(block_ids=[0], ijk=(0, 0, 0))
+    with pytest.raises(ValueError, match="geometry bounds"):
+        pbm.get_blocks(block_ids=[10_000])
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+
+
+def _make_demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+
+@pytest.mark.parametrize("index", ["ijk", "xyz", None])
+def test_iter_read_concat_matches_read(tmp_path: Path, index) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    batches = list(pbm.iter_read(batch_size=5, index=index))
+    expected = pbm.read(index=index)
+
+    assert len(batches) == int(np.ceil(len(expected) / 5))
+    assert all(len(batch) <= 5 for batch in batches)
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=index is None), expected)
+
+
+def test_iter_read_columns_without_positional_fields(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    batches = list(pbm.iter_read(columns=["depth"], batch_size=7, index="ijk"))
+
+    result = pd.concat(batches)
+    assert list(result.columns) == ["depth"]
+    pd.testing.assert_frame_equal(result, pbm.read(columns=["depth"], index="ijk"))
+
+
+def test_iter_read_evaluates_calculated_columns_per_batch(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    batches = list(pbm.iter_read(columns=["depth", "volume"], batch_size=4, index="xyz"))
+
+    result = pd.concat(batches)
+    assert list(result.columns) == ["depth", "volume"]
+    assert np.allclose(result["volume"].to_numpy(), pbm.geometry.block_volume)
+    pd.testing.assert_frame_equal(result, pbm.read(columns=["depth", "volume"], index="xyz"))
+
+
+def test_iter_read_with_filters_skips_non_matching_rows(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    result = pd.concat(pbm.iter_read(columns=["depth"], batch_size=3, filters=[("i", "==", 2)]))
+
+    assert len(result) == 3 * 2
+    assert set(result.index.get_level_values("i")) == {2}
+
+
+def test_iter_read_arrow_emits_index_columns(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    batches = list(pbm.iter_read(columns=["depth", "volume"], batch_size=10, index="ijk", return_type="arrow"))
+
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    table = pa.Table.from_batches(batches)
+    assert table.schema.names == ["i", "j", "k", "depth", "volume"]
+    expected = pbm.read(columns=["depth"], index="ijk").reset_index()
+    np.testing.assert_array_equal(table.column("i").to_numpy(), expected["i"].to_numpy())
+    np.testing.assert_allclose(table.column("depth").to_numpy(), expected["depth"].to_numpy())
+
+
+def test_iter_read_rejects_invalid_arguments(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    with pytest.raises(ValueError, match="index"):
+        next(pbm.iter_read(index="uvw"))
+    with pytest.raises(ValueError, match="return_type"):
+        next(pbm.iter_read(return_type="polars"))
+    with pytest.raises(ValueError, match="batch_size"):
+        next(pbm.iter_read(batch_size=0))
+
+
+def test_iter_read_numpy_batches(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    batches = list(pbm.iter_read(columns=["depth"], batch_size=10, index="xyz", return_type="numpy"))
+
+    assert [list(batch) for batch in batches] == [["x", "y", "z", "depth"]] * len(batches)
+    depth = np.concatenate([batch["depth"] for batch in batches])
+    np.testing.assert_allclose(depth, pbm.read(columns=["depth"], index=None)["depth"].to_numpy())
@@ -0,0 +1,110 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel import blockmodel as blockmodel_module
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import metadata_cache
+
+
+def _make_demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+
+@pytest.fixture
+def read_calls(monkeypatch) -> list[Path]:
+    calls: list[Path] = []
+    original = metadata_cache._read_file_metadata
+
+    def spy(path, fingerprint):
+        calls.append(path)
+        return original(path, fingerprint)
+
+    monkeypatch.setattr(metadata_cache, "_read_file_metadata", spy)
+    return calls
+
+
+def test_reopening_reuses_parsed_metadata(tmp_path: Path, read_calls: list[Path]) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    metadata_cache.clear_metadata_cache()
+    read_calls.clear()
+
+    first = ParquetBlockModel(pbm.blockmodel_path)
+    second = ParquetBlockModel(pbm.blockmodel_path)
+
+    assert len(read_calls) == 1
+    assert first.geometry.to_metadata_dict() == pbm.geometry.to_metadata_dict()
+    assert first.columns == pbm.columns
+    assert first.compression == pbm.compression
+    # Instances get their own geometry, so mutating one cannot leak into another.
+    assert first.geometry is not second.geometry
+    first.geometry.world_id_encoding = {"changed": True}
+    assert ParquetBlockModel(pbm.blockmodel_path).geometry.world_id_encoding != {"changed": True}
+
+
+def test_open_shares_cached_objects_and_parses_schema_lazily(tmp_path: Path, monkeypatch) -> None:
+    pandera = pytest.importorskip("pandera")
+    schema = pandera.DataFrameSchema({"depth": pandera.Column(float, nullable=True)}, strict=False)
+    pbm = _make_demo_pbm(tmp_path)
+    pbm.schema = schema
+    pbm.write(pbm.read(index=None), merge=False)
+    path = pbm.blockmodel_path
+    metadata_cache.clear_metadata_cache()
+
+    with monkeypatch.context() as patched:
+        patched.setattr(blockmodel_module.copy, "deepcopy", lambda *a, **k: pytest.fail("open must not copy"))
+        first = ParquetBlockModel(path)
+        second = ParquetBlockModel(path)
+    entry = metadata_cache.get_file_metadata(path)
+    assert "schema" not in entry.__dict__
+
+    # Public access copies, so mutating one instance cannot leak into another.
+    assert first.schema is not entry.schema
+    first.schema.columns.pop("depth")
+    assert "depth" in second.schema.columns
+    assert "depth" in entry.schema.columns
+
+
+def test_rewrite_invalidates_cached_metadata(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    stale = metadata_cache.get_file_metadata(pbm.blockmodel_path)
+
+    subset = pbm.read(columns=["block_id", "depth"], index=None)
+    subset["twice_depth"] = subset.pop("depth") * 2
+    pbm.write(subset, merge=True)
+
+    assert "twice_depth" in metadata_cache.get_file_metadata(pbm.blockmodel_path).schema_arrow.names
+    assert "twice_depth" not in stale.schema_arrow.names
+    assert "twice_depth" in ParquetBlockModel(pbm.blockmodel_path).columns
+
+
+def test_external_rewrite_detected_by_fingerprint(tmp_path: Path, read_calls: list[Path]) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    metadata_cache.get_file_metadata(pbm.blockmodel_path)
+    read_calls.clear()
+
+    table = pq.read_table(pbm.blockmodel_path)
+    pq.write_table(table, pbm.blockmodel_path, row_group_size=5)
+    mtime_ns = os.stat(pbm.blockmodel_path).st_mtime_ns + 10**9
+    os.utime(pbm.blockmodel_path, ns=(mtime_ns, mtime_ns))
+
+    reopened = ParquetBlockModel(pbm.blockmodel_path)
+
+    assert len(read_calls) == 1
+    assert reopened.pf.metadata.num_row_groups > 1
+
+
+def test_cache_is_bounded(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(metadata_cache, "MAX_CACHE_ENTRIES", 1)
+    metadata_cache.clear_metadata_cache()
+    first = _make_demo_pbm(tmp_path)
+    second = ParquetBlockModel.create_demo_block_model(tmp_path / "other.parquet", shape=(2, 2, 2))
+
+    metadata_cache.get_file_metadata(first.blockmodel_path)
+    metadata_cache.get_file_metadata(second.blockmodel_path)
+
+    assert list(metadata_cache._cache) == [second.blockmodel_path.resolve()]
+    assert np.prod(metadata_cache.get_file_metadata(second.blockmodel_path).geometry.shape) == 8
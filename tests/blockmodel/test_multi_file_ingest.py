@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.geometry import RegularGeometry
+from parq_blockmodel.io import ingest_utils
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _demo_df() -> pd.DataFrame:
+    df = create_demo_blockmodel(shape=(4, 3, 3), block_size=(2.0, 1.0, 5.0), corner=(100.0, 200.0, 300.0))
+    return df.reset_index()[["x", "y", "z", "depth"]]
+
+
+def _write_benches(tmp_path: Path, df: pd.DataFrame) -> list[Path]:
+    exports = tmp_path / "exports"
+    exports.mkdir()
+    paths = []
+    for bench, part in df.groupby("z"):
+        path = exports / f"bench_{int(bench)}.parquet"
+        part.to_parquet(path, index=False, row_group_size=5)
+        paths.append(path)
+    return paths
+
+
+def test_bench_exports_ingest_into_one_model(tmp_path: Path, monkeypatch) -> None:
+    df = _demo_df()
+    paths = _write_benches(tmp_path, df)
+    expected = RegularGeometry.from_parquet_files(paths, use_statistics=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("union geometry should come from statistics")
+
+    monkeypatch.setattr(RegularGeometry, "from_centroid_batches", fail)
+    estimated = RegularGeometry.from_parquet_files(paths, use_statistics=True)
+    assert estimated.to_metadata_dict() == expected.to_metadata_dict()
+    pbm = ParquetBlockModel.from_parquet_files(str(tmp_path / "exports" / "*.parquet"), tmp_path / "combined.pbm")
+
+    assert pbm.geometry.local.shape == (4, 3, 3)
+    assert pbm.geometry.local.block_size == (2.0, 1.0, 5.0)
+    result = pbm.read(columns=["depth"], index="xyz").sort_index()
+    np.testing.assert_allclose(result["depth"], df.set_index(["x", "y", "z"]).sort_index()["depth"])
+
+
+def test_parallel_multi_file_ingest_matches_sequential(tmp_path: Path) -> None:
+    _write_benches(tmp_path, _demo_df())
+
+    sequential = ParquetBlockModel.from_parquet_files(tmp_path / "exports", tmp_path / "seq.pbm", chunk_size=4)
+    parallel = ParquetBlockModel.from_parquet_files(
+        tmp_path / "exports", tmp_path / "par.pbm", chunk_size=4, workers=3, prefetch=1
+    )
+
+    assert pq.read_table(parallel.blockmodel_path).equals(pq.read_table(sequential.blockmodel_path))
+
+
+def test_multi_file_ingest_unifies_columns(tmp_path: Path) -> None:
+    df = _demo_df()
+    first, second = _write_benches(tmp_path, df)[:2]
+    extra = pd.read_parquet(second)
+    extra["domain"] = 7
+    extra.to_parquet(second, index=False)
+
+    pbm = ParquetBlockModel.from_parquet_files([first, second], tmp_path / "two.pbm")
+
+    domain = pbm.read(columns=["domain"], index="xyz")["domain"]
+    assert domain.isna().sum() == len(pd.read_parquet(first))
+    assert (domain.dropna() == 7).all()
+
+
+def test_multi_file_ingest_enforces_global_uniqueness(tmp_path: Path) -> None:
+    paths = _write_benches(tmp_path, _demo_df())
+    duplicate = tmp_path / "exports" / "zz_duplicate.parquet"
+    pd.read_parquet(paths[0]).iloc[[2]].to_parquet(duplicate, index=False)
+
+    with pytest.raises(ValueError, match="unique block_id"):
+        ParquetBlockModel.from_parquet_files(tmp_path / "exports", tmp_path / "dup.pbm")
+    assert not (tmp_path / "dup.pbm").exists()
+
+
+def test_resolve_source_paths(tmp_path: Path) -> None:
+    paths = _write_benches(tmp_path, _demo_df())
+
+    assert ingest_utils.resolve_source_paths(tmp_path / "exports") == paths
+    assert ingest_utils.resolve_source_paths(str(tmp_path / "exports" / "bench_302*.parquet")) == paths[:1]
+    with pytest.raises(ValueError, match="No source files"):
+        ingest_utils.resolve_source_paths(str(tmp_path / "missing" / "*.parquet"))
+    with pytest.raises(ValueError, match="do not exist"):
+        ingest_utils.resolve_source_paths([tmp_path / "nope.parquet"])
@@ -0,0 +1,75 @@
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import IngestWriter
+from parq_blockmodel.io.ingest_utils import ordered_map
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _write_source(tmp_path: Path, name: str = "source.parquet") -> Path:
+    source = tmp_path / name
+    df = create_demo_blockmodel(shape=(6, 5, 4), block_size=(1.0, 1.0, 1.0), corner=(0.0, 0.0, 0.0))
+    df.to_parquet(source)
+    return source
+
+
+def test_ordered_map_keeps_order_with_uneven_work() -> None:
+    def slow_for_small(value: int) -> int:
+        time.sleep(0.002 * (10 - value))
+        return value * 2
+
+    assert list(ordered_map(slow_for_small, range(10), workers=4)) == [v * 2 for v in range(10)]
+    assert list(ordered_map(slow_for_small, range(3), workers=1)) == [0, 2, 4]
+
+    with pytest.raises(ValueError, match="workers"):
+        ordered_map(slow_for_small, range(3), workers=0)
+
+
+def test_ordered_map_raises_in_order_and_bounds_pending() -> None:
+    started: list[int] = []
+    lock = threading.Lock()
+
+    def record(value: int) -> int:
+        with lock:
+            started.append(value)
+        if value == 3:
+            raise RuntimeError("bad batch")
+        return value
+
+    results = ordered_map(record, range(100), workers=2, max_pending=2)
+    assert [next(results) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(RuntimeError, match="bad batch"):
+        next(results)
+    # Only the reorder window ahead of the consumer was ever submitted.
+    assert max(started) < 3 + 2
+
+
+def test_parallel_ingest_matches_sequential(tmp_path: Path) -> None:
+    source = _write_source(tmp_path)
+    pbm = ParquetBlockModel.from_parquet(source, chunk_size=7)
+    expected = pq.read_table(pbm.blockmodel_path)
+
+    parallel = tmp_path / "parallel.pbm"
+    IngestWriter(source, parallel, geometry=pbm.geometry).write(chunk_size=7, workers=4)
+
+    result = pq.read_table(parallel)
+    assert result.schema == expected.schema
+    assert result.equals(expected)
+    assert pq.ParquetFile(parallel).metadata.num_row_groups == pq.ParquetFile(pbm.blockmodel_path).metadata.num_row_groups
+
+
+def test_parallel_ingest_enforces_cross_batch_uniqueness(tmp_path: Path) -> None:
+    pbm = ParquetBlockModel.from_parquet(_write_source(tmp_path), chunk_size=7)
+    df = pbm.read(index=None)
+    source = tmp_path / "dup.parquet"
+    pd.concat([df, df.iloc[[3]]]).to_parquet(source, index=False)
+
+    with pytest.raises(ValueError, match="unique block_id"):
+        IngestWriter(source, tmp_path / "dup.pbm", geometry=pbm.geometry).write(chunk_size=7, workers=3)
+    assert not (tmp_path / "dup.pbm").exists()
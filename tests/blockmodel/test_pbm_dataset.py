@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import pbm_dataset
+
+
+def _demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(6, 5, 16))
+
+
+def test_partitioned_dataset_round_trips(tmp_path: Path) -> None:
+    pbm = _demo_pbm(tmp_path)
+
+    dataset = pbm.to_partitioned(tmp_path / "demo.pbmd", row_group_size=50, workers=3)
+
+    manifest = pbm_dataset.read_manifest(dataset.blockmodel_path)
+    assert manifest.partition_by == "k"
+    assert len(manifest.partitions) == 8
+    assert manifest.num_rows == 480
+    assert json.loads((dataset.blockmodel_path / "_manifest.json").read_text())["version"] == 1
+    assert dataset.geometry.to_metadata_dict() == pbm.geometry.to_metadata_dict()
+    pd.testing.assert_frame_equal(dataset.read(index="ijk").sort_index(), pbm.read(index="ijk").sort_index())
+
+    reopened = ParquetBlockModel(tmp_path / "demo.pbmd")
+    assert reopened.is_partitioned and reopened.data is None
+    assert reopened.pf.metadata.num_rows == 480
+
+
+def test_to_partitioned_after_rejected_write(tmp_path: Path) -> None:
+    pbm = _demo_pbm(tmp_path)
+    with pytest.raises(ValueError, match="already present"):
+        pbm.write(pbm.read(columns=["block_id", "depth"], index=None), merge=True)
+
+    dataset = pbm.to_partitioned(tmp_path / "demo.pbmd")
+
+    pd.testing.assert_frame_equal(dataset.read(index="ijk").sort_index(), pbm.read(index="ijk").sort_index())
+
+
+def test_column_family_write_is_rejected_for_datasets(tmp_path: Path) -> None:
+    dataset = _demo_pbm(tmp_path).to_partitioned(tmp_path / "demo.pbmd", partition_size=4)
+    payload = dataset.read(columns=["block_id"], index=None)
+    payload["grade"] = 1.0
+    before = {path: path.stat().st_mtime_ns for path in dataset.blockmodel_path.rglob("*.parquet")}
+
+    with pytest.raises(ValueError, match="column_family"):
+        dataset.write(payload, merge=True, column_family=True)
+
+    assert {path: path.stat().st_mtime_ns for path in dataset.blockmodel_path.rglob("*.parquet")} == before
+    assert "grade" not in dataset.columns
+
+
+def test_filtered_reads_prune_partitions(tmp_path: Path) -> None:
+    dataset = _demo_pbm(tmp_path).to_partitioned(tmp_path / "demo.pbmd", partition_size=4)
+
+    assert len(list(dataset._dataset().get_fragments(filter=pc.field("k") == 5))) == 1
+    assert len(list(dataset._dataset().get_fragments())) == 4
+    bench = dataset.read(columns=["depth"], filters=[("k", "==", 5)], index="ijk")
+    assert len(bench) == 30
+    assert set(bench.index.get_level_values("k")) == {5}
+
+
+def test_merge_write_and_compress_rewrite_partitions(tmp_path: Path) -> None:
+    dataset = _demo_pbm(tmp_path).to_partitioned(tmp_path / "demo.pbmd")
+    updates = pd.DataFrame({"block_id": np.arange(0, 480, 2), "even": 1.0})
+
+    dataset.write(updates, merge=True, workers=2)
+    dataset.compress(level=3, workers=2)
+
+    assert dataset.columns[-1] == "even"
+    assert dataset.read(columns=["even"])["even"].notna().sum() == 240
+    assert dataset.compression["mode"] == "archive"
+    files = sorted(path.name for path in dataset.blockmodel_path.glob("part-*.parquet"))
+    assert len(files) == 8 and all(name.startswith("part-00002-") for name in files)
+    assert ParquetBlockModel(tmp_path / "demo.pbmd").compression == dataset.compression
+
+
+def test_world_id_tiles(tmp_path: Path) -> None:
+    pbm = _demo_pbm(tmp_path)
+
+    dataset = pbm.to_partitioned(tmp_path / "tiles.pbmd", partition_by="world_id")
+
+    manifest = pbm_dataset.read_manifest(dataset.blockmodel_path)
+    assert len(manifest.partitions) >= pbm_dataset.DEFAULT_PARTITION_COUNT
+    keys = [partition.key for partition in manifest.partitions]
+    for partition in manifest.partitions:
+        lo, hi = partition.bounds["world_id"]
+        assert lo >> manifest.partition_size == hi >> manifest.partition_size == partition.key
+    assert keys == sorted(keys)
+    pd.testing.assert_frame_equal(
+        dataset.read(columns=["depth"], index="xyz").sort_index(),
+        pbm.read(columns=["depth"], index="xyz").sort_index(),
+    )
+    with pytest.raises(FileExistsError):
+        pbm.to_partitioned(tmp_path / "tiles.pbmd")
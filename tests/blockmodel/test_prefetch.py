@@ -0,0 +1,61 @@
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import read_utils
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _prefetch_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "parq-blockmodel-prefetch"]
+
+
+def test_prefetch_iter_preserves_order_and_propagates_errors() -> None:
+    assert list(read_utils.prefetch_iter(range(10), prefetch=2)) == list(range(10))
+    assert list(read_utils.prefetch_iter(range(3), prefetch=0)) == [0, 1, 2]
+
+    def failing():
+        yield 1
+        raise RuntimeError("decode failed")
+
+    iterator = read_utils.prefetch_iter(failing(), prefetch=2)
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError, match="decode failed"):
+        next(iterator)
+
+    with pytest.raises(ValueError, match="prefetch"):
+        read_utils.prefetch_iter(range(3), prefetch=-1)
+
+
+def test_prefetch_iter_close_stops_worker() -> None:
+    iterator = read_utils.prefetch_iter(iter(range(1_000)), prefetch=1)
+    assert next(iterator) == 0
+
+    iterator.close()
+
+    assert not _prefetch_threads()
+
+
+def test_iter_read_with_prefetch_matches_serial(tmp_path: Path) -> None:
+    pbm = ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+    serial = pd.concat(pbm.iter_read(columns=["depth", "volume"], batch_size=5))
+    prefetched = pd.concat(pbm.iter_read(columns=["depth", "volume"], batch_size=5, prefetch=2))
+
+    pd.testing.assert_frame_equal(prefetched, serial)
+    assert not _prefetch_threads()
+
+
+def test_ingest_and_compress_with_prefetch(tmp_path: Path) -> None:
+    source = tmp_path / "source.parquet"
+    create_demo_blockmodel(shape=(4, 3, 2), block_size=(1.0, 1.0, 1.0), corner=(0.0, 0.0, 0.0)).to_parquet(source)
+
+    pbm = ParquetBlockModel.from_parquet(source, chunk_size=5, prefetch=2)
+    expected = pbm.read(index="ijk")
+    pbm.compress(prefetch=2)
+
+    pd.testing.assert_frame_equal(pbm.read(index="ijk"), expected)
+    assert not _prefetch_threads()
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import read_utils
+
+
+def _make_demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+
+def test_read_arrow_ijk_columns_match_pandas_index(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    table = pbm.read_arrow(columns=["depth"], index="ijk")
+    expected = pbm.read(columns=["depth"], index="ijk")
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["i", "j", "k", "depth"]
+    for name in ["i", "j", "k"]:
+        np.testing.assert_array_equal(table.column(name).to_numpy(), expected.index.get_level_values(name))
+    np.testing.assert_allclose(table.column("depth").to_numpy(), expected["depth"].to_numpy())
+
+
+def test_read_arrow_xyz_does_not_duplicate_persisted_centroids(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    table = pbm.read_arrow(columns=["x", "y", "z", "depth"], index="xyz")
+
+    assert table.column_names == ["x", "y", "z", "depth"]
+
+
+def test_read_return_type_numpy_and_arrow(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    arrays = pbm.read(columns=["depth", "volume"], index=None, return_type="numpy")
+    assert list(arrays) == ["depth", "volume"]
+    assert all(isinstance(values, np.ndarray) for values in arrays.values())
+    np.testing.assert_allclose(arrays["volume"], pbm.geometry.block_volume)
+
+    table = pbm.read(columns=["depth"], index="xyz", filters=[("block_id", "<", 5)], return_type="arrow")
+    assert table.column_names == ["x", "y", "z", "depth"]
+    assert table.num_rows == 5
+
+    with pytest.raises(ValueError, match="dense=True"):
+        pbm.read(dense=True, return_type="arrow")
+
+
+def test_arrow_to_numpy_is_zero_copy_for_single_chunk_numeric() -> None:
+    values = pa.array(np.arange(10, dtype=np.float64))
+    table = pa.table({"grade": values, "domain": pa.array(["a", "b"] * 5).dictionary_encode()})
+
+    arrays = read_utils.arrow_to_numpy(table)
+
+    assert not arrays["grade"].flags.owndata
+    np.testing.assert_array_equal(arrays["grade"], np.arange(10))
+    assert list(arrays["domain"][:2]) == ["a", "b"]
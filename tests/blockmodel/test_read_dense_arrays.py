@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.io import read_utils
+from parq_blockmodel.reblocking.conversion import tabular_to_3d_dict
+
+
+def _make_demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+
+def _make_sparse_pbm(tmp_path: Path) -> ParquetBlockModel:
+    pbm = _make_demo_pbm(tmp_path)
+    full = pbm.read(columns=["block_id", "k", "depth"], index="xyz")
+    sparse_df = full[full["k"] == 0].copy()
+    sparse_df["count"] = np.arange(len(sparse_df), dtype=np.int64)
+    return ParquetBlockModel.from_dataframe(sparse_df, tmp_path / "sparse.parquet", geometry=pbm.geometry)
+
+
+def test_read_dense_arrays_matches_tabular_conversion(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    columns = ["depth", "depth_category"]
+
+    arrays, categories = pbm.read_dense_arrays(columns=columns)
+    expected_arrays, expected_categories = tabular_to_3d_dict(pbm.read(columns=columns, index="ijk", dense=True))
+
+    assert arrays["depth"].shape == pbm.geometry.shape
+    np.testing.assert_allclose(arrays["depth"], expected_arrays["depth"])
+    decoded = np.asarray(categories["depth_category"])[arrays["depth_category"]]
+    expected = np.asarray(expected_categories["depth_category"])[expected_arrays["depth_category"]]
+    np.testing.assert_array_equal(decoded, expected)
+
+
+def test_read_dense_arrays_sparse_fill_and_promotion(tmp_path: Path) -> None:
+    pbm = _make_sparse_pbm(tmp_path)
+
+    arrays, _ = pbm.read_dense_arrays(columns=["depth", "count"])
+
+    assert np.isnan(arrays["depth"][:, :, 1]).all()
+    assert not np.isnan(arrays["depth"][:, :, 0]).any()
+    assert arrays["count"].dtype == np.float64
+    np.testing.assert_array_equal(arrays["count"][:, :, 0].ravel(), np.arange(12))
+
+    arrays, _ = pbm.read_dense_arrays(columns=["count"], fill_value=-1)
+    assert arrays["count"].dtype == np.int64
+    assert (arrays["count"][:, :, 1] == -1).all()
+
+
+def test_read_dense_arrays_calculated_column_and_filters(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    arrays, _ = pbm.read_dense_arrays(columns=["volume"], filters=[("i", "==", 0)], batch_size=5)
+
+    assert np.allclose(arrays["volume"][0], pbm.geometry.block_volume)
+    assert np.isnan(arrays["volume"][1:]).all()
+
+
+def test_to_dense_parquet_exports_sparse_values(tmp_path: Path) -> None:
+    pbm = _make_sparse_pbm(tmp_path)
+    target = tmp_path / "dense.parquet"
+
+    pbm.to_dense_parquet(target, chunk_size=5)
+
+    df = pd.read_parquet(target)
+    assert len(df) == int(np.prod(pbm.geometry.shape))
+    np.testing.assert_array_equal(df["block_id"].to_numpy(), np.arange(len(df)))
+    present = df["k"] == 0
+    np.testing.assert_allclose(df.loc[present, "depth"].to_numpy(), pbm.read(columns=["depth"], index=None)["depth"])
+    assert df.loc[~present, "depth"].isna().all()
+
+
+def test_to_dense_parquet_after_rejected_write(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    with pytest.raises(ValueError, match="already present"):
+        pbm.write(pbm.read(columns=["block_id", "depth"], index=None), merge=True)
+
+    pbm.to_dense_parquet(tmp_path / "dense.parquet", chunk_size=5)
+
+    assert len(pd.read_parquet(tmp_path / "dense.parquet")) == 24
+
+
+def test_dense_column_builder_sorts_string_categories() -> None:
+    builder = read_utils.DenseColumnBuilder(4)
+    builder.add(np.array([3, 0]), pa.array(["b", None]))
+    builder.add(np.array([1]), pa.array(["a"]))
+
+    codes, categories = builder.finish((2, 2, 1))
+
+    assert list(categories) == ["a", "b"]
+    np.testing.assert_array_equal(codes.ravel(), [-1, 0, -1, 1])
+
+
+def test_to_dense_parquet_reads_block_id_ranges_and_keeps_categories(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+    payload = pbm.read(columns=["block_id"], index=None)
+    payload["rock"] = pd.Categorical(["hi", "lo", "mid"] * 8, categories=["lo", "mid", "hi", "unused"], ordered=True)
+    pbm.write(payload, merge=True)
+    filters = []
+    original_iter_batches = pbm._iter_batches
+
+    def spy_iter_batches(columns, *args, **kwargs):
+        if "depth" in columns:
+            filters.append(kwargs.get("filter_expression"))
+        return original_iter_batches(columns, *args, **kwargs)
+
+    monkeypatch.setattr(pbm, "read_dense_arrays", lambda *a, **k: pytest.fail("export must not densify the grid"))
+    monkeypatch.setattr(pbm, "_iter_batches", spy_iter_batches)
+    target = tmp_path / "dense.parquet"
+    pbm.to_dense_parquet(target, chunk_size=10)
+
+    assert len(filters) == 3 and all("block_id" in str(expression) for expression in filters)
+    df = pd.read_parquet(target)
+    assert df["rock"].dtype == payload["rock"].dtype
+    np.testing.assert_array_equal(df["rock"].to_numpy(), payload["rock"].to_numpy())
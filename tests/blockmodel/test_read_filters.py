@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow.compute as pc
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+
+
+def _make_demo_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(4, 3, 2))
+
+
+def test_read_filters_attribute_comparison_matches_pandas_slice(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    full = pbm.read(index="ijk")
+    filtered = pbm.read(index="ijk", filters=[("depth", ">", 1.0)])
+
+    expected = full[full["depth"] > 1.0]
+    assert len(filtered) == len(expected) > 0
+    assert filtered.index.equals(expected.index)
+    assert np.array_equal(filtered["depth"].to_numpy(), expected["depth"].to_numpy())
+
+
+def test_read_filters_isin_on_categorical(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    filtered = pbm.read(index=None, filters=[("depth_category", "in", ["shallow"])])
+
+    assert len(filtered) > 0
+    assert set(filtered["depth_category"].astype(str)) == {"shallow"}
+
+
+def test_read_filters_positional_range_without_positional_columns(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    filtered = pbm.read(
+        columns=["depth"],
+        index="ijk",
+        filters=[("i", ">=", 1), ("i", "<=", 2), ("k", "==", 0)],
+    )
+
+    assert list(filtered.columns) == ["depth"]
+    i, _, k = (filtered.index.get_level_values(name) for name in ["i", "j", "k"])
+    assert len(filtered) == 2 * 3
+    assert set(i) == {1, 2}
+    assert set(k) == {0}
+
+    full = pbm.read(columns=["depth"], index="ijk")
+    assert np.array_equal(filtered["depth"].to_numpy(), full.loc[filtered.index, "depth"].to_numpy())
+
+
+def test_read_filters_accepts_expression_and_dense(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    dense = pbm.read(columns=["depth"], index="xyz", dense=True, filters=pc.field("block_id") < 5)
+
+    assert len(dense) == int(np.prod(pbm.geometry.shape))
+    assert int(dense["depth"].notna().sum()) == 5
+
+
+def test_read_filters_with_calculated_columns(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    filtered = pbm.read(columns=["volume"], index="ijk", filters=[("block_id", "in", [0, 3])])
+
+    assert len(filtered) == 2
+    assert np.allclose(filtered["volume"].to_numpy(), pbm.geometry.block_volume)
+
+
+def test_read_filters_unknown_column_raises(tmp_path: Path) -> None:
+    pbm = _make_demo_pbm(tmp_path)
+
+    with pytest.raises(ValueError, match="persisted columns"):
+        pbm.read(filters=[("volume", ">", 0)])
@@ -0,0 +1,173 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel import ParquetBlockModel, RegularGeometry
+from parq_blockmodel.io import read_utils
+from parq_blockmodel.utils.geometry_utils import angles_to_axes
+
+
+def _make_pbm(tmp_path: Path, shape=(6, 5, 4), rotated: bool = False) -> ParquetBlockModel:
+    axes = angles_to_axes(axis_azimuth=30.0, axis_dip=0.0, axis_plunge=0.0) if rotated else (
+        (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)
+    )
+    geometry = RegularGeometry.create(
+        corner=(0.0, 0.0, 0.0),
+        block_size=(1.0, 1.0, 1.0),
+        shape=shape,
+        axis_u=axes[0],
+        axis_v=axes[1],
+        axis_w=axes[2],
+    )
+    pbm = ParquetBlockModel.from_geometry(geometry, tmp_path / "window.pbm")
+    payload = pbm.read(columns=["block_id"], index=None)
+    payload["grade"] = payload["block_id"].to_numpy(dtype=float) * 0.1
+    return pbm.write(payload, merge=True)
+
+
+def test_ijk_window_block_id_ranges_cover_window_exactly():
+    shape = (4, 3, 5)
+    window = ((1, 2), (0, 1), (2, 3))
+    ids = read_utils.ijk_window_block_ids(shape, window)
+
+    ii, jj, kk = np.meshgrid(np.arange(1, 3), np.arange(0, 2), np.arange(2, 4), indexing="ij")
+    expected = np.sort(np.ravel_multi_index((ii.ravel(), jj.ravel(), kk.ravel()), shape))
+    np.testing.assert_array_equal(ids, expected)
+
+    full_planes = read_utils.ijk_window_block_id_ranges(shape, ((1, 2), (0, 2), (0, 4)))
+    np.testing.assert_array_equal(full_planes, [[15, 44]])
+
+
+def test_read_window_matches_sliced_read(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+
+    window = pbm.read_window(i=(1, 3), j=(2, 2), k=(0, 1), columns=["grade"], index="ijk")
+
+    full = pbm.read(columns=["grade"], index="ijk")
+    i, j, k = (full.index.get_level_values(name) for name in ["i", "j", "k"])
+    expected = full[(i >= 1) & (i <= 3) & (j == 2) & (k <= 1)]
+    assert window.index.equals(expected.index)
+    np.testing.assert_allclose(window["grade"].to_numpy(), expected["grade"].to_numpy())
+
+
+def test_read_window_without_persisted_ijk(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    table = pq.read_table(pbm.blockmodel_path).drop_columns(["i", "j", "k"])
+    pq.write_table(table, pbm.blockmodel_path)
+    pbm = ParquetBlockModel(pbm.blockmodel_path)
+
+    window = pbm.read_window(i=(4, 10), k=(3, 3), columns=["grade"], index="ijk")
+
+    assert len(window) == 2 * 5
+    assert set(window.index.get_level_values("i")) == {4, 5}
+    assert set(window.index.get_level_values("k")) == {3}
+
+
+def test_read_window_without_ijk_pushes_down_bounded_ranges(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_pbm(tmp_path, shape=(30, 30, 4))
+    table = pq.read_table(pbm.blockmodel_path).drop_columns(["i", "j", "k"])
+    pq.write_table(table, pbm.blockmodel_path)
+    pbm = ParquetBlockModel(pbm.blockmodel_path)
+    pushed = []
+    original_read = pbm.read
+
+    def spy_read(*args, **kwargs):
+        pushed.append(kwargs.get("filters"))
+        return original_read(*args, **kwargs)
+
+    monkeypatch.setattr(pbm, "read", spy_read)
+    window = pbm.read_window(i=(2, 25), j=(3, 20), k=(1, 2), columns=["grade"], index="ijk")
+
+    assert str(pushed[0]).count(" or ") < 16
+    ii, jj, kk = np.meshgrid(np.arange(2, 26), np.arange(3, 21), np.arange(1, 3), indexing="ij")
+    expected = np.ravel_multi_index((ii.ravel(), jj.ravel(), kk.ravel()), (30, 30, 4))
+    np.testing.assert_allclose(np.sort(window["grade"].to_numpy()), np.sort(expected * 0.1))
+
+
+def test_coalesce_ranges_merges_smallest_gaps() -> None:
+    runs = np.array([[0, 1], [3, 4], [10, 12], [13, 13], [30, 31]])
+
+    np.testing.assert_array_equal(read_utils.coalesce_ranges(runs, 5), runs)
+    np.testing.assert_array_equal(read_utils.coalesce_ranges(runs, 3), [[0, 4], [10, 13], [30, 31]])
+    np.testing.assert_array_equal(read_utils.coalesce_ranges(runs, 1), [[0, 31]])
+
+
+def test_read_window_dense_covers_window_only(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    full = pbm.read(columns=["block_id", "grade"], index="xyz")
+    sparse_df = full[full["block_id"] % 2 == 0]
+    sparse_pbm = ParquetBlockModel.from_dataframe(
+        sparse_df, tmp_path / "sparse.parquet", geometry=pbm.geometry
+    )
+
+    dense = sparse_pbm.read_window(i=(0, 1), j=(0, 1), k=(0, 1), columns=["grade"], index="ijk", dense=True)
+
+    assert len(dense) == 8
+    assert dense.index.is_monotonic_increasing
+    assert int(dense["grade"].notna().sum()) == 4
+    np.testing.assert_array_equal(dense.index.get_level_values("k")[dense["grade"].notna()], [0, 0, 0, 0])
+
+
+def test_read_window_outside_grid_is_empty(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+
+    window = pbm.read_window(i=(10, 12), columns=["grade"], index="xyz")
+
+    assert window.empty
+    assert list(window.columns) == ["grade"]
+
+
+def test_read_window_xyz_unrotated(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+
+    window = pbm.read_window_xyz(x=(1.0, 2.6), z=(3.5, 10.0), columns=["grade"], index="xyz")
+
+    x = window.index.get_level_values("x")
+    z = window.index.get_level_values("z")
+    assert len(window) == 2 * 5
+    assert set(np.round(x, 6)) == {1.5, 2.5}
+    assert set(np.round(z, 6)) == {3.5}
+
+
+def test_read_window_xyz_rotated_selects_centroids_inside_box(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path, rotated=True)
+    bounds = {"x": (1.0, 4.0), "y": (0.5, 3.0)}
+
+    window = pbm.read_window_xyz(**bounds, columns=["grade"], index="xyz")
+
+    full = pbm.read(columns=["grade"], index="xyz")
+    x = full.index.get_level_values("x")
+    y = full.index.get_level_values("y")
+    expected = full[(x >= 1.0) & (x <= 4.0) & (y >= 0.5) & (y <= 3.0)]
+    assert len(window) == len(expected) > 0
+    assert set(window.index) == set(expected.index)
+
+
+def test_read_window_xyz_rotated_pushes_down_envelope_not_block_list(tmp_path: Path, monkeypatch) -> None:
+    pbm = _make_pbm(tmp_path, rotated=True)
+    bounds = {"x": (1.0, 4.0), "y": (0.5, 3.0)}
+    expected = pbm.read_window_xyz(**bounds, columns=["grade"], index="xyz")
+    pushed = []
+    original_read = pbm.read
+
+    def spy_read(*args, **kwargs):
+        pushed.append(kwargs.get("filters"))
+        return original_read(*args, **kwargs)
+
+    monkeypatch.setattr(pbm, "read", spy_read)
+    flat = pbm.read_window_xyz(**bounds, columns=["grade"], index=None)
+    dense = pbm.read_window_xyz(**bounds, columns=["grade"], index="xyz", dense=True)
+
+    assert all("is_in" not in str(expression) for expression in pushed)
+    assert list(flat.columns) == ["grade"]
+    assert sorted(flat["grade"]) == sorted(expected["grade"])
+    assert set(dense.index) == set(expected.index)
+
+
+def test_read_window_dense_requires_index(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+
+    with pytest.raises(ValueError, match="dense=True requires"):
+        pbm.read_window(i=(0, 1), index=None, dense=True)
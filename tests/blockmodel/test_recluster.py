@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from parq_blockmodel.blockmodel import ParquetBlockModel
+from parq_blockmodel.geometry import RegularGeometry
+from parq_blockmodel.io import column_sidecars
+from parq_blockmodel.io.external_sort import sort_batches
+
+
+def _make_pbm(tmp_path: Path) -> ParquetBlockModel:
+    return ParquetBlockModel.create_demo_block_model(tmp_path / "demo.parquet", shape=(10, 8, 6))
+
+
+def test_sort_batches_spills_and_keeps_ties_stable(tmp_path: Path) -> None:
+    keys = np.random.default_rng(3).integers(0, 20, 5000).astype(np.uint64)
+    table = pa.table({"key": keys, "position": np.arange(keys.size)})
+
+    tables = list(sort_batches(table.to_batches(max_chunksize=250), lambda t: np.asarray(t["key"]),
+                               output_rows=400, run_rows=700, merge_rows=90, spill_dir=tmp_path))
+
+    assert [t.num_rows for t in tables[:-1]] == [400] * (len(tables) - 1)
+    result = pa.concat_tables(tables)
+    assert result.column_names == ["key", "position"]
+    np.testing.assert_array_equal(result["position"], np.argsort(keys, kind="stable"))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("order, monotone", [("morton", "world_id"), ("k_bench", "k"), ("hilbert", None)])
+def test_recluster_sorts_rows_and_records_order(tmp_path: Path, order: str, monotone) -> None:
+    pbm = _make_pbm(tmp_path)
+    expected = pbm.read(index="ijk").sort_index()
+
+    pbm.recluster(order, row_group_size=64, run_rows=100)
+
+    reopened = ParquetBlockModel(pbm.blockmodel_path)
+    assert reopened.sort_order["order"] == order
+    pd.testing.assert_frame_equal(reopened.read(index="ijk").sort_index(), expected)
+    assert reopened.validate_special_columns(sample_size=0)
+    metadata = pq.read_metadata(pbm.blockmodel_path)
+    assert metadata.num_row_groups == 8
+    if monotone is not None:
+        assert reopened.sort_order["columns"][0] == monotone
+        assert reopened.read(columns=[monotone], index=None)[monotone].is_monotonic_increasing
+        assert metadata.row_group(0).sorting_columns[0].column_index == reopened.columns.index(monotone)
+    assert list(tmp_path.glob("pbm-sort-*")) == []
+
+
+def test_recluster_keeps_signed_world_id_monotone(tmp_path: Path) -> None:
+    # A y span above 838860.8 sets the sign bit of the default 64-bit world_id.
+    pbm = ParquetBlockModel.create_demo_block_model(
+        tmp_path / "wide.parquet", shape=(4, 3, 2), block_size=(1.0, 500000.0, 1.0)
+    )
+
+    pbm.recluster("morton", row_group_size=8, run_rows=10)
+
+    world_ids = pbm.read(columns=["world_id"], index=None)["world_id"]
+    assert (world_ids < 0).any()
+    assert world_ids.is_monotonic_increasing
+    assert pbm.sort_order["columns"] == ["world_id"]
+
+
+def test_k_bench_key_orders_large_grids_by_bench_then_block_id(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    pbm.geometry = RegularGeometry.create(corner=(0.0, 0.0, 0.0), block_size=(1.0, 1.0, 1.0),
+                                          shape=(2000, 2000, 1100))
+    block_ids = np.array([2**32 + 5, 1, 2**32 + 1100, 4_399_999_999], dtype=np.int64)
+
+    key = pbm._cluster_key("k_bench")(pa.table({"block_id": block_ids}))
+
+    k = block_ids % 1100
+    np.testing.assert_array_equal(np.argsort(key, kind="stable"), np.lexsort((block_ids, k)))
+
+
+def test_recluster_folds_sidecars_and_survives_compress(tmp_path: Path) -> None:
+    pbm = _make_pbm(tmp_path)
+    payload = pbm.read(columns=["block_id"], index=None)
+    payload["grade"] = payload["block_id"] * 0.5
+    pbm.write(payload, merge=True, column_family=True)
+
+    pbm.recluster("k_bench", row_group_size=100)
+    pbm.compress(level=3)
+
+    assert not column_sidecars.sidecar_dir(pbm.blockmodel_path).exists()
+    assert pbm.sort_order == {"order": "k_bench", "columns": ["k", "block_id"]}
+    result = pbm.read(columns=["block_id", "grade"], index=None)
+    np.testing.assert_allclose(result["grade"], result["block_id"] * 0.5)
+
+    pbm.recluster("block_id")
+    assert pbm.read(columns=["block_id"], index=None)["block_id"].is_monotonic_increasing
+    with pytest.raises(ValueError, match="order must be one of"):
+        pbm.recluster("z_order")
+
+
+def test_recluster_sorts_dataset_partitions(tmp_path: Path) -> None:
+    dataset = _make_pbm(tmp_path).to_partitioned(tmp_path / "demo.pbmd", partition_size=2)
+    expected = dataset.read(index="ijk").sort_index()
+
+    dataset.recluster("morton", row_group_size=50, workers=2)
+
+    reopened = ParquetBlockModel(tmp_path / "demo.pbmd")
+    assert reopened.sort_order == {"order": "morton", "columns": ["world_id"]}
+    pd.testing.assert_frame_equal(reopened.read(index="ijk").sort_index(), expected)
+    for part in sorted(reopened.blockmodel_path.glob("part-*.parquet")):
+        assert pd.Series(pq.read_table(part, columns=["world_id"])["world_id"]).is_monotonic_increasing
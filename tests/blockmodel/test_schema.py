@@ -1162,3 +1162,32 @@ def test_from_parquet_persists_schema_columns_in_schema_order(tmp_path):
     deposit_code_idx = persisted_columns.index("deposit_code")
     tonnes_idx = persisted_columns.index("tonnes")
     assert grade_idx < deposit_code_idx < tonnes_idx
+
+
+def test_read_calculated_column_loads_only_required_inputs(tmp_path, monkeypatch):
+    pytest.importorskip("df_eval", reason="df-eval not installed")
+    df = create_demo_blockmodel(shape=(2, 2, 2)).set_index(["x", "y", "z"])
+    df["density"] = 2.5
+    df["grade"] = 0.5
+    df["unrelated"] = 1.0
+    schema = _calculated_schema()
+
+    pbm = ParquetBlockModel.from_dataframe(
+        df[["density", "grade", "unrelated"]],
+        filename=tmp_path / "minimal_calc.parquet",
+        schema=schema,
+    )
+
+    captured: list[list[str]] = []
+    original_read_table = pq.read_table
+
+    def spy_read_table(*args, **kwargs):
+        captured.append(list(kwargs.get("columns") or []))
+        return original_read_table(*args, **kwargs)
+
+    monkeypatch.setattr(pq, "read_table", spy_read_table)
+
+    result = pbm.read(columns=["contained_metal"], index=None)
+
+    assert captured[0] == ["density", "grade"]
+    np.testing.assert_allclose(result["contained_metal"].to_numpy(), np.full(len(result), 1.25))
@@ -77,6 +77,46 @@ def test_centroid_properties():
     assert geom.world.srs == "my_srs"
 
 
+def test_centroids_are_cached_read_only_and_track_mutation():
+    geom = make_geometry(corner=(10.0, 20.0, 30.0), block_size=(2.0, 1.0, 0.5), shape=(3, 2, 4))
+    assert geom.centroid_x is geom.centroid_x
+    with pytest.raises(ValueError):
+        geom.centroid_z[0] = 0.0
+
+    geom.local = LocalGeometry(corner=(0.0, 0.0, 0.0), block_size=(1.0, 1.0, 1.0), shape=(2, 2, 2))
+    np.testing.assert_allclose(geom.centroid_x, [0.5] * 4 + [1.5] * 4)
+
+
+def test_centroid_axes_and_grids_match_flat_centroids():
+    geom = make_geometry(corner=(10.0, 20.0, 30.0), block_size=(2.0, 1.0, 0.5), shape=(3, 2, 4))
+    xs, ys, zs = geom.centroid_axes
+    np.testing.assert_allclose(xs, [11.0, 13.0, 15.0])
+    np.testing.assert_allclose(ys, [20.5, 21.5])
+    np.testing.assert_allclose(zs, [30.25, 30.75, 31.25, 31.75])
+
+    gx, gy, gz = geom.centroid_grids
+    assert gx.shape == (3, 2, 4)
+    np.testing.assert_array_equal(gx.ravel(), geom.centroid_x)
+    np.testing.assert_array_equal(gy.ravel(), geom.centroid_y)
+    np.testing.assert_array_equal(gz.ravel(), geom.centroid_z)
+
+
+def test_centroid_axes_rotated_raises_and_evaluate_xy_matches():
+    c, s = np.cos(np.pi / 6), np.sin(np.pi / 6)
+    geom = make_geometry(shape=(3, 2, 4), axis_u=(c, s, 0.0), axis_v=(-s, c, 0.0))
+    with pytest.raises(ValueError, match="unrotated"):
+        geom.centroid_axes
+
+    calls = []
+
+    def func(x, y):
+        calls.append(len(x))
+        return x * 100.0 + y
+
+    np.testing.assert_allclose(geom.evaluate_xy(func), geom.centroid_x * 100.0 + geom.centroid_y)
+    assert calls == [6]
+
+
 def test_ijk_row_index_roundtrip():
     geom = make_geometry(shape=(3, 4, 5))
     rows = np.arange(np.prod(geom.local.shape))
@@ -492,3 +532,28 @@ def test_extents_with_world_origin():
     np.testing.assert_allclose(min_xyz, (100.0, 200.0, 300.0))
     np.testing.assert_allclose(max_xyz, (102.0, 202.0, 302.0))
 
+
+
+def test_ijk_bounds_from_xyz_bounds_unrotated_and_outside():
+    geom = make_geometry(corner=(10.0, 20.0, 30.0), block_size=(2.0, 2.0, 1.0), shape=(5, 4, 3))
+
+    # Centroids along x are 11, 13, 15, 17, 19.
+    assert geom.ijk_bounds_from_xyz_bounds(x=(12.0, 17.0)) == ((1, 3), (0, 3), (0, 2))
+    assert geom.ijk_bounds_from_xyz_bounds(x=(13.0, 13.0), z=(30.5, 30.5)) == ((1, 1), (0, 3), (0, 0))
+    assert geom.ijk_bounds_from_xyz_bounds(y=(100.0, 200.0)) is None
+    assert geom.ijk_bounds_from_xyz_bounds(x=(12.1, 12.9)) is None
+
+
+def test_ijk_bounds_from_xyz_bounds_rotated_covers_inside_centroids():
+    from parq_blockmodel.utils.geometry_utils import angles_to_axes
+
+    axis_u, axis_v, axis_w = angles_to_axes(axis_azimuth=25.0, axis_dip=10.0, axis_plunge=0.0)
+    geom = make_geometry(shape=(8, 7, 6), axis_u=axis_u, axis_v=axis_v, axis_w=axis_w)
+    x, y = geom.centroid_x, geom.centroid_y
+    inside = (x >= 1.0) & (x <= 3.0) & (y >= 2.0) & (y <= 4.0)
+
+    (i0, i1), (j0, j1), (k0, k1) = geom.ijk_bounds_from_xyz_bounds(x=(1.0, 3.0), y=(2.0, 4.0))
+    i, j, k = geom.ijk_from_row_index(np.flatnonzero(inside))
+    assert i.min() >= i0 and i.max() <= i1
+    assert j.min() >= j0 and j.max() <= j1
+    assert k.min() >= k0 and k.max() <= k1
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from parq_blockmodel import ParquetBlockModel
+from parq_blockmodel.geometry import RegularGeometry, _merge_sorted_unique
+from parq_blockmodel.io import ingest_utils
+from parq_blockmodel.utils.demo_block_model import create_demo_blockmodel
+
+
+def _write_xyz(tmp_path: Path, df: pd.DataFrame, row_group_size: int = 10) -> Path:
+    path = tmp_path / "xyz.parquet"
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, row_group_size=row_group_size)
+    return path
+
+
+def test_merge_sorted_unique_matches_numpy_unique() -> None:
+    rng = np.random.default_rng(7)
+    batches = [rng.integers(0, 50, size=40).astype(float) for _ in range(5)]
+
+    merged = np.empty(0)
+    for batch in batches:
+        merged = _merge_sorted_unique(merged, batch)
+
+    np.testing.assert_array_equal(merged, np.unique(np.concatenate(batches)))
+
+
+def test_statistics_inference_matches_full_scan(tmp_path: Path, monkeypatch) -> None:
+    df = create_demo_blockmodel(shape=(4, 3, 5), block_size=(2.5, 1.0, 0.5), corner=(10.0, 20.0, 30.0))
+    path = _write_xyz(tmp_path, df.reset_index()[["x", "y", "z", "depth"]])
+    exact = RegularGeometry.from_parquet(path, use_statistics=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("centroid columns should not be scanned")
+
+    monkeypatch.setattr(RegularGeometry, "from_centroid_batches", fail)
+    estimated = RegularGeometry.from_parquet(path, chunk_size=16, use_statistics=True)
+
+    assert estimated.to_metadata_dict() == exact.to_metadata_dict()
+    assert estimated.local.shape == (4, 3, 5)
+
+
+def test_statistics_inference_falls_back_when_sample_disagrees(tmp_path: Path) -> None:
+    # Three sampled rows cannot fix the spacing along every axis.
+    df = pd.DataFrame({"x": [0.0, 2.0, 4.0, 0.0, 1.0, 2.0, 3.0, 4.0],
+                       "y": [0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+                       "z": [0.0] * 4 + [1.0] * 4})
+    path = _write_xyz(tmp_path, df)
+
+    geometry = RegularGeometry.from_parquet(path, chunk_size=3, use_statistics=True)
+
+    assert geometry.local.shape == (5, 2, 2)
+    assert geometry.local.block_size == (1.0, 1.0, 1.0)
+
+
+def test_from_parquet_recovers_from_sparse_sample(tmp_path: Path) -> None:
+    # The first 15 rows only hold even x; a single x=3 row follows.
+    yz = [(y, z) for y in range(3) for z in range(2)][:5]
+    rows = [(x, y, z) for x in (0.0, 2.0, 4.0) for y, z in yz] + [(3.0, 0.0, 0.0)]
+    df = pd.DataFrame(rows, columns=["x", "y", "z"]).astype(float)
+    df["grade"] = np.arange(len(df), dtype=float)
+    path = _write_xyz(tmp_path, df, row_group_size=16)
+
+    assert RegularGeometry.from_parquet(path, chunk_size=15, use_statistics=True).local.block_size[0] == 2.0
+    # The unverified estimate is opt-in; the default and the validating helpers scan exactly.
+    assert RegularGeometry.from_parquet(path, chunk_size=15).local.shape == (5, 3, 2)
+    assert ingest_utils.validate_xyz_parquet(path, chunk_size=15).local.block_size == (1.0, 1.0, 1.0)
+
+    pbm = ParquetBlockModel.from_parquet(path, chunk_size=15)
+
+    assert pbm.geometry.local.block_size == (1.0, 1.0, 1.0)
+    assert pbm.geometry.local.shape == (5, 3, 2)
+    assert sorted(pbm.read(columns=["grade"])["grade"]) == list(df["grade"])
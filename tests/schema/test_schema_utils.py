@@ -189,3 +189,39 @@ class TestCompressionMetadata:
         assert PBM_METADATA_KEY in metadata
         payload = json.loads(metadata[PBM_METADATA_KEY].decode("utf-8"))
         assert payload["compression"]["default"]["codec"] == "snappy"
+
+
+class TestRequiredInputColumns:
+    """Test df-eval dependency resolution to persisted input columns."""
+
+    def test_required_input_columns_follows_chained_expressions(self):
+        pytest_importorskip("df_eval")
+        from parq_blockmodel.schema.utils import required_input_columns
+
+        operations = {
+            "volume": {"kind": "expr", "expr": "1.0"},
+            "tonnes": {"kind": "expr", "expr": "density * volume"},
+            "metal": {"kind": "expr", "expr": "tonnes * grade"},
+            "unused": {"kind": "expr", "expr": "other * 2"},
+        }
+        persisted = ["block_id", "grade", "other", "density"]
+
+        assert required_input_columns(operations, ["metal"], persisted) == ["grade", "density"]
+
+    def test_required_input_columns_lookup_and_alias(self):
+        from parq_blockmodel.schema.utils import required_input_columns
+
+        operations = {
+            "price": {"kind": "lookup", "lookup": {"key": "product", "mapping": {"a": 1}}},
+            "rock": {"kind": "alias", "alias": "rock_code"},
+        }
+
+        result = required_input_columns(operations, ["price", "rock"], ["product", "rock_code", "grade"])
+        assert result == ["product", "rock_code"]
+
+    def test_required_input_columns_unknown_inputs_returns_none(self):
+        from parq_blockmodel.schema.utils import required_input_columns
+
+        operations = {"score": {"kind": "function", "function": {"name": "model"}}}
+
+        assert required_input_columns(operations, ["score"], ["a", "b"]) is None
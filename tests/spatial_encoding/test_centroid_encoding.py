@@ -9,9 +9,10 @@ from parq_blockmodel.utils import (
     encode_frame_coordinates,
     encode_world_coordinates,
     get_id_encoding_params,
+    get_world_id_curve,
     get_world_id_encoding_params,
 )
-from parq_blockmodel.utils.spatial_encoding import MAX_XY_VALUE, MAX_Z_VALUE
+from parq_blockmodel.utils.spatial_encoding import MAX_XY_VALUE, MAX_Z_VALUE, _morton_decode_3d, _morton_encode_3d
 
 
 def test_encode_decode_float():
@@ -97,3 +98,58 @@ def test_get_id_encoding_params_alias():
     }
     assert get_id_encoding_params(payload) == get_world_id_encoding_params(payload)
 
+
+
+@pytest.mark.parametrize("axis_bits", [(24, 24, 16), (21, 21, 21), (10, 3, 7), (24, 24, 1), (5, 24, 16)])
+def test_morton_matches_bitwise_interleave(axis_bits):
+    rng = np.random.default_rng(42)
+    ix, iy, iz = (rng.integers(0, 1 << bits, size=500, dtype=np.uint64) for bits in axis_bits)
+
+    expected = np.zeros(500, dtype=np.uint64)
+    position = 0
+    for bit in range(max(axis_bits)):
+        for values, bits in zip((ix, iy, iz), axis_bits):
+            if bit < bits:
+                expected |= ((values >> np.uint64(bit)) & np.uint64(1)) << np.uint64(position)
+                position += 1
+
+    encoded = _morton_encode_3d(ix, iy, iz, axis_bits)
+    np.testing.assert_array_equal(encoded, expected)
+    for decoded, values in zip(_morton_decode_3d(encoded, axis_bits), (ix, iy, iz)):
+        np.testing.assert_array_equal(decoded, values)
+
+
+def test_hilbert_world_ids_round_trip_and_step_between_neighbours():
+    axis = np.arange(8) / 10.0
+    x, y, z = (v.ravel() for v in np.meshgrid(axis, axis, axis, indexing="ij"))
+
+    ids = encode_world_coordinates(x, y, z, bits_per_axis=(3, 3, 3), curve="hilbert")
+    decoded = decode_world_coordinates(ids, bits_per_axis=(3, 3, 3), curve="hilbert")
+
+    assert sorted(ids) == list(range(512))
+    for values, expected in zip(decoded, (x, y, z)):
+        np.testing.assert_allclose(values, expected)
+    order = np.argsort(ids)
+    steps = np.abs(np.diff(np.rint(np.column_stack([x, y, z])[order] * 10), axis=0)).sum(axis=1)
+    assert (steps == 1).all()
+
+
+def test_hilbert_supports_uneven_axis_bits():
+    rng = np.random.default_rng(7)
+    x = rng.integers(0, 1 << 24, size=200) / 10.0
+    y = rng.integers(0, 1 << 24, size=200) / 10.0
+    z = rng.integers(0, 1 << 16, size=200) / 10.0
+
+    ids = encode_world_coordinates(x, y, z, curve="hilbert")
+
+    assert not np.array_equal(ids, encode_world_coordinates(x, y, z))
+    for values, expected in zip(decode_world_coordinates(ids, curve="hilbert"), (x, y, z)):
+        np.testing.assert_allclose(values, expected)
+    with pytest.raises(ValueError, match="Unsupported curve"):
+        encode_world_coordinates(x, y, z, curve="peano")
+
+
+def test_world_id_curve_defaults_to_morton():
+    assert get_world_id_curve(None) == "morton"
+    assert get_world_id_curve({"encoding": {"type": "morton_zorder"}}) == "morton"
+    assert get_world_id_curve({"encoding": {"type": "hilbert"}}) == "hilbert"
@@ -0,0 +1,72 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from parq_blockmodel.utils import encode_world_coordinates, world_id_range_expression, world_id_ranges
+
+AXIS_BITS = (4, 3, 5)
+
+
+def _lattice() -> np.ndarray:
+    axes = [np.arange(1 << bits) for bits in AXIS_BITS]
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3) / 10.0
+
+
+def _covered(ids: np.ndarray, ranges: list[tuple[int, int]]) -> np.ndarray:
+    covered = np.zeros(ids.size, dtype=bool)
+    for lo, hi in ranges:
+        covered |= (ids >= lo) & (ids <= hi)
+    return covered
+
+
+@pytest.mark.parametrize("curve", ["morton", "hilbert"])
+def test_ranges_cover_exactly_the_box(curve):
+    points = _lattice()
+    ids = encode_world_coordinates(*points.T, bits_per_axis=AXIS_BITS, curve=curve)
+    box = [(0.3, 1.2), (0.1, 0.5), (0.7, 2.9)]
+    inside = np.all([(points[:, a] >= lo) & (points[:, a] <= hi) for a, (lo, hi) in enumerate(box)], axis=0)
+
+    exact = world_id_ranges(*box, bits_per_axis=AXIS_BITS, curve=curve, max_ranges=10_000)
+    coarse = world_id_ranges(*box, bits_per_axis=AXIS_BITS, curve=curve, max_ranges=3)
+
+    np.testing.assert_array_equal(_covered(ids, exact), inside)
+    assert len(coarse) <= 3
+    assert _covered(ids, coarse)[inside].all()
+    assert all(prev[1] + 1 < nxt[0] for prev, nxt in zip(exact, exact[1:]))
+
+
+def test_ranges_clip_to_encodable_space():
+    assert world_id_ranges(bits_per_axis=AXIS_BITS) == [(0, (1 << sum(AXIS_BITS)) - 1)]
+    assert world_id_ranges(x=(-5.0, -1.0), bits_per_axis=AXIS_BITS) == []
+    with pytest.raises(ValueError, match="max_ranges"):
+        world_id_ranges(max_ranges=0)
+
+
+def test_ranges_use_signed_ids_when_the_top_bit_is_set():
+    # With the default 24/24/16 layout, y >= 838860.8 sets the sign bit of world_id.
+    grid = np.stack(np.meshgrid(np.arange(10.0, 11.05, 0.1), np.arange(900000.0, 900001.05, 0.1),
+                                np.arange(0.0, 2.05, 0.1), indexing="ij"), axis=-1).reshape(-1, 3)
+    ids = encode_world_coordinates(*grid.T)
+    box = [(10.2, 10.6), (900000.3, 900000.8), (0.5, 1.5)]
+    inside = np.all([(grid[:, a] >= lo - 1e-9) & (grid[:, a] <= hi + 1e-9) for a, (lo, hi) in enumerate(box)], axis=0)
+
+    ranges = world_id_ranges(*box, max_ranges=10_000)
+    table = pa.table({"world_id": ids})
+
+    assert (ids < 0).all()
+    assert all(lo < 0 and hi < 0 for lo, hi in ranges)
+    np.testing.assert_array_equal(_covered(ids, ranges), inside)
+    assert table.filter(world_id_range_expression(ranges)).num_rows == int(inside.sum())
+    assert world_id_ranges() == [(-(1 << 63), (1 << 63) - 1)]
+
+
+def test_range_expression_filters_table():
+    points = _lattice()
+    ids = encode_world_coordinates(*points.T, bits_per_axis=AXIS_BITS)
+    table = pa.table({"world_id": ids, "x": points[:, 0]})
+    ranges = world_id_ranges(x=(0.2, 0.4), bits_per_axis=AXIS_BITS, max_ranges=10_000)
+
+    filtered = table.filter(world_id_range_expression(ranges))
+
+    assert filtered.num_rows == int(((points[:, 0] >= 0.2) & (points[:, 0] <= 0.4)).sum())
+    assert table.filter(world_id_range_expression([])).num_rows == 0